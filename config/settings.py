@@ -16,17 +16,20 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'ncbw.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'ncbw.routers.ReplicaPinMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
+    'ncbw.middleware.CurrentUserMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [{
-    'BACKEND': 'django.template.backends.django.DjangoTemplates',
+    'BACKEND': 'ncbw.instrumentation.TimedDjangoTemplates',
     'DIRS': [],
     'APP_DIRS': True,
     'OPTIONS': {
@@ -37,19 +40,131 @@ TEMPLATES = [{
     },
 }]
 
+# ncbw.backends.postgresql is Django's PostgreSQL backend with a
+# per-process connection pool: requests still "close" their connection
+# (CONN_MAX_AGE = 0) but it goes back to the pool instead of being torn down.
+# POOL keys and defaults are in ncbw/pool.py; drop POOL to turn pooling off.
+# Keep MAX_SIZE x worker processes under PostgreSQL's max_connections.
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'ncbw.backends.postgresql',
         'NAME': 'ncbw_training',
         'USER': 'ncbw_user',
         'PASSWORD': 'ncbw_password123',
         'HOST': 'localhost',
         'PORT': '5432',
-    }
+        'POOL': {'MIN_SIZE': 2, 'MAX_SIZE': 20, 'TIMEOUT': 5},
+    },
+    # Streaming replica for reporting/dashboard reads; point HOST at the
+    # standby and set NCBW_REPLICA_DATABASE = 'replica'. Tests mirror it
+    # onto the default database.
+    'replica': {
+        'ENGINE': 'ncbw.backends.postgresql',
+        'NAME': 'ncbw_training',
+        'USER': 'ncbw_user',
+        'PASSWORD': 'ncbw_password123',
+        'HOST': 'localhost',
+        'PORT': '5432',
+        'POOL': {'MIN_SIZE': 2, 'MAX_SIZE': 20, 'TIMEOUT': 5},
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+DATABASE_ROUTERS = ['ncbw.routers.ReplicaRouter']
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Sessions: files are shared by every worker process on this host. With
+    # several hosts point this at memcached/redis instead. Expired files are
+    # swept (and MAX_ENTRIES enforced) by expire_sessions, not on each write.
+    # Test runs use a temporary directory.
+    'sessions': {
+        'BACKEND': 'ncbw.sessions.SessionFileCache',
+        'LOCATION': BASE_DIR / '.cache' / 'sessions',
+        'OPTIONS': {'MAX_ENTRIES': 50000},
+    },
 }
 
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Seconds a resolved User stays in the per-process cache (0 = off). Other
+# worker processes only see select_track/delete changes once it expires.
+NCBW_USER_CACHE_TTL = 0
+
+# Per-request SQL/template timing, Server-Timing headers and the
+# /admin-dashboard/metrics/ percentiles. Off unless enabled here.
+NCBW_INSTRUMENTATION = False
+NCBW_METRICS_WINDOW  = 1000  # samples kept per view
+
+# Every click is logged to ProgressEvent. With NCBW_DEFER_PROGRESS on, clicks
+# are only logged and the Progress snapshot is brought up to date by
+# `manage.py compact_progress` (run it from cron) or by the trainee's own
+# next page view.
+NCBW_DEFER_PROGRESS = False
+
+# Write-behind for single course/quiz clicks: queued per process and
+# written in one transaction every NCBW_WRITE_BEHIND_INTERVAL seconds or once
+# NCBW_WRITE_BEHIND_BATCH events are waiting (interval 0 = no background
+# thread, flush only when the batch fills). A trainee's own pages flush their
+# events queued in the same process first (other processes catch up within an
+# interval; see README); the queue is flushed at exit but lost if the process
+# is killed.
+NCBW_WRITE_BEHIND          = False
+NCBW_WRITE_BEHIND_INTERVAL = 0.5
+NCBW_WRITE_BEHIND_BATCH    = 500
+
+# Course content. Edits are picked up without a restart: the file is
+# re-checked at most every NCBW_CATALOG_RELOAD_INTERVAL seconds (0 = never).
+# Compiled snapshots keyed by content hash are kept in the snapshot dir
+# (None = always compile on start). YAML files need PyYAML.
+NCBW_CATALOG_PATH            = BASE_DIR / 'ncbw' / 'catalog.json'
+NCBW_CATALOG_SNAPSHOT_DIR    = BASE_DIR / '.cache' / 'catalog'
+NCBW_CATALOG_RELOAD_INTERVAL = 2
+
+# A quiz attempt's signed token can be submitted once, within this many
+# seconds of starting it. Used tokens are remembered in the default cache,
+# which several worker processes need to share.
+NCBW_QUIZ_ATTEMPT_TTL = 7200
+
+# Live admin feed (/admin-dashboard/live/, Server-Sent Events). Progress
+# writes are fanned out in-process, so serve it from one ASGI process. A
+# watcher more than NCBW_LIVE_QUEUE_SIZE events behind is told to reload;
+# idle streams get a comment every NCBW_LIVE_HEARTBEAT seconds.
+NCBW_LIVE_QUEUE_SIZE = 100
+NCBW_LIVE_HEARTBEAT  = 15
+
+# Views marked @read_replica read from this alias (None = primary only).
+# After a session writes, its reads stay on the primary for
+# NCBW_REPLICA_PIN_SECONDS (the pin lives in the cache, so several worker
+# processes need a shared cache backend). A replica that fails to connect is
+# skipped for NCBW_REPLICA_RETRY_SECONDS.
+NCBW_REPLICA_DATABASE      = None
+NCBW_REPLICA_PIN_SECONDS   = 5
+NCBW_REPLICA_RETRY_SECONDS = 30
+
+# Passwords: salted PBKDF2-SHA256 at NCBW_PASSWORD_ITERATIONS rounds (Django's
+# default cost). Changing it re-hashes each account at its next login, as does
+# a legacy unsalted SHA-256 hash. `manage.py ncbw_bench --views login
+# --password-iterations N` measures logins/sec at a given cost.
+PASSWORD_HASHERS         = ['ncbw.passwords.PBKDF2PasswordHasher']
+NCBW_PASSWORD_ITERATIONS = 720000
+
+# Login throttles, as (attempts, seconds): each failed login takes a token
+# from its client IP's and its email's bucket, which refill evenly over the
+# period; an empty bucket gets a 429 without touching the database. Held per
+# process. Behind a proxy set NCBW_CLIENT_IP_HEADER (e.g. 'HTTP_X_REAL_IP')
+# to a header the proxy sets, or every client shares the proxy's bucket.
+NCBW_LOGIN_THROTTLE_IP      = (20, 60)
+NCBW_LOGIN_THROTTLE_ACCOUNT = (5, 300)
+NCBW_CLIENT_IP_HEADER       = None
+
+# Sessions are read from the 'sessions' cache and written through to
+# django_session, which stays the source of truth; unchanged sessions aren't
+# re-saved. Clear expired rows with `manage.py expire_sessions` from cron.
+SESSION_ENGINE      = 'ncbw.sessions'
+SESSION_CACHE_ALIAS = 'sessions'
 SESSION_COOKIE_AGE = 86400  # 1 day
 
+TEST_RUNNER = 'ncbw.tests.runner.TestRunner'
+
 STATIC_URL = '/static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -0,0 +1,63 @@
+from collections import Counter
+from django.db import connection, models, transaction
+from .middleware import invalidate_users
+from .models import ProgressSummary, User
+from .rollups import rebuild_rollups
+
+
+# ── bulk removal ─────────────────────────────────────────
+# QuerySet.delete() has the collector load every cascaded row into memory
+# first. Here each chunk of users goes in one transaction: a plain
+# DELETE ... WHERE user_id IN (...) per table that references ncbw_user,
+# then the users themselves.
+
+def _cascaded_tables():
+    tables = []
+    # one level only: nothing references these tables in turn
+    for rel in User._meta.related_objects:
+        if rel.on_delete is models.CASCADE:
+            tables.append((rel.related_model._meta.db_table, rel.field.column))
+    return sorted(tables)
+
+def _delete_chunk(cursor, ids, removed):
+    placeholders = ', '.join(['%s'] * len(ids))
+    db_ids       = [User._meta.pk.get_db_prep_value(i, connection) for i in ids]
+    for table, column in _cascaded_tables():
+        cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({placeholders})', db_ids)
+        removed[table] += cursor.rowcount
+    cursor.execute(f'DELETE FROM {User._meta.db_table} WHERE id IN ({placeholders})', db_ids)
+    removed[User._meta.db_table] += cursor.rowcount
+
+def _tracks_of(ids):
+    # every track the users counted towards: enrolled on it or with progress there
+    enrolled = User.objects.filter(id__in=ids, selected_track__isnull=False).values_list('selected_track', flat=True)
+    studied  = ProgressSummary.objects.filter(user_id__in=ids).values_list('track_id', flat=True)
+    return set(enrolled.distinct()) | set(studied.distinct())
+
+def purge_users(users, chunk_size=500):
+    # users: a User queryset; returns rows removed per table. The rollups of
+    # the tracks they were on are rebuilt afterwards: not every trainee was
+    # counted in them (accounts given a track directly, bulk loads), so
+    # subtracting the removed users would only guess.
+    removed = Counter()
+    tracks  = set()
+    while True:
+        ids = list(users.order_by('id').values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            break
+        tracks |= _tracks_of(ids)
+        with transaction.atomic(), connection.cursor() as cursor:
+            _delete_chunk(cursor, ids, removed)
+        invalidate_users(ids)
+    if tracks:
+        rebuild_rollups(tracks=sorted(tracks))
+    return removed
+
+def deactivate_users(users, chunk_size=500):
+    deactivated = 0
+    while True:
+        ids = list(users.filter(is_active=True).order_by('id').values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            return deactivated
+        deactivated += User.objects.filter(id__in=ids).update(is_active=False)
+        invalidate_users(ids)
@@ -0,0 +1,78 @@
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base, creation
+from ncbw.pool import ConnectionPool, PoolTimeout, close_pools, get_pool
+
+
+# ── pooled PostgreSQL backend ────────────────────────────
+# The stock backend plus a per-process pool: connect() borrows a connection
+# and close() hands it back, so with CONN_MAX_AGE = 0 each request still
+# "closes" its connection but no longer pays for a new TCP/auth handshake.
+# Configure with a POOL dict on the DATABASES entry (see ncbw.pool for the
+# keys); without one this behaves exactly like the stock backend.
+
+def _check(conn):
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT 1')
+    if not conn.autocommit:
+        conn.rollback()
+    return True
+
+def _reset(conn):
+    if conn.closed:
+        return False
+    status = conn.info.transaction_status
+    if status == base.Database.extensions.TRANSACTION_STATUS_UNKNOWN:
+        return False
+    if status != base.Database.extensions.TRANSACTION_STATUS_IDLE:
+        conn.rollback()
+    # like pgbouncer's server_reset_query: drop held cursors, temp tables and
+    # session settings left by the last borrower
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute('DISCARD ALL')
+    return True
+
+
+class DatabaseCreation(creation.DatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # idle pooled connections would keep the test database in use
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool = None
+
+    def get_pool(self, conn_params):
+        config = self.settings_dict.get('POOL')
+        if not config or self.alias == NO_DB_ALIAS:
+            return None
+
+        def make_pool():
+            return ConnectionPool(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params),
+                                  _check, _reset, config)
+        # keyed by database name too, so the test database gets its own pool
+        return get_pool(f"{self.alias}:{conn_params.get('dbname') or conn_params.get('database')}", make_pool)
+
+    def get_new_connection(self, conn_params):
+        self.pool = self.get_pool(conn_params)
+        if self.pool is None:
+            return super().get_new_connection(conn_params)
+        try:
+            conn = self.pool.getconn()
+        except PoolTimeout as e:
+            raise self.Database.OperationalError(str(e)) from e
+        # what the stock get_new_connection would have set on this wrapper
+        level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = base.IsolationLevel(level) if level is not None else base.IsolationLevel.READ_COMMITTED
+        return conn
+
+    def _close(self):
+        if self.pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            self.pool.putconn(self.connection)
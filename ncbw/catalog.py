@@ -0,0 +1,354 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from django.conf import settings
+
+try:
+    import yaml
+except ImportError:  # YAML catalogs are optional
+    yaml = None
+
+
+logger = logging.getLogger(__name__)
+
+
+DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(hours?|hrs?|h|minutes?|mins?|m)\b', re.IGNORECASE)
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def parse_duration(text):
+    # "20 mins" -> 20, "1 hr 30 mins" -> 90, "1.5 hours" -> 90
+    matches = DURATION_RE.findall(text or '')
+    if not matches:
+        raise CatalogError(f'Unrecognised duration: {text!r}')
+    minutes = 0.0
+    for amount, unit in matches:
+        minutes += float(amount) * (60 if unit.lower().startswith('h') else 1)
+    return int(round(minutes))
+
+
+# ── compiled entries ─────────────────────────────────────
+
+@dataclass(frozen=True)
+class Course:
+    track_id:     str
+    module_index: int
+    index:        int
+    title:        str
+    platform:     str
+    duration:     str
+    minutes:      int
+    link:         str
+
+
+@dataclass(frozen=True)
+class Question:
+    prompt:  str
+    choices: tuple
+
+
+@dataclass(frozen=True)
+class Quiz:
+    title:      str
+    duration:   str
+    minutes:    int
+    questions:  tuple
+    sample:     int     # questions drawn per attempt
+    answer_key: bytes   # answer_key[i] is the index of question i's right choice
+
+
+@dataclass(frozen=True)
+class Module:
+    track_id:     str
+    index:        int
+    title:        str
+    description:  str
+    courses:      tuple
+    quiz:         Quiz
+    course_count: int
+    minutes:      int  # courses only; the quiz has its own duration
+
+
+@dataclass(frozen=True)
+class Track:
+    id:           str
+    name:         str
+    description:  str
+    modules:      tuple
+    course_count: int
+    minutes:      int
+
+
+class Catalog:
+    def __init__(self, tracks, version=''):
+        self.version     = version
+        self.track_order = tuple(t.id for t in tracks)
+        self.tracks      = MappingProxyType({t.id: t for t in tracks})
+        self._modules    = MappingProxyType({
+            (t.id, m.index): m for t in tracks for m in t.modules
+        })
+        self._courses    = MappingProxyType({
+            (t.id, m.index, c.index): c for t in tracks for m in t.modules for c in m.courses
+        })
+
+    def __contains__(self, track_id):
+        return track_id in self.tracks
+
+    def __iter__(self):
+        return (self.tracks[track_id] for track_id in self.track_order)
+
+    def track(self, track_id):
+        return self.tracks.get(track_id)
+
+    def module(self, track_id, module_index):
+        return self._modules.get((track_id, module_index))
+
+    def course(self, track_id, module_index, course_index):
+        return self._courses.get((track_id, module_index, course_index))
+
+    def course_count(self, track_id, module_index=None):
+        entry = self.track(track_id) if module_index is None else self.module(track_id, module_index)
+        return entry.course_count if entry else 0
+
+    def choices(self):
+        return [(t.id, t.name) for t in self]
+
+    def __reduce__(self):
+        # the lookup maps are cheap to rebuild and MappingProxyType can't be pickled
+        return Catalog, (tuple(self), self.version)
+
+
+# ── compilation ──────────────────────────────────────────
+
+def _require(entry, key, where):
+    value = entry.get(key)
+    if not isinstance(value, str) or not value.strip():
+        raise CatalogError(f'{where}: missing {key!r}')
+    return value
+
+DEFAULT_QUIZ_SAMPLE = 3
+
+def _compile_questions(entries, where):
+    questions, key = [], bytearray()
+    for qi, entry in enumerate(entries):
+        at      = f'{where}[{qi}]'
+        choices = entry.get('choices')
+        if not isinstance(choices, list) or not 2 <= len(choices) <= 255:
+            raise CatalogError(f'{at}: needs a list of 2 to 255 choices')
+        if not all(isinstance(c, str) and c.strip() for c in choices):
+            raise CatalogError(f'{at}: choices must be non-empty strings')
+        answer = entry.get('answer')
+        if not isinstance(answer, int) or isinstance(answer, bool) or not 0 <= answer < len(choices):
+            raise CatalogError(f'{at}: answer must be the index of one of its choices')
+        questions.append(Question(prompt=_require(entry, 'prompt', at), choices=tuple(choices)))
+        key.append(answer)
+    return tuple(questions), bytes(key)
+
+def _compile_quiz(quiz, where, shared_bank):
+    # a module's own questions, or else the catalog-wide quiz_bank
+    if quiz.get('questions'):
+        questions, key = _compile_questions(quiz['questions'], f'{where}.quiz.questions')
+    else:
+        questions, key = shared_bank
+    if not questions:
+        raise CatalogError(f'{where}.quiz: no questions and no quiz_bank to draw from')
+    sample = quiz.get('sample', min(DEFAULT_QUIZ_SAMPLE, len(questions)))
+    if not isinstance(sample, int) or not 1 <= sample <= len(questions):
+        raise CatalogError(f'{where}.quiz: sample must be between 1 and {len(questions)}')
+    return Quiz(
+        title=_require(quiz, 'title', f'{where}.quiz'),
+        duration=quiz.get('duration', ''),
+        minutes=parse_duration(quiz.get('duration')),
+        questions=questions,
+        sample=sample,
+        answer_key=key,
+    )
+
+def compile_catalog(data, order, version='', quiz_bank=()):
+    if sorted(order) != sorted(data) or len(set(order)) != len(order):
+        raise CatalogError('track_order must list every track exactly once')
+    shared_bank = _compile_questions(quiz_bank or (), 'quiz_bank')
+
+    tracks = []
+    for track_id in order:
+        track   = data[track_id]
+        modules = []
+        for mi, module in enumerate(track.get('attributes') or []):
+            where   = f'{track_id}[{mi}]'
+            courses = tuple(
+                Course(
+                    track_id=track_id, module_index=mi, index=ci,
+                    title=_require(course, 'title', f'{where}.courses[{ci}]'),
+                    platform=course.get('platform', ''),
+                    duration=course.get('duration', ''),
+                    minutes=parse_duration(course.get('duration')),
+                    link=course.get('link', ''),
+                )
+                for ci, course in enumerate(module.get('courses') or [])
+            )
+            if not courses:
+                raise CatalogError(f'{where}: module has no courses')
+            modules.append(Module(
+                track_id=track_id, index=mi,
+                title=_require(module, 'title', where),
+                description=module.get('description', ''),
+                courses=courses,
+                quiz=_compile_quiz(module.get('quiz') or {}, where, shared_bank),
+                course_count=len(courses),
+                minutes=sum(c.minutes for c in courses),
+            ))
+        if not modules:
+            raise CatalogError(f'{track_id}: track has no modules')
+        tracks.append(Track(
+            id=track_id,
+            name=_require(track, 'name', track_id),
+            description=track.get('description', ''),
+            modules=tuple(modules),
+            course_count=sum(m.course_count for m in modules),
+            minutes=sum(m.minutes for m in modules),
+        ))
+    return Catalog(tracks, version)
+
+
+# ── loading ──────────────────────────────────────────────
+# The catalog file is parsed and validated once per content hash; the
+# compiled result is pickled to the snapshot directory so later process
+# starts only hash the file and unpickle.
+
+SNAPSHOT_FORMAT = 2  # bump when the compiled dataclasses change shape
+
+def _parse(path, raw):
+    if path.suffix in ('.yaml', '.yml'):
+        if yaml is None:
+            raise CatalogError(f'{path}: install PyYAML to load YAML catalogs')
+        data = yaml.safe_load(raw)
+    else:
+        data = json.loads(raw)
+    if not isinstance(data, dict) or not isinstance(data.get('tracks'), dict):
+        raise CatalogError(f'{path}: expected an object with "track_order" and "tracks"')
+    return data
+
+def _read_snapshot(snapshot):
+    try:
+        with open(snapshot, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning('Ignoring unreadable catalog snapshot %s', snapshot, exc_info=True)
+        return None
+
+def _write_snapshot(snapshot, catalog):
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=snapshot.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot)
+    except OSError:
+        logger.warning('Could not write catalog snapshot %s', snapshot, exc_info=True)
+
+def load_catalog(path, snapshot_dir=None):
+    path    = Path(path)
+    raw     = path.read_bytes()
+    version = hashlib.sha256(raw).hexdigest()[:16]
+    snapshot = Path(snapshot_dir) / f'catalog-{SNAPSHOT_FORMAT}-{version}.pickle' if snapshot_dir else None
+
+    catalog = _read_snapshot(snapshot) if snapshot else None
+    if isinstance(catalog, Catalog) and catalog.version == version:
+        return catalog
+    data    = _parse(path, raw)
+    catalog = compile_catalog(data['tracks'], data.get('track_order') or [], version, data.get('quiz_bank'))
+    if snapshot:
+        _write_snapshot(snapshot, catalog)
+    return catalog
+
+
+def changed_tracks(old, new):
+    # ids of tracks whose set of courses differs between two catalogs
+    # (added, removed, or a module gained or lost courses)
+    def layout(catalog):
+        return {t.id: tuple(m.course_count for m in t.modules) for t in catalog}
+    before, after = layout(old), layout(new)
+    return sorted(t for t in before.keys() | after.keys() if before.get(t) != after.get(t))
+
+
+class ReloadingCatalog:
+    # Stands in for a Catalog and swaps in a fresh one when the file
+    # changes, checking at most once per `interval` seconds (0 = never).
+    # A broken edit is logged and the last good catalog keeps serving.
+    # Listeners added with on_change(fn) are called as fn(old, new) after
+    # a new version is swapped in.
+
+    def __init__(self, path, snapshot_dir=None, interval=0):
+        self.path         = Path(path)
+        self.snapshot_dir = snapshot_dir
+        self.interval     = interval
+        self._lock        = threading.Lock()
+        self._stamp       = self._file_stamp()
+        self._current     = load_catalog(self.path, snapshot_dir)
+        self._checked     = time.monotonic()
+        self._listeners   = []
+
+    def on_change(self, listener):
+        self._listeners.append(listener)
+
+    def _file_stamp(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size
+
+    @property
+    def current(self):
+        if self.interval and time.monotonic() - self._checked >= self.interval:
+            self.reload()
+        return self._current
+
+    def reload(self, force=False):
+        with self._lock:
+            self._checked = time.monotonic()
+            previous      = self._current
+            try:
+                stamp = self._file_stamp()
+                if stamp != self._stamp or force:
+                    self._current = load_catalog(self.path, self.snapshot_dir)
+                    self._stamp   = stamp
+            except (OSError, ValueError):   # CatalogError and JSON errors are ValueErrors
+                logger.exception('Keeping catalog %s; reloading %s failed', self._current.version, self.path)
+            current = self._current
+        if current.version != previous.version:
+            for listener in self._listeners:
+                try:
+                    listener(previous, current)
+                except Exception:
+                    logger.exception('Catalog change listener %r failed', listener)
+        return current
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.current, name)
+
+    def __contains__(self, track_id):
+        return track_id in self.current
+
+    def __iter__(self):
+        return iter(self.current)
+
+
+CATALOG = ReloadingCatalog(
+    getattr(settings, 'NCBW_CATALOG_PATH', Path(__file__).with_name('catalog.json')),
+    snapshot_dir=getattr(settings, 'NCBW_CATALOG_SNAPSHOT_DIR', None),
+    interval=getattr(settings, 'NCBW_CATALOG_RELOAD_INTERVAL', 0),
+)
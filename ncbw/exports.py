@@ -0,0 +1,79 @@
+import csv
+import json
+from django.db.models import Count, IntegerField, Max, OuterRef, Q, Subquery, Sum
+from .catalog import CATALOG
+from .models import Progress, ProgressSummary
+from .progress import overall_percent
+
+
+EXPORT_FORMATS = {
+    'csv':   'text/csv',
+    'jsonl': 'application/x-ndjson',
+}
+
+EXPORT_FIELDS = [
+    'email', 'first_name', 'last_name', 'selected_track',
+    'track_id', 'track_overall', 'module_index', 'module_title',
+    'courses_completed', 'courses_total',
+    'quiz_score', 'quiz_passed', 'quiz_attempts',
+]
+
+
+class _Echo:
+    # csv.writer wants a file; hand each formatted line straight back instead
+    def write(self, value):
+        return value
+
+
+def progress_rows(chunk_size=2000, using=None):
+    # the stored overall can predate a catalog change; recomputed per row below
+    track_completed = ProgressSummary.objects.filter(
+        user_id=OuterRef('user_id'), track_id=OuterRef('track_id'),
+    ).values('completed_courses')[:1]
+
+    rows = (
+        Progress.objects.db_manager(using).filter(user__role='trainee')
+        .values(
+            'user_id', 'user__email', 'user__first_name', 'user__last_name', 'user__selected_track',
+            'track_id', 'module_index',
+        )
+        .annotate(
+            courses_completed=Count('id', filter=Q(course_index__isnull=False, completed=True)),
+            quiz_score=Max('quiz_score'),
+            quiz_passes=Count('id', filter=Q(course_index__isnull=True, quiz_passed=True)),
+            quiz_attempts=Sum('quiz_attempts'),
+            track_completed=Subquery(track_completed, output_field=IntegerField()),
+        )
+        .order_by('user_id', 'track_id', 'module_index')
+    )
+    # .iterator() streams through a server-side cursor on PostgreSQL, so
+    # memory stays flat however many Progress rows there are
+    for row in rows.iterator(chunk_size=chunk_size):
+        module = CATALOG.module(row['track_id'], row['module_index'])
+        yield {
+            'email':             row['user__email'],
+            'first_name':        row['user__first_name'],
+            'last_name':         row['user__last_name'],
+            'selected_track':    row['user__selected_track'],
+            'track_id':          row['track_id'],
+            'track_overall':     overall_percent(row['track_id'], row['track_completed'] or 0),
+            'module_index':      row['module_index'],
+            'module_title':      module.title if module else '',
+            'courses_completed': row['courses_completed'],
+            'courses_total':     module.course_count if module else 0,
+            'quiz_score':        row['quiz_score'],
+            'quiz_passed':       row['quiz_passes'] > 0,
+            'quiz_attempts':     row['quiz_attempts'] or 0,
+        }
+
+def stream_export(fmt, chunk_size=2000, using=None):
+    # using: the view's read alias, since the body is streamed after it returns
+    rows = progress_rows(chunk_size=chunk_size, using=using)
+    if fmt == 'jsonl':
+        for row in rows:
+            yield json.dumps(row) + '\n'
+        return
+    writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
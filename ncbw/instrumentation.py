@@ -0,0 +1,174 @@
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template
+
+
+PERCENTILES = (50, 95, 99)
+
+# Every RequestStats currently collecting. A context variable rather than a
+# per-connection wrapper so it follows async views into the threads that
+# sync_to_async runs their queries on.
+_active_stats = ContextVar('ncbw_request_stats', default=())
+
+
+def percentile(sorted_values, pct):
+    # nearest-rank, so every reported value was actually observed
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RequestStats:
+    __slots__ = ('queries', 'sql_ms', 'template_ms')
+
+    def __init__(self):
+        self.queries     = 0
+        self.sql_ms      = 0.0
+        self.template_ms = 0.0
+
+
+# ── rolling per-view metrics ─────────────────────────────
+
+class MetricsRegistry:
+    FIELDS = ('view_ms', 'sql_ms', 'template_ms', 'queries')
+
+    def __init__(self, window):
+        self._lock    = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, name, **sample):
+        with self._lock:
+            self._samples[name].append(tuple(sample[f] for f in self.FIELDS))
+
+    def snapshot(self):
+        with self._lock:
+            samples = {name: list(rows) for name, rows in self._samples.items()}
+        report = {}
+        for name, rows in sorted(samples.items()):
+            entry = {'count': len(rows)}
+            for i, field in enumerate(self.FIELDS):
+                values = sorted(row[i] for row in rows)
+                entry[field] = {f'p{p}': percentile(values, p) for p in PERCENTILES}
+            report[name] = entry
+        return report
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+METRICS = MetricsRegistry(getattr(settings, 'NCBW_METRICS_WINDOW', 1000))
+
+
+# ── collection ───────────────────────────────────────────
+
+@contextmanager
+def collecting(stats):
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+class QueryTimer:
+    def __call__(self, execute, sql, params, many, context):
+        active = _active_stats.get()
+        if not active:
+            return execute(sql, params, many, context)
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            for stats in active:
+                stats.queries += 1
+                stats.sql_ms  += elapsed
+
+def _install_query_timer(connection, **kwargs):
+    if not any(isinstance(w, QueryTimer) for w in connection.execute_wrappers):
+        connection.execute_wrappers.append(QueryTimer())
+
+def enable_query_timing():
+    # connections are per thread, so cover the ones opened from now on as
+    # well as any this thread already has
+    connection_created.connect(_install_query_timer, dispatch_uid='ncbw_query_timer')
+    for conn in connections.all(initialized_only=True):
+        _install_query_timer(conn)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        active = _active_stats.get()
+        if not active:
+            return super().render(context, request)
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            for stats in active:
+                stats.template_ms += elapsed
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    # Drop-in for the Django backend; only measures while a request is
+    # being instrumented, otherwise it is the stock engine.
+
+    def from_string(self, template_code):
+        return TimedTemplate(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return TimedTemplate(super().get_template(template_name).template, self)
+
+
+class InstrumentationMiddleware:
+    sync_capable  = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'NCBW_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        enable_query_timing()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        with collecting(RequestStats()) as stats:
+            response = self.get_response(request)
+        return self.finish(request, response, stats, start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        with collecting(RequestStats()) as stats:
+            response = await self.get_response(request)
+        return self.finish(request, response, stats, start)
+
+    def finish(self, request, response, stats, start):
+        view_ms = (time.perf_counter() - start) * 1000
+        response['Server-Timing'] = ', '.join([
+            f'sql;dur={stats.sql_ms:.1f};desc="{stats.queries} queries"',
+            f'tpl;dur={stats.template_ms:.1f}',
+            f'view;dur={view_ms:.1f}',
+        ])
+        match = request.resolver_match
+        METRICS.record(
+            match.view_name if match else 'unresolved',
+            view_ms=round(view_ms, 2), sql_ms=round(stats.sql_ms, 2),
+            template_ms=round(stats.template_ms, 2), queries=stats.queries,
+        )
+        return response
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from django.conf import settings
+from .progress import PASS_MARK
+
+
+logger = logging.getLogger(__name__)
+
+
+# ── live feed hub ────────────────────────────────────────
+# Progress writes publish a small delta here; every admin watching the live
+# feed holds a Subscription. An event is encoded as an SSE frame once, on
+# publish, and the same string is handed to every subscriber's queue, so N
+# watchers cost N queue appends rather than N report queries. Publishers can
+# be on any thread (sync_to_async, the write-behind flusher); frames reach a
+# subscriber through its own event loop with call_soon_threadsafe, or, for a
+# stream served under WSGI, straight into a thread-safe queue.
+#
+# The hub lives in one process. Admins see the writes made by the process
+# serving their stream, so run the live feed with a single ASGI worker
+# process (any number of threads/connections) or put a broker in front.
+
+class Subscription:
+    def __init__(self, hub, maxsize):
+        self.hub    = hub
+        self.loop   = asyncio.get_running_loop()
+        self.queue  = asyncio.Queue(maxsize)
+        self.closed = False
+
+    def push(self, frame):
+        try:
+            self.loop.call_soon_threadsafe(self._put, frame)
+        except RuntimeError:    # the loop has gone away with its request
+            self.close()
+
+    def _put(self, frame):
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # a watcher this far behind is better off reloading the report
+            self.hub.count('dropped')
+            self.close()
+            self.queue.get_nowait()
+            self.queue.put_nowait(self.hub.frame('reset', {'reason': 'overflow'}))
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.closed = True
+        self.hub.unsubscribe(self)
+
+
+class ThreadSubscription:
+    # For a stream read by a WSGI worker thread, which has no event loop of
+    # its own (the one an async view runs in under WSGI is gone by the time
+    # the response body is read).
+    def __init__(self, hub, maxsize):
+        self.hub    = hub
+        self.queue  = queue.Queue(maxsize)
+        self.closed = False
+        self._lock  = threading.Lock()
+
+    def push(self, frame):
+        with self._lock:
+            if self.closed:
+                return
+            try:
+                self.queue.put_nowait(frame)
+            except queue.Full:
+                self.hub.count('dropped')
+                self.close()
+                self.queue.get_nowait()
+                self.queue.put_nowait(self.hub.frame('reset', {'reason': 'overflow'}))
+
+    def get(self, timeout=None):
+        return self.queue.get(timeout=timeout)
+
+    def close(self):
+        self.closed = True
+        self.hub.unsubscribe(self)
+
+
+class Hub:
+    def __init__(self, backlog=200):
+        self.epoch        = f'{int(time.time()):x}'   # event ids from an earlier process don't replay
+        self._lock        = threading.Lock()
+        self._subscribers = set()
+        self._recent      = deque(maxlen=backlog)     # [(seq, frame)] for Last-Event-ID catch-up
+        self._seq         = 0
+        self.counts       = {'published': 0, 'delivered': 0, 'dropped': 0}
+
+    def frame(self, kind, data, event_id=None):
+        head = f'id: {event_id}\n' if event_id else ''
+        return f'{head}event: {kind}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
+
+    def publish(self, kind, data):
+        with self._lock:
+            self._seq += 1
+            frame = self.frame(kind, data, f'{self.epoch}-{self._seq}')
+            self._recent.append((self._seq, frame))
+            subscribers = list(self._subscribers)
+            self.counts['published'] += 1
+            self.counts['delivered'] += len(subscribers)
+        for subscription in subscribers:
+            subscription.push(frame)
+
+    def subscribe(self, last_event_id=None, maxsize=None, threaded=False):
+        # call from the event loop that will read the subscription, or pass
+        # threaded=True for one read by a plain thread
+        cls          = ThreadSubscription if threaded else Subscription
+        subscription = cls(self, maxsize or live_queue_size())
+        with self._lock:
+            missed = self._missed(last_event_id)
+            self._subscribers.add(subscription)
+        for frame in missed[-subscription.queue.maxsize:]:
+            subscription.queue.put_nowait(frame)
+        return subscription
+
+    def _missed(self, last_event_id):
+        # called with the lock held
+        epoch, _, seq = (last_event_id or '').partition('-')
+        if epoch != self.epoch or not seq.isdigit():
+            return []
+        seq = int(seq)
+        if self._recent and seq < self._recent[0][0] - 1:
+            return [self.frame('reset', {'reason': 'missed'})]
+        return [frame for n, frame in self._recent if n > seq]
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def count(self, key):
+        with self._lock:
+            self.counts[key] += 1
+
+    def stats(self):
+        with self._lock:
+            return {**self.counts, 'subscribers': len(self._subscribers)}
+
+
+HUB = Hub()
+
+def live_queue_size():
+    return getattr(settings, 'NCBW_LIVE_QUEUE_SIZE', 100)
+
+def live_heartbeat():
+    return getattr(settings, 'NCBW_LIVE_HEARTBEAT', 15)
+
+
+# ── publishing ───────────────────────────────────────────
+# One event per accepted write, sent once the write has returned (committed,
+# or queued under write-behind). Names come from the session, so publishing
+# costs no query.
+
+def publish_progress(user_id, user_name, track_id, completions=(), quiz_scores=(), overall=None):
+    try:
+        HUB.publish('progress', {
+            'user_id':     str(user_id),
+            'user':        user_name,
+            'track_id':    track_id,
+            'completions': [[mi, ci] for mi, ci in completions],
+            'quizzes':     [[mi, score, score >= PASS_MARK] for mi, score in quiz_scores],
+            'overall':     overall,
+        })
+    except Exception:
+        # the feed is best effort; never fail the trainee's write over it
+        logger.exception('Publishing to the live feed failed')
+
+
+# ── SSE stream ───────────────────────────────────────────
+# event_stream for ASGI; sync_event_stream, over a ThreadSubscription, for
+# WSGI, where a StreamingHttpResponse given an async iterator collects all of
+# it before sending anything. Either way the heartbeat is how a dead
+# connection gets noticed: writing it fails and the stream is closed.
+
+async def event_stream(subscription, heartbeat=None):
+    heartbeat = heartbeat or live_heartbeat()
+    try:
+        yield 'retry: 3000\n\n'
+        while not subscription.closed or not subscription.queue.empty():
+            try:
+                yield await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ': keep-alive\n\n'
+    finally:
+        subscription.close()
+
+def sync_event_stream(subscription, heartbeat=None):
+    heartbeat = heartbeat or live_heartbeat()
+    try:
+        yield 'retry: 3000\n\n'
+        while not subscription.closed or not subscription.queue.empty():
+            try:
+                yield subscription.get(heartbeat)
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+    finally:
+        subscription.close()
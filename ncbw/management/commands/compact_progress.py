@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from ncbw.progress import compact_events, rebuild_from_events
+
+
+class Command(BaseCommand):
+    help = 'Fold pending progress events into the Progress snapshot, or rebuild it from the whole log'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--rebuild', action='store_true',
+                            help='Discard Progress, summaries and rollups and replay every event')
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            events = rebuild_from_events(chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt progress from {events} events'))
+        else:
+            events = compact_events(chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'✅ Compacted {events} events'))
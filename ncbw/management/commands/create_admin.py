@@ -1,6 +1,6 @@
-import hashlib
 from django.core.management.base import BaseCommand
 from ncbw.models import User
+from ncbw.passwords import hash_password
 
 
 class Command(BaseCommand):
@@ -10,7 +10,7 @@ class Command(BaseCommand):
         if not User.objects.filter(email='admin@nc100bw.org').exists():
             User.objects.create(
                 email='admin@nc100bw.org',
-                password=hashlib.sha256('Admin@1234'.encode()).hexdigest(),
+                password=hash_password('Admin@1234'),
                 first_name='Admin',
                 last_name='User',
                 role='admin',
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from ncbw.sessions import expire_sessions
+
+
+class Command(BaseCommand):
+    help = 'Delete expired rows from django_session in chunks (run it from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        removed = expire_sessions(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'✅ Removed {removed} expired sessions'))
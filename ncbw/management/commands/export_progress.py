@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from ncbw.exports import EXPORT_FORMATS, stream_export
+
+
+class Command(BaseCommand):
+    help = 'Stream per-trainee, per-module progress as CSV or JSONL'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', help='File to write (default: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        chunks = stream_export(options['format'], chunk_size=options['chunk_size'])
+        if not options['output']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+        with open(options['output'], 'w', newline='') as out:
+            out.writelines(chunks)
+        self.stdout.write(self.style.SUCCESS(f'✅ Exported progress to {options["output"]}'))
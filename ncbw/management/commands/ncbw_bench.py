@@ -0,0 +1,333 @@
+import asyncio
+import json
+import platform
+import random
+import threading
+import time
+from collections import defaultdict
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from ncbw.accounts import purge_users
+from ncbw.catalog import CATALOG
+from ncbw.instrumentation import RequestStats, collecting, enable_query_timing, percentile
+from ncbw.models import User, Progress, ProgressSummary
+from ncbw.pool import pool_stats
+from ncbw.progress import PASS_MARK, overall_percent
+from ncbw.quiz import start_attempt
+from ncbw.passwords import hash_password
+
+
+BENCH_DOMAIN   = 'bench.nc100bw.org'
+BENCH_PASSWORD = 'bench-password'
+BENCH_ADMIN    = f'admin@{BENCH_DOMAIN}'
+
+HANDLERS = ('wsgi', 'asgi')
+
+VIEW_WEIGHTS = {
+    'dashboard':       3,
+    'module_detail':   3,
+    'mark_complete':   4,
+    'submit_quiz':     2,
+    'admin_dashboard': 1,
+    'login':           1,
+}
+# login measures the password hash more than the app; ask for it by name
+DEFAULT_VIEWS = [v for v in VIEW_WEIGHTS if v != 'login']
+
+
+class Command(BaseCommand):
+    help = 'Seed benchmark trainees, drive the portal views concurrently and print a JSON report'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--trainees',    type=int, default=200)
+        parser.add_argument('--requests',    type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=8, help='Clients with a request in flight')
+        parser.add_argument('--workers', type=int,
+                            help='Worker threads (wsgi) or event loops (asgi); defaults to --concurrency')
+        parser.add_argument('--handler', choices=HANDLERS, default='wsgi',
+                            help='wsgi: a worker serves one request at a time; asgi: async views, '
+                                 'many requests per worker')
+        parser.add_argument('--views', default=','.join(DEFAULT_VIEWS),
+                            help='Comma-separated subset of: ' + ', '.join(VIEW_WEIGHTS))
+        parser.add_argument('--no-pool', action='store_true',
+                            help='Ignore the POOL setting and open a connection per request, for comparison')
+        parser.add_argument('--session-engine',
+                            help='Run with this SESSION_ENGINE instead of the configured one, '
+                                 'e.g. django.contrib.sessions.backends.db for a baseline')
+        parser.add_argument('--password-iterations', type=int,
+                            help='Seed and verify passwords at this PBKDF2 cost instead of '
+                                 'NCBW_PASSWORD_ITERATIONS; run with --views login to compare costs')
+        parser.add_argument('--seed',   type=int, default=1)
+        parser.add_argument('--output', help='Write the JSON report here instead of stdout')
+        parser.add_argument('--keep', action='store_true', help='Keep the seeded accounts afterwards')
+
+    def handle(self, *args, **options):
+        views = [v.strip() for v in options['views'].split(',') if v.strip()]
+        unknown = set(views) - set(VIEW_WEIGHTS)
+        if unknown:
+            raise CommandError(f'Unknown views: {", ".join(sorted(unknown))}')
+        rng = random.Random(options['seed'])
+        workers = options['workers'] or options['concurrency']
+
+        if options['no_pool']:
+            # connections made from here on (one per worker thread) read this
+            for alias in connections:
+                connections.settings[alias].pop('POOL', None)
+        pooled = bool(connections.settings['default'].get('POOL'))
+
+        session_engine = options['session_engine'] or settings.SESSION_ENGINE
+        iterations     = options['password_iterations'] or settings.NCBW_PASSWORD_ITERATIONS
+
+        # every login is a success from one address, so the throttles (which
+        # only count failures) stay out of the way
+        with override_settings(NCBW_PASSWORD_ITERATIONS=iterations):
+            remove_bench_users()
+            trainees = seed(options['trainees'], rng)
+            try:
+                # clients and their handlers are created inside, so they all see it
+                with override_settings(SESSION_ENGINE=session_engine):
+                    report = drive(trainees, views, options['requests'], options['concurrency'],
+                                   workers, options['handler'], rng)
+            finally:
+                if not options['keep']:
+                    remove_bench_users()
+
+        report['config'] = {
+            'trainees':    options['trainees'],
+            'requests':    options['requests'],
+            'concurrency': options['concurrency'],
+            'workers':     workers,
+            'handler':     options['handler'],
+            'views':       views,
+            'seed':        options['seed'],
+            'database':    connections['default'].vendor,
+            'pooled':      pooled,
+            'sessions':    session_engine,
+            'password_iterations': iterations,
+            'python':      platform.python_version(),
+        }
+        output = json.dumps(report, indent=2, sort_keys=True)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+            self.stdout.write(self.style.SUCCESS(f'✅ Report written to {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+
+# ── seeding ──────────────────────────────────────────────
+
+def remove_bench_users():
+    purge_users(User.objects.filter(email__endswith='@' + BENCH_DOMAIN))
+
+def seed(count, rng):
+    password = hash_password(BENCH_PASSWORD)
+    User.objects.create(
+        email=BENCH_ADMIN, password=password,
+        first_name='Bench', last_name='Admin', role='admin',
+    )
+    tracks = CATALOG.track_order
+    users  = User.objects.bulk_create([
+        User(
+            email=f'trainee{i}@{BENCH_DOMAIN}', password=password,
+            first_name='Bench', last_name=f'Trainee {i}', role='trainee',
+            selected_track=tracks[i % len(tracks)],
+        )
+        for i in range(count)
+    ])
+
+    now, rows, summaries = timezone.now(), [], []
+    for user in users:
+        track   = CATALOG.track(user.selected_track)
+        done    = rng.randint(0, track.course_count)
+        courses = [c for m in track.modules for c in m.courses][:done]
+        passed  = 0
+        for course in courses:
+            rows.append(Progress(
+                user=user, track_id=track.id, module_index=course.module_index,
+                course_index=course.index, completed=True, completed_at=now,
+            ))
+        for module in track.modules[:done // max(1, track.modules[0].course_count)]:
+            score = rng.choice([40, 60, 80, 100])
+            passed += score >= PASS_MARK
+            rows.append(Progress(
+                user=user, track_id=track.id, module_index=module.index, course_index=None,
+                quiz_score=score, quiz_passed=score >= PASS_MARK, quiz_attempts=rng.randint(1, 3),
+            ))
+        summaries.append(ProgressSummary(
+            user=user, track_id=track.id, completed_courses=done, passed_quizzes=passed,
+            overall=overall_percent(track.id, done), last_activity=now,
+        ))
+    Progress.objects.bulk_create(rows, batch_size=1000)
+    ProgressSummary.objects.bulk_create(summaries, batch_size=1000)
+    return users
+
+
+# ── driving ──────────────────────────────────────────────
+# Closed loop: `concurrency` clients each send their share of the plan back
+# to back. Under wsgi they queue for `workers` threads that serve one
+# request at a time; under asgi they are spread over `workers` event loops,
+# where the async API views give up the loop while waiting on the database.
+
+def client_email(name, user):
+    return BENCH_ADMIN if name == 'admin_dashboard' else user.email
+
+def build_request(name, user, rng):
+    track  = CATALOG.track(user.selected_track)
+    module = rng.choice(track.modules)
+    if name == 'dashboard':
+        return 'get', reverse('dashboard'), None
+    if name == 'admin_dashboard':
+        return 'get', reverse('admin_dashboard'), None
+    if name == 'login':
+        return 'login', reverse('login'), {'email': user.email, 'password': BENCH_PASSWORD}
+    if name == 'module_detail':
+        return 'get', reverse('module_detail', args=[track.id, module.index]), None
+    if name == 'mark_complete':
+        body = {'track_id': track.id, 'module_index': module.index,
+                'course_index': rng.randrange(module.course_count)}
+        return 'post', reverse('mark_complete'), body
+    # the attempt a browser would have fetched first, answered at random
+    token, questions = start_attempt(user.id, track.id, module.index, rng)
+    body = {'token': token, 'answers': [rng.randrange(len(q['choices'])) for q in questions]}
+    return 'post', reverse('submit_quiz'), body
+
+def send(client, method, url, body):
+    if method == 'get':
+        return client.get(url)
+    if method == 'login':
+        # a fresh, logged-out client, or the form just redirects
+        return type(client)().post(url, body)
+    return client.post(url, json.dumps(body), content_type='application/json')
+
+def login(client, email):
+    return client.post(reverse('login'), {'email': email, 'password': BENCH_PASSWORD})
+
+def check_login(response, email):
+    if response.status_code != 302:
+        raise CommandError(f'Could not log in as {email}')
+
+def wsgi_threads(chunks, workers, ready, record):
+    slots = threading.Semaphore(workers)
+
+    def run_client(chunk):
+        try:
+            # log everyone in before the clock starts
+            clients = {}
+            for name, user, _ in chunk:
+                email = client_email(name, user)
+                if email not in clients:
+                    clients[email] = Client()
+                    check_login(login(clients[email], email), email)
+            ready.wait()
+            for name, user, request_seed in chunk:
+                method, url, body = build_request(name, user, random.Random(request_seed))
+                with collecting(RequestStats()) as stats:
+                    start = time.perf_counter()
+                    with slots:
+                        try:
+                            response = send(clients[client_email(name, user)], method, url, body)
+                        finally:
+                            # what the WSGI handler's request_finished does;
+                            # the test client leaves connections open
+                            connections.close_all()
+                    record(name, (time.perf_counter() - start) * 1000, stats.queries, response.status_code)
+        except Exception:
+            ready.abort()
+            raise
+        finally:
+            connections.close_all()
+
+    return [threading.Thread(target=run_client, args=(chunk,)) for chunk in chunks]
+
+async def in_request_context(make_request):
+    # what ASGIHandler does per request: its own thread for sync work, whose
+    # connection is closed when the request finishes
+    async with ThreadSensitiveContext():
+        try:
+            return await make_request()
+        finally:
+            await sync_to_async(connections.close_all)()
+
+def asgi_threads(chunks, workers, ready, record):
+
+    async def run_client(chunk, clients):
+        for name, user, request_seed in chunk:
+            method, url, body = build_request(name, user, random.Random(request_seed))
+            with collecting(RequestStats()) as stats:
+                start = time.perf_counter()
+                client   = clients[client_email(name, user)]
+                response = await in_request_context(lambda: send(client, method, url, body))
+                record(name, (time.perf_counter() - start) * 1000, stats.queries, response.status_code)
+
+    async def run_loop(loop_chunks):
+        clients = {}
+        for name, user, _ in (item for chunk in loop_chunks for item in chunk):
+            email = client_email(name, user)
+            if email not in clients:
+                clients[email] = AsyncClient()
+                check_login(await in_request_context(lambda: login(clients[email], email)), email)
+        ready.wait()
+        await asyncio.gather(*(run_client(chunk, clients) for chunk in loop_chunks))
+
+    def run_worker(loop_chunks):
+        try:
+            asyncio.run(run_loop(loop_chunks))
+        except Exception:
+            ready.abort()
+            raise
+
+    return [threading.Thread(target=run_worker, args=(chunks[i::workers],)) for i in range(workers)]
+
+def drive(trainees, views, total_requests, concurrency, workers, handler, rng):
+    weights = [VIEW_WEIGHTS[v] for v in views]
+    plan    = [
+        (name, rng.choice(trainees), rng.randrange(2 ** 32))
+        for name in rng.choices(views, weights=weights, k=total_requests)
+    ]
+    chunks  = [plan[i::concurrency] for i in range(concurrency)]
+    samples = defaultdict(list)
+    errors  = defaultdict(int)
+    lock    = threading.Lock()
+
+    def record(name, elapsed, queries, status):
+        with lock:
+            samples[name].append((elapsed, queries))
+            if status >= 400:
+                errors[name] += 1
+
+    enable_query_timing()
+    # one thread per client under wsgi, one per event loop under asgi
+    ready   = threading.Barrier((concurrency if handler == 'wsgi' else workers) + 1)
+    build   = wsgi_threads if handler == 'wsgi' else asgi_threads
+    threads = build(chunks, workers, ready, record)
+    for t in threads:
+        t.start()
+    try:
+        ready.wait()
+    except threading.BrokenBarrierError:
+        raise CommandError('A benchmark worker failed during setup')
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - start
+
+    return {'totals': summarise([s for rows in samples.values() for s in rows], sum(errors.values()), wall),
+            'views':  {name: summarise(rows, errors[name], wall) for name, rows in sorted(samples.items())},
+            'pools':  pool_stats()}
+
+def summarise(rows, errors, wall):
+    latencies = sorted(ms for ms, _ in rows)
+    return {
+        'requests':             len(rows),
+        'errors':               errors,
+        'requests_per_sec':     round(len(rows) / wall, 1) if wall else None,
+        'p50_ms':               round(percentile(latencies, 50), 2) if rows else None,
+        'p99_ms':               round(percentile(latencies, 99), 2) if rows else None,
+        'queries_per_request':  round(sum(q for _, q in rows) / len(rows), 2) if rows else None,
+    }
@@ -0,0 +1,51 @@
+from datetime import datetime, time
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from ncbw.accounts import deactivate_users, purge_users
+from ncbw.catalog import CATALOG
+from ncbw.models import User
+
+
+class Command(BaseCommand):
+    help = 'Delete (or deactivate) a cohort of trainees and their progress in bounded chunks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--joined-before', help='YYYY-MM-DD; only trainees created before this date')
+        parser.add_argument('--track', help='Only trainees on this track ("none" = no track chosen)')
+        parser.add_argument('--email-domain', help='Only addresses @this domain')
+        parser.add_argument('--inactive', action='store_true', help='Only trainees already deactivated')
+        parser.add_argument('--deactivate', action='store_true', help='Deactivate instead of deleting')
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(role='trainee')
+        if options['joined_before']:
+            try:
+                day = datetime.strptime(options['joined_before'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--joined-before must be YYYY-MM-DD')
+            users = users.filter(created_at__lt=timezone.make_aware(datetime.combine(day, time.min)))
+        if options['track'] == 'none':
+            users = users.filter(selected_track__isnull=True)
+        elif options['track']:
+            if options['track'] not in CATALOG:
+                raise CommandError(f'Unknown track: {options["track"]}')
+            users = users.filter(selected_track=options['track'])
+        if options['email_domain']:
+            users = users.filter(email__iendswith='@' + options['email_domain'].lstrip('@'))
+        if options['inactive']:
+            users = users.filter(is_active=False)
+
+        if options['dry_run']:
+            self.stdout.write(f'{users.count()} trainees match')
+            return
+        if options['deactivate']:
+            count = deactivate_users(users, chunk_size=options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(f'✅ Deactivated {count} trainees'))
+            return
+
+        removed = purge_users(users, chunk_size=options['chunk_size'])
+        for table, rows in sorted(removed.items()):
+            self.stdout.write(f'  {table}: {rows}')
+        self.stdout.write(self.style.SUCCESS(f'✅ Deleted {removed["ncbw_user"]} trainees'))
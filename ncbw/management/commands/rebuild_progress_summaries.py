@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from ncbw.progress import rebuild_summaries
+
+
+class Command(BaseCommand):
+    help = 'Rebuild per-user progress summaries from the Progress table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        written = rebuild_summaries(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt {written} progress summaries'))
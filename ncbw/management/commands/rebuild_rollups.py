@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from ncbw.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-track and per-module cohort rollups from scratch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        modules = rebuild_rollups(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt rollups for {modules} modules'))
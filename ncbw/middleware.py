@@ -0,0 +1,53 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject
+from .models import User
+
+
+USER_CACHE_PREFIX = 'ncbw:user:'
+
+
+def _user_cache_key(user_id):
+    return f'{USER_CACHE_PREFIX}{user_id}'
+
+def load_user(user_id):
+    if not user_id:
+        return None
+    ttl = getattr(settings, 'NCBW_USER_CACHE_TTL', 0)
+    if ttl:
+        user = cache.get(_user_cache_key(user_id))
+        if user is not None:
+            return user
+    # always the primary: a trainee who just signed up may not have reached
+    # the replica yet, and a miss here signs them out
+    user = User.objects.using(DEFAULT_DB_ALIAS).filter(id=user_id, is_active=True).first()
+    if user is not None and ttl:
+        cache.set(_user_cache_key(user_id), user, ttl)
+    return user
+
+def invalidate_user(user_id):
+    cache.delete(_user_cache_key(user_id))
+
+def invalidate_users(user_ids):
+    cache.delete_many([_user_cache_key(user_id) for user_id in user_ids])
+
+
+class CurrentUserMiddleware:
+    # Resolves the logged-in User at most once per request, on first access
+    # to request.ncbw_user (None when logged out or the account is gone).
+    # Async-capable so ASGI requests to async views never pass through a
+    # sync middleware that would hold a thread for them; async views don't
+    # touch ncbw_user.
+    sync_capable  = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        request.ncbw_user = SimpleLazyObject(lambda: load_user(request.session.get('user_id')))
+        return self.get_response(request)
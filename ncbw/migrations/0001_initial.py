@@ -0,0 +1,54 @@
+# Generated by Django 5.0 on 2026-10-18 13:30
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='User',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('email', models.EmailField(max_length=254, unique=True)),
+                ('password', models.CharField(max_length=64)),
+                ('first_name', models.CharField(max_length=100)),
+                ('last_name', models.CharField(max_length=100)),
+                ('role', models.CharField(choices=[('admin', 'Admin'), ('trainee', 'Trainee')], default='trainee', max_length=10)),
+                ('selected_track', models.CharField(blank=True, max_length=100, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'ncbw_user',
+            },
+        ),
+        migrations.CreateModel(
+            name='Progress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track_id', models.CharField(max_length=100)),
+                ('module_index', models.IntegerField()),
+                ('course_index', models.IntegerField(blank=True, null=True)),
+                ('completed', models.BooleanField(default=False)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('quiz_score', models.FloatField(blank=True, null=True)),
+                ('quiz_passed', models.BooleanField(default=False)),
+                ('quiz_attempts', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='ncbw.user')),
+            ],
+            options={
+                'db_table': 'ncbw_progress',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='progress',
+            unique_together={('user', 'track_id', 'module_index', 'course_index')},
+        ),
+    ]
@@ -0,0 +1,55 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q, Sum
+
+
+def merge_duplicate_quiz_rows(apps, schema_editor):
+    # unique_together treats NULL course_index values as distinct, so a
+    # database from before this migration can hold several quiz rows for one
+    # module. Fold each group into its oldest row (best score, passed if any
+    # attempt passed, attempts summed) so the partial unique index can be built.
+    Progress = apps.get_model('ncbw', 'Progress')
+    quiz_rows = Progress.objects.filter(course_index__isnull=True)
+    groups = (
+        quiz_rows.values('user_id', 'track_id', 'module_index')
+        .annotate(n=Count('id'), keep=Min('id'), score=Max('quiz_score'),
+                  attempts=Sum('quiz_attempts'), passed=Count('id', filter=Q(quiz_passed=True)))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    for g in list(groups):
+        quiz_rows.filter(id=g['keep']).update(quiz_score=g['score'], quiz_attempts=g['attempts'],
+                                              quiz_passed=bool(g['passed']))
+        quiz_rows.filter(user_id=g['user_id'], track_id=g['track_id'],
+                         module_index=g['module_index']).exclude(id=g['keep']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track_id', models.CharField(max_length=100)),
+                ('completed_courses', models.IntegerField(default=0)),
+                ('passed_quizzes', models.IntegerField(default=0)),
+                ('overall', models.IntegerField(default=0)),
+                ('last_activity', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='summaries', to='ncbw.user')),
+            ],
+            options={
+                'db_table': 'ncbw_progress_summary',
+                'unique_together': {('user', 'track_id')},
+            },
+        ),
+        migrations.RunPython(merge_duplicate_quiz_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='progress',
+            constraint=models.UniqueConstraint(condition=models.Q(('course_index__isnull', True)), fields=('user', 'track_id', 'module_index'), name='ncbw_progress_one_quiz_row'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0 on 2026-10-18 13:30
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0002_progress_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('course_index__isnull', True)), fields=['track_id', 'module_index'], name='ncbw_progress_quiz_rows'),
+        ),
+        migrations.AddIndex(
+            model_name='progress',
+            index=models.Index(condition=models.Q(('completed', True), ('course_index__isnull', False)), fields=['user', 'track_id'], name='ncbw_progress_done_courses'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='ncbw_user_email_ci_unique'),
+        ),
+    ]
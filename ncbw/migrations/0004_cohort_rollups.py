@@ -0,0 +1,55 @@
+# Generated by Django 5.0 on 2026-10-18 13:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0003_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackRollup',
+            fields=[
+                ('track_id', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('enrolled', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'ncbw_track_rollup',
+            },
+        ),
+        migrations.CreateModel(
+            name='ModuleRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track_id', models.CharField(max_length=100)),
+                ('module_index', models.IntegerField()),
+                ('learners', models.IntegerField(default=0)),
+                ('finishers', models.IntegerField(default=0)),
+                ('course_completions', models.IntegerField(default=0)),
+                ('quiz_takers', models.IntegerField(default=0)),
+                ('quiz_passers', models.IntegerField(default=0)),
+                ('quiz_attempts', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'ncbw_module_rollup',
+                'unique_together': {('track_id', 'module_index')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ModuleScoreBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('track_id', models.CharField(max_length=100)),
+                ('module_index', models.IntegerField()),
+                ('bucket', models.IntegerField()),
+                ('attempts', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'ncbw_module_score_bucket',
+                'unique_together': {('track_id', 'module_index', 'bucket')},
+            },
+        ),
+    ]
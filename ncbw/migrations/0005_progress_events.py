@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-18 13:41
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_events(apps, schema_editor):
+    # Seed the log from the existing snapshot so it can be rebuilt from
+    # events alone. Only each quiz's best score survives in Progress, so
+    # every earlier attempt is logged with that score.
+    Progress      = apps.get_model('ncbw', 'Progress')
+    ProgressEvent = apps.get_model('ncbw', 'ProgressEvent')
+    now, batch    = timezone.now(), []
+    rows = Progress.objects.filter(
+        models.Q(course_index__isnull=False, completed=True) |
+        models.Q(course_index__isnull=True, quiz_attempts__gt=0, quiz_score__isnull=False)
+    ).order_by('pk')
+    for row in rows.iterator(chunk_size=2000):
+        common = dict(user_id=row.user_id, track_id=row.track_id, module_index=row.module_index, compacted=True)
+        if row.course_index is not None:
+            batch.append(ProgressEvent(course_index=row.course_index, created_at=row.completed_at or now, **common))
+        else:
+            batch += [ProgressEvent(score=row.quiz_score, created_at=now, **common) for _ in range(row.quiz_attempts)]
+        if len(batch) >= 2000:
+            ProgressEvent.objects.bulk_create(batch)
+            batch = []
+    ProgressEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0004_cohort_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('track_id', models.CharField(max_length=100)),
+                ('module_index', models.IntegerField()),
+                ('course_index', models.IntegerField(blank=True, null=True)),
+                ('score', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('compacted', models.BooleanField(default=False)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progress_events', to='ncbw.user')),
+            ],
+            options={
+                'db_table': 'ncbw_progress_event',
+                'indexes': [models.Index(condition=models.Q(('compacted', False)), fields=['user', 'id'], name='ncbw_event_pending')],
+            },
+        ),
+        migrations.RunPython(backfill_events, migrations.RunPython.noop),
+    ]
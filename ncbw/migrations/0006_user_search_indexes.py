@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+# Prefix search (lower(col) LIKE 'term%') can only use a btree index built
+# with text_pattern_ops unless the database collation is C, and opclasses on
+# expression indexes are PostgreSQL-only, so these are created by hand.
+SEARCH_INDEXES = {
+    'ncbw_user_email_prefix': 'email',
+    'ncbw_user_first_prefix': 'first_name',
+    'ncbw_user_last_prefix':  'last_name',
+}
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON ncbw_user (lower({column}) text_pattern_ops)'
+        )
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0005_progress_events'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
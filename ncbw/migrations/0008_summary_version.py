@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0007_user_is_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='progresssummary',
+            name='version',
+            field=models.IntegerField(default=0),
+        ),
+    ]
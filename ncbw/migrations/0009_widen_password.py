@@ -0,0 +1,18 @@
+# Generated by Django 5.0 on 2026-10-18 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0008_summary_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='password',
+            field=models.CharField(max_length=128),
+        ),
+    ]
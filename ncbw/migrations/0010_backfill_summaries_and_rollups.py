@@ -0,0 +1,126 @@
+from collections import Counter, defaultdict
+from django.db import migrations
+from django.db.models import Count, Max, Q, Sum
+
+
+# A database upgraded from before migrations (0001 faked) has progress rows
+# but no summaries or rollups; without them every trainee would show 0% and
+# later writes would count up from zero. Everything here goes through the
+# historical models, so later changes to the app's models or its rebuild
+# code can't break it. Course counts come from the catalog, which is
+# content rather than schema.
+
+BUCKETS = 10
+
+def score_bucket(score):
+    return min(int(score // 10), BUCKETS - 1) if score > 0 else 0
+
+
+def backfill_summaries(apps, course_count):
+    Progress        = apps.get_model('ncbw', 'Progress')
+    ProgressSummary = apps.get_model('ncbw', 'ProgressSummary')
+    totals = (
+        Progress.objects.values('user_id', 'track_id')
+        .annotate(
+            completed=Count('id', filter=Q(course_index__isnull=False, completed=True)),
+            passed=Count('id', filter=Q(course_index__isnull=True, quiz_passed=True)),
+            last=Max('completed_at'),
+        )
+        .order_by('user_id', 'track_id')
+    )
+    batch = []
+    for t in totals.iterator(chunk_size=2000):
+        total = course_count(t['track_id'])
+        batch.append(ProgressSummary(
+            user_id=t['user_id'], track_id=t['track_id'],
+            completed_courses=t['completed'], passed_quizzes=t['passed'],
+            overall=min(100, int(t['completed'] / total * 100)) if total else 0,
+            last_activity=t['last'],
+        ))
+        if len(batch) >= 2000:
+            ProgressSummary.objects.bulk_create(batch)
+            batch = []
+    ProgressSummary.objects.bulk_create(batch)
+
+
+def backfill_rollups(apps, course_count):
+    User              = apps.get_model('ncbw', 'User')
+    Progress          = apps.get_model('ncbw', 'Progress')
+    ProgressEvent     = apps.get_model('ncbw', 'ProgressEvent')
+    TrackRollup       = apps.get_model('ncbw', 'TrackRollup')
+    ModuleRollup      = apps.get_model('ncbw', 'ModuleRollup')
+    ModuleScoreBucket = apps.get_model('ncbw', 'ModuleScoreBucket')
+
+    enrolled = (
+        User.objects.filter(role='trainee', selected_track__isnull=False)
+        .values_list('selected_track').annotate(n=Count('id')).order_by()
+    )
+    TrackRollup.objects.bulk_create([TrackRollup(track_id=t, enrolled=n) for t, n in enrolled])
+
+    modules = defaultdict(Counter)
+    done_per_user = (
+        Progress.objects.filter(course_index__isnull=False, completed=True)
+        .values_list('track_id', 'module_index', 'user_id').annotate(done=Count('id'))
+        .order_by()
+    )
+    for track_id, mi, _, done in done_per_user.iterator(chunk_size=2000):
+        m = modules[track_id, mi]
+        m['learners']           += 1
+        m['finishers']          += int(done >= course_count(track_id, mi))
+        m['course_completions'] += done
+    quizzes = (
+        Progress.objects.filter(course_index__isnull=True)
+        .values_list('track_id', 'module_index')
+        .annotate(
+            takers=Count('id', filter=Q(quiz_attempts__gt=0)),
+            passers=Count('id', filter=Q(quiz_passed=True)),
+            attempts=Sum('quiz_attempts'),
+        )
+        .order_by()
+    )
+    for track_id, mi, takers, passers, attempts in quizzes:
+        m = modules[track_id, mi]
+        m['quiz_takers'], m['quiz_passers'], m['quiz_attempts'] = takers, passers, attempts or 0
+    ModuleRollup.objects.bulk_create([
+        ModuleRollup(track_id=t, module_index=mi, **counts) for (t, mi), counts in modules.items()
+    ], batch_size=2000)
+
+    # 0005 logged every quiz attempt already in Progress
+    buckets = Counter()
+    attempts = (
+        ProgressEvent.objects.filter(course_index__isnull=True, score__isnull=False)
+        .values_list('track_id', 'module_index', 'score')
+    )
+    for track_id, mi, score in attempts.iterator(chunk_size=2000):
+        buckets[track_id, mi, score_bucket(score)] += 1
+    ModuleScoreBucket.objects.bulk_create([
+        ModuleScoreBucket(track_id=t, module_index=mi, bucket=b, attempts=n)
+        for (t, mi, b), n in buckets.items()
+    ], batch_size=2000)
+
+
+def backfill(apps, schema_editor):
+    from ncbw.catalog import CATALOG
+
+    Progress        = apps.get_model('ncbw', 'Progress')
+    ProgressSummary = apps.get_model('ncbw', 'ProgressSummary')
+    TrackRollup     = apps.get_model('ncbw', 'TrackRollup')
+    ModuleRollup    = apps.get_model('ncbw', 'ModuleRollup')
+
+    if not Progress.objects.exists():
+        return
+    if not ProgressSummary.objects.exists():
+        backfill_summaries(apps, CATALOG.course_count)
+    if not (TrackRollup.objects.exists() or ModuleRollup.objects.exists()):
+        backfill_rollups(apps, CATALOG.course_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ncbw', '0009_widen_password'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils import timezone
 import uuid
 
 
@@ -7,15 +9,19 @@ class User(models.Model):
 
     id             = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     email          = models.EmailField(unique=True)
-    password       = models.CharField(max_length=64)  # SHA-256
+    password       = models.CharField(max_length=128)  # Django hasher format; see passwords.py
     first_name     = models.CharField(max_length=100)
     last_name      = models.CharField(max_length=100)
     role           = models.CharField(max_length=10, choices=ROLES, default='trainee')
     selected_track = models.CharField(max_length=100, blank=True, null=True)
+    is_active      = models.BooleanField(default=True)  # False = can't log in, history kept
     created_at     = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'ncbw_user'
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='ncbw_user_email_ci_unique'),
+        ]
 
     def __str__(self):
         return f"{self.email} ({self.role})"
@@ -35,3 +41,101 @@ class Progress(models.Model):
     class Meta:
         db_table = 'ncbw_progress'
         unique_together = ('user', 'track_id', 'module_index', 'course_index')
+        constraints = [
+            # unique_together treats NULL course_index as distinct, so quiz
+            # rows need their own key for ON CONFLICT upserts
+            models.UniqueConstraint(
+                fields=['user', 'track_id', 'module_index'],
+                condition=models.Q(course_index__isnull=True),
+                name='ncbw_progress_one_quiz_row',
+            ),
+        ]
+        # (user, track_id) lookups can use the unique_together index, whose
+        # leading columns are that pair, or the user_id index that comes with
+        # the foreign key; the planner picks between them on cost
+        indexes = [
+            models.Index(
+                fields=['track_id', 'module_index'],
+                condition=models.Q(course_index__isnull=True),
+                name='ncbw_progress_quiz_rows',
+            ),
+            models.Index(
+                fields=['user', 'track_id'],
+                condition=models.Q(course_index__isnull=False, completed=True),
+                name='ncbw_progress_done_courses',
+            ),
+        ]
+
+
+class ProgressEvent(models.Model):
+    # Append-only history of every click; Progress is the snapshot folded
+    # from it (ncbw.progress.compact_events). Like Progress, course_index is
+    # null for quiz attempts. `compacted` is the only column ever updated.
+    id           = models.BigAutoField(primary_key=True)
+    user         = models.ForeignKey(User, on_delete=models.CASCADE, related_name='progress_events')
+    track_id     = models.CharField(max_length=100)
+    module_index = models.IntegerField()
+    course_index = models.IntegerField(null=True, blank=True)  # null = quiz attempt
+    score        = models.FloatField(null=True, blank=True)
+    created_at   = models.DateTimeField(default=timezone.now)
+    compacted    = models.BooleanField(default=False)
+
+    class Meta:
+        db_table = 'ncbw_progress_event'
+        indexes = [
+            models.Index(
+                fields=['user', 'id'],
+                condition=models.Q(compacted=False),
+                name='ncbw_event_pending',
+            ),
+        ]
+
+
+class ProgressSummary(models.Model):
+    user              = models.ForeignKey(User, on_delete=models.CASCADE, related_name='summaries')
+    track_id          = models.CharField(max_length=100)
+    completed_courses = models.IntegerField(default=0)
+    passed_quizzes    = models.IntegerField(default=0)
+    overall           = models.IntegerField(default=0)  # % of the track's courses
+    last_activity     = models.DateTimeField(null=True, blank=True)
+    version           = models.IntegerField(default=0)      # +1 per progress write; feeds page ETags
+
+    class Meta:
+        db_table = 'ncbw_progress_summary'
+        unique_together = ('user', 'track_id')
+
+
+# ── cohort rollups (maintained by ncbw.rollups) ──────────
+
+class TrackRollup(models.Model):
+    track_id = models.CharField(max_length=100, primary_key=True)
+    enrolled = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'ncbw_track_rollup'
+
+
+class ModuleRollup(models.Model):
+    track_id           = models.CharField(max_length=100)
+    module_index       = models.IntegerField()
+    learners           = models.IntegerField(default=0)  # completed at least one course
+    finishers          = models.IntegerField(default=0)  # completed every course
+    course_completions = models.IntegerField(default=0)
+    quiz_takers        = models.IntegerField(default=0)
+    quiz_passers       = models.IntegerField(default=0)
+    quiz_attempts      = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'ncbw_module_rollup'
+        unique_together = ('track_id', 'module_index')
+
+
+class ModuleScoreBucket(models.Model):
+    track_id     = models.CharField(max_length=100)
+    module_index = models.IntegerField()
+    bucket       = models.IntegerField()  # 0 = 0-9%, ..., 9 = 90-100%
+    attempts     = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'ncbw_module_score_bucket'
+        unique_together = ('track_id', 'module_index', 'bucket')
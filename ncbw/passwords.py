@@ -0,0 +1,46 @@
+import hashlib
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.utils.crypto import constant_time_compare
+from .models import User
+
+
+# ── hashing ──────────────────────────────────────────────
+# Salted PBKDF2 through Django's hashers, with the cost in
+# NCBW_PASSWORD_ITERATIONS. A stored hash made at another cost is re-hashed
+# at the next successful login, so raising (or lowering) the setting rolls
+# out as trainees sign in. Accounts from before this still hold a bare,
+# unsalted SHA-256 hex digest; those are checked the old way once and
+# replaced by a PBKDF2 hash on the same login.
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return getattr(settings, 'NCBW_PASSWORD_ITERATIONS', hashers.PBKDF2PasswordHasher.iterations)
+
+
+def hash_password(password):
+    return hashers.make_password(password)
+
+def is_legacy_hash(encoded):
+    return len(encoded) == 64 and '$' not in encoded
+
+def _legacy_matches(password, encoded):
+    return constant_time_compare(hashlib.sha256(password.encode()).hexdigest(), encoded)
+
+def _store(user, password):
+    user.password = hash_password(password)
+    User.objects.filter(id=user.id).update(password=user.password)
+
+def verify_password(user, password):
+    if is_legacy_hash(user.password):
+        if not _legacy_matches(password, user.password):
+            return False
+        _store(user, password)
+        return True
+    return hashers.check_password(password, user.password, setter=lambda raw: _store(user, raw))
+
+def burn_hash(password):
+    # same work as a real check, for logins to an unknown email, so response
+    # times don't tell which addresses have accounts
+    hashers.get_hasher().encode(password, 'ncbw-dummy-salt')
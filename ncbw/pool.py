@@ -0,0 +1,173 @@
+import logging
+import os
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+POOL_DEFAULTS = {
+    'MIN_SIZE':    2,      # kept open however long they sit idle
+    'MAX_SIZE':    20,     # per process; a checkout past this waits
+    'TIMEOUT':     5,      # seconds to wait for a free connection
+    'MAX_IDLE':    300,    # close idle connections above MIN_SIZE after this
+    'CHECK_AFTER': 30,     # ping a connection idle for longer before handing it out
+}
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+# ── pool ─────────────────────────────────────────────────
+# A plain LIFO of open connections guarded by a Condition. connect() makes a
+# new one; check(conn) pings it, reset(conn) puts it back in a clean state and
+# both return False when the connection should be thrown away. Connections are
+# opened lazily, outside the lock.
+
+class ConnectionPool:
+    def __init__(self, connect, check, reset, config=None):
+        config = {**POOL_DEFAULTS, **(config or {})}
+        self.connect     = connect
+        self.check       = check
+        self.reset       = reset
+        self.min_size    = config['MIN_SIZE']
+        self.max_size    = max(1, config['MAX_SIZE'])
+        self.timeout     = config['TIMEOUT']
+        self.max_idle    = config['MAX_IDLE']
+        self.check_after = config['CHECK_AFTER']
+        self.pid         = os.getpid()
+
+        self._cond  = threading.Condition()
+        self._idle  = []       # [(conn, returned_at)], most recent last
+        self._size  = 0        # open connections, idle or checked out
+        self.counts = {'checkouts': 0, 'waits': 0, 'wait_ms': 0.0, 'timeouts': 0,
+                       'connects': 0, 'discarded': 0, 'failed_checks': 0}
+
+    def getconn(self):
+        retry = False
+        while True:
+            conn, idle_since = self._take(retry)
+            if conn is None:
+                return self._open()
+            if time.monotonic() - idle_since < self.check_after or self._check(conn):
+                return conn
+            retry = True
+
+    def _take(self, retry):
+        with self._cond:
+            if not retry:
+                self.counts['checkouts'] += 1
+            if not self._idle and self._size >= self.max_size:
+                self.counts['waits'] += 1
+                start = time.monotonic()
+                ready = self._cond.wait_for(lambda: self._idle or self._size < self.max_size, timeout=self.timeout)
+                self.counts['wait_ms'] += (time.monotonic() - start) * 1000
+                if not ready:
+                    self.counts['timeouts'] += 1
+                    raise PoolTimeout(f'No database connection free within {self.timeout}s '
+                                      f'({self.max_size} in use)')
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+            return None, None
+
+    def _open(self):
+        try:
+            conn = self.connect()
+        except BaseException:
+            self._forget()
+            raise
+        with self._cond:
+            self.counts['connects'] += 1
+        return conn
+
+    def _check(self, conn):
+        try:
+            if self.check(conn):
+                return True
+        except Exception:
+            logger.debug('Pooled connection failed its health check', exc_info=True)
+        with self._cond:
+            self.counts['failed_checks'] += 1
+        self._discard(conn)
+        return False
+
+    def putconn(self, conn):
+        try:
+            ok = self.reset(conn)
+        except Exception:
+            ok = False
+        if not ok:
+            self._discard(conn)
+            return
+        now = time.monotonic()
+        with self._cond:
+            self._idle.append((conn, now))
+            stale = self._trim(now)
+            self._cond.notify()
+        for old in stale:
+            self._discard(old)
+
+    def _trim(self, now):
+        # oldest first; called with the lock held
+        stale = []
+        while len(self._idle) > self.min_size and now - self._idle[0][1] > self.max_idle:
+            stale.append(self._idle.pop(0)[0])
+        return stale
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self.counts['discarded'] += 1
+        self._forget()
+
+    def _forget(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self):
+        with self._cond:
+            return {
+                **self.counts,
+                'wait_ms':  round(self.counts['wait_ms'], 2),
+                'size':     self._size,
+                'idle':     len(self._idle),
+                'in_use':   self._size - len(self._idle),
+                'max_size': self.max_size,
+            }
+
+
+# ── registry ─────────────────────────────────────────────
+# One pool per database alias per process; a forked worker starts its own
+# rather than sharing sockets with its parent.
+
+_pools      = {}
+_pools_lock = threading.Lock()
+
+def get_pool(alias, make_pool):
+    pool = _pools.get(alias)
+    if pool is None or pool.pid != os.getpid():
+        with _pools_lock:
+            pool = _pools.get(alias)
+            if pool is None or pool.pid != os.getpid():
+                pool = _pools[alias] = make_pool()
+    return pool
+
+def pool_stats():
+    return {alias: pool.stats() for alias, pool in sorted(_pools.items()) if pool.pid == os.getpid()}
+
+def close_pools():
+    for pool in list(_pools.values()):
+        if pool.pid == os.getpid():
+            pool.close()
@@ -0,0 +1,348 @@
+import logging
+import threading
+from collections import Counter, defaultdict
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import Case, Count, IntegerField, Max, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Least
+from django.utils import timezone
+from .models import Progress, ProgressEvent, ProgressSummary
+from .catalog import CATALOG, changed_tracks
+from .rollups import rebuild_rollups, record_rollups
+
+
+logger = logging.getLogger(__name__)
+
+PASS_MARK = 70
+
+
+def empty_module_progress():
+    return {'courses': {}, 'quiz_passed': False, 'quiz_score': None, 'quiz_attempts': 0}
+
+def overall_percent(track_id, completed_courses):
+    total = CATALOG.course_count(track_id)
+    return min(100, int(completed_courses / total * 100)) if total else 0
+
+def overall_expression(completed, track):
+    # overall_percent() in SQL, for queries that sort on it. Stored
+    # ProgressSummary.overall goes stale when a catalog reload changes a
+    # track's course count, so reads always work it out from
+    # completed_courses (recounted on reload; see recount_summaries)
+    # against the catalog in use.
+    return Case(*[
+        When(**{track: t.id}, then=Least(Value(100), completed * 100 / t.course_count))
+        for t in CATALOG if t.course_count
+    ], default=Value(0), output_field=IntegerField())
+
+
+def current_courses(tracks=None):
+    # completed course rows whose course the catalog in use still has;
+    # rows for courses a reload removed stay in the table but don't count
+    parts = [Q(track_id=t.id, module_index=m.index, course_index__lt=m.course_count)
+             for t in CATALOG if tracks is None or t.id in tracks for m in t.modules]
+    return Q(course_index__isnull=False, completed=True) & reduce(or_, parts, Q(pk__in=[]))
+
+def current_passed_quizzes(tracks=None):
+    parts = [Q(track_id=t.id, module_index__lt=len(t.modules))
+             for t in CATALOG if tracks is None or t.id in tracks]
+    return Q(course_index__isnull=True, quiz_passed=True) & reduce(or_, parts, Q(pk__in=[]))
+
+
+# ── reads ────────────────────────────────────────────────
+
+def get_summary(user, track_id):
+    summary = ProgressSummary.objects.filter(user=user, track_id=track_id).first()
+    summary = summary or ProgressSummary(user=user, track_id=track_id)
+    summary.overall = overall_percent(track_id, summary.completed_courses)   # see overall_expression
+    return summary
+
+def _fold_row(progress, row):
+    if row.course_index is not None:
+        progress['courses'][row.course_index] = {'completed': row.completed}
+    else:
+        progress['quiz_passed']   = row.quiz_passed
+        progress['quiz_score']    = row.quiz_score
+        progress['quiz_attempts'] = row.quiz_attempts
+
+def get_module_progress(user, track_id, module_index):
+    progress = empty_module_progress()
+    rows = Progress.objects.filter(user=user, track_id=track_id, module_index=module_index)
+    for row in rows:
+        _fold_row(progress, row)
+    return progress
+
+def _track_rows(user, track_id, module_indexes):
+    rows = Progress.objects.filter(user=user, track_id=track_id)
+    if module_indexes is not None:
+        rows = rows.filter(module_index__in=module_indexes)
+    return rows, {mi: empty_module_progress() for mi in (module_indexes or ())}
+
+async def aget_track_progress(user, track_id, module_indexes=None):
+    rows, modules = _track_rows(user, track_id, module_indexes)
+    async for row in rows:
+        _fold_row(modules.setdefault(row.module_index, empty_module_progress()), row)
+    return modules
+
+
+# ── writes ───────────────────────────────────────────────
+# Each write is a single INSERT ... ON CONFLICT DO UPDATE, so concurrent
+# clicks for the same row serialise on the row lock instead of losing
+# updates in a read-modify-write.
+
+COURSE_UPSERT = """
+    INSERT INTO ncbw_progress
+        (user_id, track_id, module_index, course_index, completed, completed_at, quiz_passed, quiz_attempts)
+    VALUES {values}
+    ON CONFLICT (user_id, track_id, module_index, course_index)
+    DO UPDATE SET completed = TRUE, completed_at = EXCLUDED.completed_at
+        WHERE NOT ncbw_progress.completed
+    RETURNING module_index
+"""
+COURSE_VALUES = '(%s, %s, %s, %s, TRUE, %s, FALSE, 0)'
+
+# quiz rows have course_index NULL, so they conflict on the partial unique
+# index rather than unique_together (NULLs never compare equal there)
+QUIZ_UPSERT = """
+    INSERT INTO ncbw_progress
+        (user_id, track_id, module_index, course_index, completed, quiz_score, quiz_passed, quiz_attempts)
+    VALUES {values}
+    ON CONFLICT (user_id, track_id, module_index) WHERE course_index IS NULL
+    DO UPDATE SET
+        quiz_score    = CASE WHEN EXCLUDED.quiz_score > COALESCE(ncbw_progress.quiz_score, 0)
+                             THEN EXCLUDED.quiz_score ELSE ncbw_progress.quiz_score END,
+        quiz_attempts = ncbw_progress.quiz_attempts + EXCLUDED.quiz_attempts
+    RETURNING module_index, quiz_attempts, quiz_passed
+"""
+QUIZ_VALUES = '(%s, %s, %s, NULL, FALSE, %s, %s, %s)'
+
+# only runs for passing attempts on existing rows; each row matches at most once
+QUIZ_PASS = """
+    UPDATE ncbw_progress SET quiz_passed = TRUE
+    WHERE user_id = %s AND track_id = %s AND module_index IN ({placeholders})
+      AND course_index IS NULL AND NOT quiz_passed
+    RETURNING module_index
+"""
+
+SUMMARY_UPSERT = """
+    INSERT INTO ncbw_progress_summary
+        (user_id, track_id, completed_courses, passed_quizzes, overall, last_activity, version)
+    VALUES (%s, %s, %s, %s, %s, %s, 1)
+    ON CONFLICT (user_id, track_id)
+    DO UPDATE SET
+        completed_courses = ncbw_progress_summary.completed_courses + EXCLUDED.completed_courses,
+        passed_quizzes    = ncbw_progress_summary.passed_quizzes + EXCLUDED.passed_quizzes,
+        overall           = CASE WHEN ncbw_progress_summary.completed_courses + EXCLUDED.completed_courses >= %s
+                                 THEN 100
+                                 ELSE (ncbw_progress_summary.completed_courses + EXCLUDED.completed_courses) * 100 / %s END,
+        last_activity     = EXCLUDED.last_activity,
+        version           = ncbw_progress_summary.version + 1
+    RETURNING id, completed_courses, passed_quizzes, overall, version
+"""
+
+
+def _db_value(model, field, value):
+    return model._meta.get_field(field).get_db_prep_value(value, connection)
+
+def _bump_summary(cursor, user_id, track_id, now, courses=0, quizzes=0):
+    total = CATALOG.course_count(track_id) or 1
+    cursor.execute(SUMMARY_UPSERT, [
+        _db_value(ProgressSummary, 'user', user_id), track_id, courses, quizzes,
+        overall_percent(track_id, courses), _db_value(ProgressSummary, 'last_activity', now),
+        total, total,
+    ])
+    summary_id, completed_courses, passed_quizzes, overall, version = cursor.fetchone()
+    return ProgressSummary(
+        id=summary_id, user_id=user_id, track_id=track_id,
+        completed_courses=completed_courses, passed_quizzes=passed_quizzes,
+        overall=overall, last_activity=now, version=version,
+    )
+
+def _upsert_courses(cursor, user_id, track_id, now, completions, completed_at):
+    db_user = _db_value(Progress, 'user', user_id)
+    params  = []
+    for module_index, course_index in completions:
+        when    = completed_at.get((module_index, course_index), now)
+        params += [db_user, track_id, module_index, course_index, _db_value(Progress, 'completed_at', when)]
+    cursor.execute(COURSE_UPSERT.format(values=', '.join([COURSE_VALUES] * len(completions))), params)
+    return Counter(module_index for (module_index,) in cursor.fetchall())
+
+def _upsert_quizzes(cursor, user_id, track_id, scores):
+    # scores: {module_index: [score, ...]}; returns the modules attempted for
+    # the first time and the modules passed for the first time
+    db_user = _db_value(Progress, 'user', user_id)
+    params  = []
+    for module_index, attempts in scores.items():
+        best = max(attempts)
+        params += [db_user, track_id, module_index, best, best >= PASS_MARK, len(attempts)]
+    cursor.execute(QUIZ_UPSERT.format(values=', '.join([QUIZ_VALUES] * len(scores))), params)
+
+    first, passed, flip = set(), set(), []
+    for module_index, total_attempts, already_passed in cursor.fetchall():
+        attempts = scores[module_index]
+        if total_attempts == len(attempts):   # row was inserted by this statement
+            first.add(module_index)
+            if max(attempts) >= PASS_MARK:
+                passed.add(module_index)
+        elif max(attempts) >= PASS_MARK and not already_passed:
+            flip.append(module_index)
+    if flip:
+        cursor.execute(
+            QUIZ_PASS.format(placeholders=', '.join(['%s'] * len(flip))),
+            [db_user, track_id] + flip,
+        )
+        passed.update(module_index for (module_index,) in cursor.fetchall())
+    return first, passed
+
+def _events(user_id, track_id, completions, quiz_scores, now, compacted):
+    common = dict(user_id=user_id, track_id=track_id, created_at=now, compacted=compacted)
+    return (
+        [ProgressEvent(module_index=mi, course_index=ci, **common) for mi, ci in completions] +
+        [ProgressEvent(module_index=mi, score=score, **common) for mi, score in quiz_scores]
+    )
+
+# completions: [(module_index, course_index)], quiz_scores: [(module_index, score)].
+# Logs the clicks as already-compacted events unless they came from the log;
+# completed_at ({(module_index, course_index): when}) and now backdate them.
+def apply_progress(user_id, track_id, completions=(), quiz_scores=(), now=None, completed_at=None, log_events=True):
+    now    = now or timezone.now()
+    events = _events(user_id, track_id, completions, quiz_scores, now, compacted=True) if log_events else []
+    completions = sorted(set(completions))
+    scores      = {}
+    for module_index, score in quiz_scores:
+        scores.setdefault(module_index, []).append(score)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        if events:
+            ProgressEvent.objects.bulk_create(events)
+        completed     = (_upsert_courses(cursor, user_id, track_id, now, completions, completed_at or {})
+                         if completions else Counter())
+        first, passed = _upsert_quizzes(cursor, user_id, track_id, scores) if scores else (set(), set())
+        summary = _bump_summary(
+            cursor, user_id, track_id, now,
+            courses=sum(completed.values()), quizzes=len(passed),
+        )
+        # last, so the shared per-module rollup rows stay locked only briefly
+        record_rollups(cursor, user_id, track_id, completed, scores, first, passed)
+        return summary
+
+def defer_progress():
+    return getattr(settings, 'NCBW_DEFER_PROGRESS', False)
+
+# The write path for clicks: applied straight away, or with
+# NCBW_DEFER_PROGRESS only logged (returns None) until compact_events runs.
+def record_progress(user_id, track_id, completions=(), quiz_scores=()):
+    if not defer_progress():
+        return apply_progress(user_id, track_id, completions, quiz_scores)
+    ProgressEvent.objects.bulk_create(_events(user_id, track_id, completions, quiz_scores, timezone.now(), compacted=False))
+    return None
+
+
+# ── event compaction ─────────────────────────────────────
+# Folds pending events into the snapshot, oldest first, a chunk per
+# transaction. SKIP LOCKED lets several compactors (or a trainee's own page
+# view, via user_id) run at once without applying an event twice.
+
+def compact_events(user_id=None, chunk_size=1000):
+    compacted = 0
+    while True:
+        with transaction.atomic():
+            pending = ProgressEvent.objects.filter(compacted=False)
+            if user_id is not None:
+                pending = pending.filter(user_id=user_id)
+            events = list(pending.select_for_update(skip_locked=True).order_by('id')[:chunk_size])
+            if not events:
+                return compacted
+
+            groups = defaultdict(lambda: {'completions': [], 'quiz_scores': [], 'completed_at': {}, 'now': None})
+            for e in events:
+                group = groups[e.user_id, e.track_id]
+                if e.course_index is None:
+                    group['quiz_scores'].append((e.module_index, e.score))
+                else:
+                    group['completions'].append((e.module_index, e.course_index))
+                    group['completed_at'].setdefault((e.module_index, e.course_index), e.created_at)
+                group['now'] = max(group['now'] or e.created_at, e.created_at)
+            for (uid, track_id), group in sorted(groups.items()):
+                apply_progress(uid, track_id, log_events=False, **group)
+            ProgressEvent.objects.filter(id__in=[e.id for e in events]).update(compacted=True)
+
+        compacted += len(events)
+        if len(events) < chunk_size:
+            return compacted
+
+# Throws the snapshot away and replays the whole log; rollups are derived
+# from the snapshot, so they are rebuilt afterwards.
+def rebuild_from_events(chunk_size=1000):
+    with transaction.atomic():
+        Progress.objects.all().delete()
+        ProgressSummary.objects.all().delete()
+        ProgressEvent.objects.update(compacted=False)
+        replayed = compact_events(chunk_size=chunk_size)
+        rebuild_rollups(chunk_size=chunk_size)
+    return replayed
+
+
+# ── maintenance ──────────────────────────────────────────
+
+def rebuild_summaries(batch_size=1000):
+    totals = (
+        Progress.objects.values('user_id', 'track_id')
+        .annotate(
+            completed=Count('id', filter=current_courses()),
+            passed=Count('id', filter=current_passed_quizzes()),
+            last=Max('completed_at'),
+        )
+        .order_by('user_id', 'track_id')
+    )
+    batch, written = [], 0
+    with transaction.atomic():
+        ProgressSummary.objects.all().delete()
+        for t in totals.iterator(chunk_size=batch_size):
+            batch.append(ProgressSummary(
+                user_id=t['user_id'], track_id=t['track_id'],
+                completed_courses=t['completed'], passed_quizzes=t['passed'],
+                overall=overall_percent(t['track_id'], t['completed']),
+                last_activity=t['last'],
+            ))
+            if len(batch) >= batch_size:
+                ProgressSummary.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        ProgressSummary.objects.bulk_create(batch)
+        written += len(batch)
+    return written
+
+# A catalog reload that adds or removes courses changes what the stored
+# counts should be. Each affected track's summaries are recounted in one
+# UPDATE, on a thread of its own: the reload can happen mid-request, inside
+# another write's transaction. Every process recounts when it picks up the
+# new file; the result is the same each time.
+
+def recount_summaries(track_ids):
+    updated = 0
+    for track_id in track_ids:
+        rows   = Progress.objects.filter(user_id=OuterRef('user_id'), track_id=track_id).order_by().values('user_id')
+        done   = rows.filter(current_courses([track_id])).annotate(n=Count('id')).values('n')
+        passed = rows.filter(current_passed_quizzes([track_id])).annotate(n=Count('id')).values('n')
+        updated += ProgressSummary.objects.filter(track_id=track_id).update(
+            completed_courses=Coalesce(Subquery(done), 0),
+            passed_quizzes=Coalesce(Subquery(passed), 0),
+        )
+    return updated
+
+def _recount(track_ids):
+    try:
+        recount_summaries(track_ids)
+    except Exception:
+        logger.exception('Recounting progress summaries for %s failed', ', '.join(track_ids))
+    finally:
+        connections.close_all()
+
+def _catalog_changed(old, new):
+    track_ids = changed_tracks(old, new)
+    if track_ids:
+        threading.Thread(target=_recount, args=(track_ids,), name='ncbw-recount', daemon=True).start()
+
+CATALOG.on_change(_catalog_changed)
@@ -0,0 +1,100 @@
+import random
+import secrets
+from dataclasses import dataclass
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from .catalog import CATALOG
+
+
+class QuizError(ValueError):
+    pass
+
+
+# ── attempts ─────────────────────────────────────────────
+# Starting a quiz draws quiz.sample questions from the module's bank and
+# hands the trainee their prompts and choices plus a signed token naming the
+# questions drawn. Nothing is stored server-side until the answers come back:
+# the token says which questions were asked, the catalog's precompiled
+# answer_key says which choices were right, and the score is worked out here.
+# Each token is good for one submission within NCBW_QUIZ_ATTEMPT_TTL seconds
+# and only against the catalog version it was drawn from.
+
+SALT = 'ncbw.quiz'
+
+@dataclass(frozen=True)
+class Attempt:
+    user_id:      str
+    track_id:     str
+    module_index: int
+    picked:       tuple     # indexes into module.quiz.questions, in the order asked
+    nonce:        str
+
+def attempt_ttl():
+    return getattr(settings, 'NCBW_QUIZ_ATTEMPT_TTL', 7200)
+
+def start_attempt(user_id, track_id, module_index, rng=random):
+    quiz   = CATALOG.module(track_id, module_index).quiz
+    picked = rng.sample(range(len(quiz.questions)), quiz.sample)
+    token  = signing.dumps({
+        'u': str(user_id), 't': track_id, 'm': module_index, 'q': picked,
+        'v': CATALOG.version, 'n': secrets.token_urlsafe(9),
+    }, salt=SALT, compress=True)
+    questions = [{'prompt': quiz.questions[i].prompt, 'choices': list(quiz.questions[i].choices)} for i in picked]
+    return token, questions
+
+def open_attempt(token, user_id):
+    try:
+        data = signing.loads(token, salt=SALT, max_age=attempt_ttl())
+    except signing.SignatureExpired:
+        raise QuizError('This quiz attempt has expired; start it again')
+    except (signing.BadSignature, TypeError):
+        raise QuizError('Invalid quiz attempt')
+    if data['u'] != str(user_id):
+        raise QuizError('Invalid quiz attempt')
+    if data['v'] != CATALOG.version:
+        raise QuizError('The quiz has changed since this attempt started; start it again')
+    return Attempt(user_id=data['u'], track_id=data['t'], module_index=data['m'],
+                   picked=tuple(data['q']), nonce=data['n'])
+
+def claim(attempts):
+    # one submission per token; the default cache has to be shared between
+    # worker processes for this to hold across them. A batch is claimed
+    # whole or not at all: a rejected batch gives back the tokens it took,
+    # so the trainee can resubmit the valid ones.
+    keys = [f'ncbw:quiz:{attempt.nonce}' for attempt in attempts]
+    if len(set(keys)) != len(keys):
+        raise QuizError('The same quiz attempt was submitted twice')
+    if cache.get_many(keys):
+        raise QuizError('This quiz attempt has already been submitted')
+    claimed = []
+    for key in keys:
+        if not cache.add(key, 1, attempt_ttl()):     # lost a race with another submit
+            cache.delete_many(claimed)
+            raise QuizError('This quiz attempt has already been submitted')
+        claimed.append(key)
+
+
+# ── grading ──────────────────────────────────────────────
+# answers[i] is the choice index picked for the i-th question asked, None if
+# left blank. Scoring is one byte compare per question against the compiled
+# key, so a cohort's batch of submissions grades without touching the db.
+
+def grade(attempt, answers):
+    if not isinstance(answers, list) or len(answers) != len(attempt.picked):
+        raise QuizError(f'Expected {len(attempt.picked)} answers')
+    if not all(a is None or (isinstance(a, int) and not isinstance(a, bool)) for a in answers):
+        raise QuizError('Answers must be choice indexes')
+    key     = CATALOG.module(attempt.track_id, attempt.module_index).quiz.answer_key
+    correct = sum(1 for q, a in zip(attempt.picked, answers) if a == key[q])
+    return round(correct * 100 / len(answers))
+
+def grade_many(user_id, submissions):
+    # submissions: [(token, answers)] -> [(attempt, score)]; every token is
+    # checked before any is used up
+    graded = []
+    for token, answers in submissions:
+        attempt = open_attempt(token, user_id)
+        graded.append((attempt, grade(attempt, answers)))
+    claim(attempt for attempt, _ in graded)
+    return graded
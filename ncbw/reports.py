@@ -0,0 +1,170 @@
+import base64
+import json
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Count, F, FilteredRelation, Q, Value
+from django.db.models.functions import Coalesce, Lower
+from .catalog import CATALOG
+from .models import User
+from .progress import overall_expression
+
+
+REPORT_SORTS = {
+    'name':     ('first_name', 'last_name', 'id'),
+    'progress': ('overall', 'id'),
+    'track':    ('track_key', 'id'),
+}
+DEFAULT_SORT     = 'name'
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE     = 200
+
+
+# ── cursors ──────────────────────────────────────────────
+
+def encode_cursor(values):
+    raw = json.dumps([str(v) if not isinstance(v, (int, float)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, size):
+    if not cursor:
+        return None
+    try:
+        raw    = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return values
+
+def _key_field(qs, key):
+    if key in qs.query.annotations:
+        return qs.query.annotations[key].output_field
+    return qs.model._meta.get_field(key)
+
+def cursor_values(qs, keys, cursor):
+    # a cursor from another sort (or a tampered one) is treated as no cursor
+    # rather than reaching the database as a mistyped filter
+    values = decode_cursor(cursor, len(keys))
+    if values is None:
+        return None
+    try:
+        return [_key_field(qs, key).to_python(value) for key, value in zip(keys, values)]
+    except (ValidationError, FieldDoesNotExist, TypeError):
+        return None
+
+def keyset_filter(keys, values, descending):
+    # (a, b, c) > (x, y, z)  ==  a > x  OR  (a = x AND b > y)  OR  ...
+    op = 'lt' if descending else 'gt'
+    q  = Q()
+    for i, key in enumerate(keys):
+        clause = Q(**{f'{key}__{op}': values[i]})
+        for prev_key, prev_value in zip(keys[:i], values[:i]):
+            clause &= Q(**{prev_key: prev_value})
+        q |= clause
+    return q
+
+def parse_sort(sort):
+    sort = sort or DEFAULT_SORT
+    descending = sort.startswith('-')
+    key = sort.lstrip('-')
+    if key not in REPORT_SORTS:
+        return DEFAULT_SORT, False
+    return key, descending
+
+def parse_per_page(value):
+    try:
+        per_page = int(value)
+    except (TypeError, ValueError):
+        return DEFAULT_PER_PAGE
+    return max(1, min(per_page, MAX_PER_PAGE))
+
+def keyset_page(qs, keys, descending, after, per_page):
+    values = cursor_values(qs, keys, after)
+    if values is not None:
+        qs = qs.filter(keyset_filter(keys, values, descending))
+    qs = qs.order_by(*[f'-{k}' if descending else k for k in keys])
+
+    rows     = list(qs[:per_page + 1])
+    has_next = len(rows) > per_page
+    rows     = rows[:per_page]
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, k) for k in keys])
+
+    return {
+        'rows':        rows,
+        'per_page':    per_page,
+        'next_cursor': next_cursor,
+        'is_first':    values is None,
+    }
+
+
+# ── trainee progress report ──────────────────────────────
+
+def trainee_report_queryset():
+    # one row per trainee, joined to the summary of the track they are on
+    return (
+        User.objects.filter(role='trainee')
+        .annotate(
+            current=FilteredRelation('summaries', condition=Q(summaries__track_id=F('selected_track'))),
+        )
+        .annotate(
+            completed=Coalesce('current__completed_courses', Value(0)),
+            track_key=Coalesce('selected_track', Value('')),
+        )
+        .annotate(overall=overall_expression(F('completed'), 'selected_track'))
+    )
+
+def trainee_report(sort=None, after=None, per_page=None):
+    key, descending = parse_sort(sort)
+    report = keyset_page(trainee_report_queryset(), REPORT_SORTS[key], descending, after, parse_per_page(per_page))
+    report['sort'] = f'-{key}' if descending else key
+    return report
+
+
+# ── user directory ───────────────────────────────────────
+
+USER_ROLES = ('admin', 'trainee')
+NO_TRACK   = 'none'
+
+def search_filter(query):
+    # Prefix matches only, so each lower(...) LIKE 'term%' can use the
+    # text_pattern_ops expression indexes from migration 0006 (PostgreSQL).
+    # "ada lov" means first name "ada…" and last name "lov…".
+    terms = (query or '').lower().split()
+    if not terms:
+        return Q()
+    if len(terms) == 1:
+        return (Q(email_lc__startswith=terms[0]) |
+                Q(first_lc__startswith=terms[0]) |
+                Q(last_lc__startswith=terms[0]))
+    return Q(first_lc__startswith=terms[0], last_lc__startswith=' '.join(terms[1:]))
+
+def user_directory_queryset(query=None, role=None, track=None):
+    qs = (
+        User.objects
+        .annotate(email_lc=Lower('email'), first_lc=Lower('first_name'), last_lc=Lower('last_name'))
+        .filter(search_filter(query))
+    )
+    if role in USER_ROLES:
+        qs = qs.filter(role=role)
+    if track == NO_TRACK:
+        qs = qs.filter(role='trainee', selected_track__isnull=True)
+    elif track in CATALOG:
+        qs = qs.filter(selected_track=track)
+    return qs
+
+def user_directory(query=None, role=None, track=None, after=None, per_page=None):
+    # email is unique, so it is a complete keyset on its own
+    qs   = user_directory_queryset(query, role, track)
+    page = keyset_page(qs, ('email',), False, after, parse_per_page(per_page))
+    page.update(query=query or '', role=role if role in USER_ROLES else '',
+                track=track if track == NO_TRACK or track in CATALOG else '')
+    return page
+
+def user_counts():
+    return User.objects.aggregate(
+        total=Count('id'),
+        trainees=Count('id', filter=Q(role='trainee')),
+    )
@@ -0,0 +1,187 @@
+from collections import Counter, defaultdict
+from django.db import connection, transaction
+from django.db.models import Count, Q, Sum
+from .catalog import CATALOG
+from .models import ModuleRollup, ModuleScoreBucket, Progress, ProgressEvent, TrackRollup, User
+
+
+BUCKETS = 10
+
+
+def score_bucket(score):
+    return min(int(score // 10), BUCKETS - 1) if score > 0 else 0
+
+
+# ── incremental maintenance ──────────────────────────────
+# Called inside the progress write transaction with the deltas that write
+# produced. Rows are touched in key order so concurrent writers always
+# lock shared rollup rows in the same order.
+
+DONE_COUNTS = """
+    SELECT module_index, COUNT(*) FROM ncbw_progress
+    WHERE user_id = %s AND track_id = %s AND module_index IN ({placeholders})
+      AND course_index IS NOT NULL AND completed
+    GROUP BY module_index
+"""
+
+MODULE_UPSERT = """
+    INSERT INTO ncbw_module_rollup
+        (track_id, module_index, learners, finishers, course_completions, quiz_takers, quiz_passers, quiz_attempts)
+    VALUES {values}
+    ON CONFLICT (track_id, module_index)
+    DO UPDATE SET
+        learners           = ncbw_module_rollup.learners + EXCLUDED.learners,
+        finishers          = ncbw_module_rollup.finishers + EXCLUDED.finishers,
+        course_completions = ncbw_module_rollup.course_completions + EXCLUDED.course_completions,
+        quiz_takers        = ncbw_module_rollup.quiz_takers + EXCLUDED.quiz_takers,
+        quiz_passers       = ncbw_module_rollup.quiz_passers + EXCLUDED.quiz_passers,
+        quiz_attempts      = ncbw_module_rollup.quiz_attempts + EXCLUDED.quiz_attempts
+"""
+MODULE_VALUES = '(%s, %s, %s, %s, %s, %s, %s, %s)'
+
+BUCKET_UPSERT = """
+    INSERT INTO ncbw_module_score_bucket (track_id, module_index, bucket, attempts)
+    VALUES {values}
+    ON CONFLICT (track_id, module_index, bucket)
+    DO UPDATE SET attempts = ncbw_module_score_bucket.attempts + EXCLUDED.attempts
+"""
+BUCKET_VALUES = '(%s, %s, %s, %s)'
+
+ENROLL_UPSERT = """
+    INSERT INTO ncbw_track_rollup (track_id, enrolled) VALUES (%s, %s)
+    ON CONFLICT (track_id) DO UPDATE SET enrolled = ncbw_track_rollup.enrolled + EXCLUDED.enrolled
+"""
+
+
+def _placeholders(n):
+    return ', '.join(['%s'] * n)
+
+def record_rollups(cursor, user_id, track_id, completed, scores, first_attempts, first_passes):
+    # completed: Counter {module_index: newly completed courses}
+    # scores:    {module_index: [attempt scores]}
+    modules = sorted(set(completed) | set(scores))
+    if not modules:
+        return
+
+    learners, finishers = Counter(), Counter()
+    if completed:
+        db_user = Progress._meta.get_field('user').get_db_prep_value(user_id, connection)
+        cursor.execute(DONE_COUNTS.format(placeholders=_placeholders(len(completed))),
+                       [db_user, track_id] + sorted(completed))
+        for module_index, done in cursor.fetchall():
+            before = done - completed[module_index]
+            total  = CATALOG.course_count(track_id, module_index)
+            learners[module_index]  = int(before == 0 and done > 0)
+            finishers[module_index] = int(before < total <= done)
+
+    params = []
+    for mi in modules:
+        params += [track_id, mi, learners[mi], finishers[mi], completed[mi],
+                   int(mi in first_attempts), int(mi in first_passes), len(scores.get(mi, ()))]
+    cursor.execute(MODULE_UPSERT.format(values=', '.join([MODULE_VALUES] * len(modules))), params)
+
+    buckets = Counter((mi, score_bucket(score)) for mi, attempts in scores.items() for score in attempts)
+    if buckets:
+        params = []
+        for (mi, bucket), attempts in sorted(buckets.items()):
+            params += [track_id, mi, bucket, attempts]
+        cursor.execute(BUCKET_UPSERT.format(values=', '.join([BUCKET_VALUES] * len(buckets))), params)
+
+def record_enrollment(track_id, delta=1):
+    with connection.cursor() as cursor:
+        cursor.execute(ENROLL_UPSERT, [track_id, delta])
+
+
+# ── reads ────────────────────────────────────────────────
+
+def track_funnel(track_id):
+    track    = CATALOG.track(track_id)
+    enrolled = TrackRollup.objects.filter(track_id=track_id).values_list('enrolled', flat=True).first() or 0
+    rollups  = {r.module_index: r for r in ModuleRollup.objects.filter(track_id=track_id)}
+    buckets  = defaultdict(lambda: [0] * BUCKETS)
+    for b in ModuleScoreBucket.objects.filter(track_id=track_id):
+        buckets[b.module_index][b.bucket] = b.attempts
+
+    modules = []
+    for module in track.modules:
+        r = rollups.get(module.index) or ModuleRollup(track_id=track_id, module_index=module.index)
+        histogram = buckets[module.index]
+        peak      = max(histogram) or 1
+        modules.append({
+            'module':         module,
+            'rollup':         r,
+            'started_pct':    int(r.learners / enrolled * 100) if enrolled else 0,
+            'finished_pct':   int(r.finishers / enrolled * 100) if enrolled else 0,
+            'pass_rate':      int(r.quiz_passers / r.quiz_takers * 100) if r.quiz_takers else None,
+            'avg_attempts':   round(r.quiz_attempts / r.quiz_takers, 1) if r.quiz_takers else None,
+            'histogram':      [{'bucket': i * 10, 'attempts': n, 'height': int(n / peak * 100)}
+                               for i, n in enumerate(histogram)],
+        })
+    return {'track': track, 'enrolled': enrolled, 'modules': modules}
+
+
+# ── full rebuild ─────────────────────────────────────────
+
+def _on_tracks(queryset, tracks, field='track_id'):
+    return queryset if tracks is None else queryset.filter(**{f'{field}__in': tracks})
+
+def rebuild_rollups(chunk_size=2000, tracks=None):
+    # tracks: recompute only these tracks' rows (None = every track)
+    users    = _on_tracks(User.objects.all(), tracks, 'selected_track')
+    progress = _on_tracks(Progress.objects.all(), tracks)
+    events   = _on_tracks(ProgressEvent.objects.all(), tracks)
+
+    enrolled = (
+        users.filter(role='trainee', selected_track__isnull=False)
+        .values_list('selected_track').annotate(n=Count('id')).order_by()
+    )
+
+    modules = defaultdict(Counter)
+    done_per_user = (
+        progress.filter(course_index__isnull=False, completed=True)
+        .values_list('track_id', 'module_index', 'user_id').annotate(done=Count('id'))
+        .order_by()
+    )
+    for track_id, mi, _, done in done_per_user.iterator(chunk_size=chunk_size):
+        m = modules[track_id, mi]
+        m['learners']           += 1
+        m['finishers']          += int(done >= CATALOG.course_count(track_id, mi))
+        m['course_completions'] += done
+
+    quizzes = (
+        progress.filter(course_index__isnull=True)
+        .values_list('track_id', 'module_index')
+        .annotate(
+            takers=Count('id', filter=Q(quiz_attempts__gt=0)),
+            passers=Count('id', filter=Q(quiz_passed=True)),
+            attempts=Sum('quiz_attempts'),
+        )
+        .order_by()
+    )
+    for track_id, mi, takers, passers, attempts in quizzes:
+        m = modules[track_id, mi]
+        m['quiz_takers'], m['quiz_passers'], m['quiz_attempts'] = takers, passers, attempts or 0
+
+    # every attempt's score is only kept in the event log (attempts from
+    # before the log carry their trainee's best score)
+    buckets = Counter()
+    attempts = (
+        events.filter(course_index__isnull=True, score__isnull=False)
+        .values_list('track_id', 'module_index', 'score')
+    )
+    for track_id, mi, score in attempts.iterator(chunk_size=chunk_size):
+        buckets[track_id, mi, score_bucket(score)] += 1
+
+    with transaction.atomic():
+        _on_tracks(TrackRollup.objects.all(), tracks).delete()
+        _on_tracks(ModuleRollup.objects.all(), tracks).delete()
+        _on_tracks(ModuleScoreBucket.objects.all(), tracks).delete()
+        TrackRollup.objects.bulk_create([TrackRollup(track_id=t, enrolled=n) for t, n in enrolled])
+        ModuleRollup.objects.bulk_create([
+            ModuleRollup(track_id=t, module_index=mi, **counts) for (t, mi), counts in modules.items()
+        ], batch_size=chunk_size)
+        ModuleScoreBucket.objects.bulk_create([
+            ModuleScoreBucket(track_id=t, module_index=mi, bucket=b, attempts=n)
+            for (t, mi, b), n in buckets.items()
+        ], batch_size=chunk_size)
+    return len(modules)
@@ -0,0 +1,170 @@
+import logging
+import time
+from contextvars import ContextVar
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, InterfaceError, OperationalError, connections
+
+
+logger = logging.getLogger(__name__)
+
+PIN_CACHE_PREFIX = 'ncbw:primary:'
+
+
+# ── per-request state ────────────────────────────────────
+# read_alias is set by @read_replica for the views that may read from the
+# replica; any write to an ncbw table clears it, so the rest of that request
+# reads its own writes, and marks the request so the middleware can pin the
+# session to the primary for NCBW_REPLICA_PIN_SECONDS.
+
+class _DBState:
+    __slots__ = ('read_alias', 'wrote')
+
+    def __init__(self):
+        self.read_alias = None
+        self.wrote      = False
+
+_state = ContextVar('ncbw_db_state', default=None)
+
+def current_read_alias():
+    state = _state.get()
+    return state.read_alias if state is not None else None
+
+
+class ReplicaRouter:
+    # sessions, auth etc. always stay on the primary
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or state.read_alias is None or model._meta.app_label != 'ncbw':
+            return None
+        return state.read_alias
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None and model._meta.app_label == 'ncbw':
+            state.wrote      = True
+            state.read_alias = None
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # the replica gets its schema from the primary
+        return False if db == replica_alias() else None
+
+
+# ── replica health ───────────────────────────────────────
+
+_down_until = 0.0
+
+def replica_alias():
+    return getattr(settings, 'NCBW_REPLICA_DATABASE', None)
+
+def mark_replica_down(alias):
+    global _down_until
+    _down_until = time.monotonic() + getattr(settings, 'NCBW_REPLICA_RETRY_SECONDS', 30)
+    logger.warning('Replica %r unavailable; reading from the primary for now', alias, exc_info=True)
+    connections[alias].close()
+
+def healthy_replica():
+    alias = replica_alias()
+    if not alias or time.monotonic() < _down_until:
+        return None
+    try:
+        connections[alias].ensure_connection()
+    except (OperationalError, InterfaceError):
+        mark_replica_down(alias)
+        return None
+    return alias
+
+def replica_status():
+    alias = replica_alias()
+    return {'alias': alias, 'down': bool(alias) and time.monotonic() < _down_until}
+
+
+# ── read-your-writes pin ─────────────────────────────────
+
+def _pin_key(session_key):
+    return f'{PIN_CACHE_PREFIX}{session_key}'
+
+def is_pinned(request):
+    session_key = request.session.session_key
+    return bool(session_key) and cache.get(_pin_key(session_key)) is not None
+
+def _pin_args(request, state):
+    session_key = request.session.session_key
+    if not state.wrote or not session_key:
+        return None
+    return _pin_key(session_key), True, getattr(settings, 'NCBW_REPLICA_PIN_SECONDS', 5)
+
+
+class ReplicaPinMiddleware:
+    # Goes after SessionMiddleware. Async-capable for the JSON API, where
+    # the writes happen in sync_to_async threads that share this state.
+    sync_capable  = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_alias():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = _DBState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        pin = _pin_args(request, state)
+        if pin:
+            cache.set(*pin)
+        return response
+
+    async def __acall__(self, request):
+        state = _DBState()
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        pin = _pin_args(request, state)
+        if pin:
+            await cache.aset(*pin)
+        return response
+
+
+def read_replica(view):
+    # For GET views that only read: their ncbw queries go to the replica
+    # unless this session wrote recently or the replica is down. A replica
+    # that fails mid-request is marked down and the view re-run on the primary.
+    def wrapper(request, *args, **kwargs):
+        state = _state.get()
+        token = None
+        if state is None:
+            state = _DBState()
+            token = _state.set(state)
+        try:
+            state.read_alias = None if is_pinned(request) else healthy_replica()
+            alias = state.read_alias
+            try:
+                return view(request, *args, **kwargs)
+            except (OperationalError, InterfaceError):
+                if alias is None or state.read_alias != alias:
+                    raise
+                mark_replica_down(alias)
+                state.read_alias = None
+                return view(request, *args, **kwargs)
+        finally:
+            state.read_alias = None
+            if token is not None:
+                _state.reset(token)
+    wrapper.__name__ = view.__name__
+    return wrapper
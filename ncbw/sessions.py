@@ -0,0 +1,91 @@
+from django.conf import settings
+from django.contrib.sessions.backends import cached_db
+from django.contrib.sessions.backends.base import VALID_KEY_CHARS
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+
+# ── session store ────────────────────────────────────────
+# Django's cached_db store (read from SESSION_CACHE_ALIAS, fall back to and
+# write through to django_session) with two writes taken out:
+#  - a save whose data is byte-for-byte what was loaded is skipped, so code
+#    that re-sets a key to the value it already had costs nothing;
+#  - a new key isn't checked with exists() first; the INSERT that creates
+#    the row already rejects a clash and create() retries with another key.
+
+class SessionStore(cached_db.SessionStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._stored = None     # serialized data as last loaded or saved
+
+    def _snapshot(self, data):
+        return self.serializer().dumps(data)
+
+    def load(self):
+        data = super().load()
+        if data:
+            self._stored = self._snapshot(data)
+        return data
+
+    def save(self, must_create=False):
+        unchanged = (not must_create and self.session_key is not None and self._stored is not None
+                     and self._snapshot(self._session) == self._stored)
+        if unchanged:
+            return
+        super().save(must_create)
+        self._stored = self._snapshot(self._get_session(no_load=True))
+
+    def flush(self):
+        super().flush()
+        self._stored = None
+
+    def _get_new_session_key(self):
+        return get_random_string(32, VALID_KEY_CHARS)
+
+
+# ── session file cache ───────────────────────────────────
+# FileBasedCache culls on every set(): it lists the whole cache directory to
+# count the entries, so with tens of thousands of sessions every login and
+# session write paid for a directory scan. This one never culls on a write;
+# expire_sessions sweeps out expired files (and culls down to MAX_ENTRIES if
+# it's still over) from cron instead.
+
+class SessionFileCache(FileBasedCache):
+    def _cull(self):
+        pass
+
+    def sweep(self):
+        removed = 0
+        for fname in self._list_cache_files():
+            try:
+                with open(fname, 'rb') as f:
+                    removed += self._is_expired(f)    # deletes the file if it is
+            except FileNotFoundError:
+                pass
+        super()._cull()
+        return removed
+
+
+# ── expiry ───────────────────────────────────────────────
+# clearsessions deletes every expired row in one statement; this takes them
+# a chunk at a time so a big backlog never holds a long lock. The cached
+# copies go with their rows, so an expired session can't outlive its row in
+# the cache.
+
+def expire_sessions(chunk_size=5000, now=None):
+    now     = now or timezone.now()
+    cache   = caches[settings.SESSION_CACHE_ALIAS]
+    expired = Session.objects.filter(expire_date__lt=now).order_by()
+    removed = 0
+    while True:
+        keys = list(expired.values_list('session_key', flat=True)[:chunk_size])
+        if not keys:
+            break
+        removed += Session.objects.filter(session_key__in=keys).delete()[0]
+        cache.delete_many([SessionStore.cache_key_prefix + key for key in keys])
+    if isinstance(cache, SessionFileCache):
+        cache.sweep()
+    return removed
@@ -0,0 +1,82 @@
+import itertools
+from django.conf import settings
+from django.utils import timezone
+from ncbw.catalog import CATALOG
+from ncbw.models import User, Progress, ProgressSummary
+from ncbw.progress import PASS_MARK, overall_percent
+from ncbw.quiz import open_attempt, start_attempt
+from ncbw.passwords import hash_password
+
+
+PASSWORD = 'Passw0rd!'
+
+_sequence = itertools.count()
+_hashes   = {}
+
+
+def hashed(password):
+    # hashing at the real cost is slow; one hash per password and cost is enough here
+    key = (password, settings.NCBW_PASSWORD_ITERATIONS)
+    if key not in _hashes:
+        _hashes[key] = hash_password(password)
+    return _hashes[key]
+
+
+def make_user(role='trainee', selected_track='president', **fields):
+    n = next(_sequence)
+    fields.setdefault('email', f'user{n}@example.org')
+    fields.setdefault('first_name', f'First{n}')
+    fields.setdefault('last_name', f'Last{n}')
+    return User.objects.create(
+        password=hashed(fields.pop('password', PASSWORD)),
+        role=role,
+        selected_track=selected_track if role == 'trainee' else None,
+        **fields,
+    )
+
+def make_admin(**fields):
+    return make_user(role='admin', **fields)
+
+def make_progress(user, track_id=None, courses=3, quiz_scores=()):
+    # completes the first `courses` courses of the track in catalog order and
+    # records one quiz row per score, module by module
+    track_id = track_id or user.selected_track
+    track    = CATALOG.track(track_id)
+    now      = timezone.now()
+    rows     = [
+        Progress(user=user, track_id=track_id, module_index=c.module_index, course_index=c.index,
+                 completed=True, completed_at=now)
+        for c in [c for m in track.modules for c in m.courses][:courses]
+    ]
+    rows += [
+        Progress(user=user, track_id=track_id, module_index=mi, course_index=None,
+                 quiz_score=score, quiz_passed=score >= PASS_MARK, quiz_attempts=1)
+        for mi, score in enumerate(quiz_scores)
+    ]
+    Progress.objects.bulk_create(rows)
+    ProgressSummary.objects.update_or_create(
+        user=user, track_id=track_id,
+        defaults={
+            'completed_courses': courses,
+            'passed_quizzes':    sum(score >= PASS_MARK for score in quiz_scores),
+            'overall':           overall_percent(track_id, courses),
+            'last_activity':     now,
+        },
+    )
+    return rows
+
+def make_cohort(size, courses=5, quiz_scores=(80, 50)):
+    users = [make_user() for _ in range(size)]
+    for user in users:
+        make_progress(user, courses=courses, quiz_scores=quiz_scores)
+    return users
+
+def answer_quiz(user, track_id, module_index, right=None):
+    # starts an attempt and answers the first `right` questions correctly
+    # (all of them by default) and the rest wrongly
+    token, questions = start_attempt(user.id, track_id, module_index)
+    key     = CATALOG.module(track_id, module_index).quiz.answer_key
+    picked  = open_attempt(token, user.id).picked
+    right   = len(picked) if right is None else right
+    answers = [key[q] if i < right else (key[q] + 1) % len(questions[i]['choices']) for i, q in enumerate(picked)]
+    return {'token': token, 'answers': answers}
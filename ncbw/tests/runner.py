@@ -0,0 +1,34 @@
+import shutil
+import tempfile
+from django.conf import settings
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+from django.utils.module_loading import import_string
+from ncbw.sessions import SessionFileCache
+
+
+# Password hashing cost for test runs. Every test login hashes once (and
+# re-hashes a factory-made hash to the current cost), so at the deployed
+# cost hashing alone would take most of the run's time.
+PASSWORD_ITERATIONS = 1000
+
+
+class TestRunner(DiscoverRunner):
+    # Settings a test run shouldn't share with the deployment: session files
+    # go to a temporary directory that is removed afterwards, rather than
+    # into (and out of) the live .cache/sessions/, and passwords are hashed
+    # at PASSWORD_ITERATIONS (test_login covers the configured cost).
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._session_dir = tempfile.mkdtemp(prefix='ncbw-sessions-')
+        caches = dict(settings.CACHES)
+        if issubclass(import_string(caches['sessions']['BACKEND']), SessionFileCache):
+            caches['sessions'] = {**caches['sessions'], 'LOCATION': self._session_dir}
+        self._overrides = override_settings(CACHES=caches, NCBW_PASSWORD_ITERATIONS=PASSWORD_ITERATIONS)
+        self._overrides.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._overrides.disable()
+        shutil.rmtree(self._session_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
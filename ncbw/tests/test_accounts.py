@@ -0,0 +1,84 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from ncbw.accounts import deactivate_users, purge_users
+from ncbw.models import ModuleRollup, Progress, ProgressEvent, ProgressSummary, TrackRollup, User
+from ncbw.progress import apply_progress
+from ncbw.rollups import record_enrollment
+from .factories import PASSWORD, make_admin, make_cohort, make_user
+
+
+class PurgeUsersTests(TestCase):
+    def setUp(self):
+        self.cohort = make_cohort(5, courses=4, quiz_scores=(80,))
+        self.keeper = make_user()
+        apply_progress(self.cohort[0].id, 'president', completions=[(1, 0)])
+        record_enrollment('president', 6)
+
+    def test_removes_users_and_everything_hanging_off_them(self):
+        with CaptureQueriesContext(connection) as queries:
+            removed = purge_users(User.objects.filter(id__in=[u.id for u in self.cohort]), chunk_size=2)
+        self.assertEqual(removed['ncbw_user'], 5)
+        self.assertEqual(removed['ncbw_progress'], 5 * 5 + 1)
+        self.assertEqual(removed['ncbw_progress_summary'], 5)
+        self.assertEqual(removed['ncbw_progress_event'], 1)
+        self.assertFalse(Progress.objects.exclude(user=self.keeper).exists())
+        self.assertFalse(ProgressEvent.objects.exists() or ProgressSummary.objects.exclude(user=self.keeper).exists())
+        self.assertTrue(User.objects.filter(id=self.keeper.id).exists())
+        self.assertEqual(TrackRollup.objects.get(track_id='president').enrolled, 1)
+        # progress rows are deleted by set, never selected into Python; the
+        # rollup rebuild afterwards only reads per-module aggregates of them
+        self.assertFalse([q for q in queries.captured_queries if q['sql'].startswith('SELECT')
+                          and 'FROM "ncbw_progress" ' in q['sql'] and 'GROUP BY' not in q['sql']])
+
+    def test_rollups_are_rebuilt_for_the_tracks_purged_from(self):
+        # accounts given a track without select_track were never counted in
+        # the enrolment rollup, so purging them mustn't take them off it
+        TrackRollup.objects.all().delete()
+        record_enrollment('president', 1)
+        record_enrollment('vice-president', 3)
+        apply_progress(self.keeper.id, 'president', completions=[(1, 0)])
+        purge_users(User.objects.filter(id__in=[u.id for u in self.cohort]))
+
+        self.assertEqual(TrackRollup.objects.get(track_id='president').enrolled, 1)
+        self.assertEqual(TrackRollup.objects.get(track_id='vice-president').enrolled, 3)   # not touched
+        self.assertEqual(list(ModuleRollup.objects.filter(track_id='president')
+                              .values_list('module_index', 'learners', 'course_completions')), [(1, 1, 1)])
+
+    def test_deactivated_trainee_is_signed_out_and_cannot_log_in(self):
+        trainee = self.cohort[0]
+        self.client.post(reverse('login'), {'email': trainee.email, 'password': PASSWORD})
+        self.assertEqual(deactivate_users(User.objects.filter(id=trainee.id)), 1)
+        self.assertRedirects(self.client.get(reverse('dashboard')), reverse('login'))
+        response = self.client.post(reverse('login'), {'email': trainee.email, 'password': PASSWORD})
+        self.assertContains(response, 'deactivated')
+        self.assertEqual(Progress.objects.filter(user=trainee).count(), 6)
+
+    def test_deactivated_admin_loses_access(self):
+        admin = make_admin()
+        self.client.post(reverse('login'), {'email': admin.email, 'password': PASSWORD})
+        self.assertEqual(self.client.get(reverse('admin_users')).status_code, 200)
+        User.objects.filter(id=admin.id).update(is_active=False)
+        response = self.client.post(reverse('admin_bulk_users'), {'action': 'delete', 'user_ids': [str(self.keeper.id)]})
+        self.assertRedirects(response, reverse('login'))
+        self.assertTrue(User.objects.filter(id=self.keeper.id).exists())
+
+    def test_bulk_action_never_touches_admins(self):
+        admin = make_admin()
+        self.client.post(reverse('login'), {'email': admin.email, 'password': PASSWORD})
+        response = self.client.post(reverse('admin_bulk_users'), {
+            'action': 'delete', 'user_ids': [str(self.cohort[1].id), str(admin.id), 'not-a-uuid'],
+        })
+        self.assertRedirects(response, reverse('admin_users'), fetch_redirect_response=False)
+        self.assertTrue(User.objects.filter(id=admin.id).exists())
+        self.assertFalse(User.objects.filter(id=self.cohort[1].id).exists())
+
+    def test_command(self):
+        out = StringIO()
+        call_command('purge_users', '--track', 'president', '--dry-run', stdout=out)
+        self.assertIn('6 trainees match', out.getvalue())
+        call_command('purge_users', '--track', 'president', '--chunk-size', '4', stdout=out)
+        self.assertFalse(User.objects.filter(role='trainee').exists())
@@ -0,0 +1,66 @@
+import json
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.urls import reverse
+from ncbw.models import Progress, User
+from .factories import PASSWORD, answer_quiz, make_user
+
+
+class AsyncApiTests(TestCase):
+    # the JSON API views are async; drive them the way ASGI would
+    def setUp(self):
+        self.trainee = make_user()
+
+    async def post_json(self, name, body):
+        return await self.async_client.post(reverse(name), json.dumps(body), content_type='application/json')
+
+    async def test_requires_login(self):
+        response = await self.post_json('mark_complete', {'track_id': 'president', 'module_index': 0, 'course_index': 0})
+        self.assertRedirects(response, reverse('login'), fetch_redirect_response=False)
+
+    async def test_mark_complete_and_submit_quiz(self):
+        await self.async_client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+
+        response = await self.post_json('mark_complete', {'track_id': 'president', 'module_index': 0, 'course_index': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(await Progress.objects.filter(user=self.trainee, course_index=1, completed=True).aexists())
+
+        response = await self.post_json('submit_quiz', await sync_to_async(answer_quiz)(self.trainee, 'president', 0))
+        self.assertEqual(json.loads(response.content)['passed'], True)
+
+        response = await self.post_json('progress_batch', {
+            'track_id': 'president', 'completions': [{'module_index': 0, 'course_index': 2}],
+        })
+        self.assertEqual(json.loads(response.content)['modules']['0']['courses']['2'], {'completed': True})
+
+    async def test_deactivated_or_deleted_trainee_is_signed_out(self):
+        body = {'track_id': 'president', 'module_index': 0, 'course_index': 0}
+        for retire in ('deactivate', 'delete'):
+            trainee = await sync_to_async(make_user)()
+            await self.async_client.post(reverse('login'), {'email': trainee.email, 'password': PASSWORD})
+            self.assertEqual((await self.post_json('mark_complete', body)).status_code, 200)
+            if retire == 'deactivate':
+                await User.objects.filter(id=trainee.id).aupdate(is_active=False)
+            else:
+                await trainee.adelete()
+
+            response = await self.post_json('mark_complete', {**body, 'course_index': 1})
+            self.assertRedirects(response, reverse('login'), fetch_redirect_response=False)
+            self.assertFalse(await Progress.objects.filter(user_id=trainee.id, course_index=1).aexists())
+            self.assertNotIn('user_id', await sync_to_async(lambda: dict(self.async_client.session))())
+
+    async def test_malformed_bodies_are_rejected(self):
+        await self.async_client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        bodies = [
+            '{not json', '[1, 2]', '"president"',
+            json.dumps({'track_id': 'president', 'course_index': 0}),
+            json.dumps({'track_id': 'president', 'module_index': 0, 'course_index': 'first'}),
+            json.dumps({'track_id': 'president', 'module_index': None, 'course_index': 0}),
+        ]
+        for name in ('mark_complete', 'submit_quiz', 'progress_batch'):
+            for body in bodies[:3] if name != 'mark_complete' else bodies:
+                with self.subTest(name=name, body=body):
+                    response = await self.async_client.post(reverse(name), body, content_type='application/json')
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(json.loads(response.content)['success'], False)
+        self.assertFalse(await Progress.objects.filter(user=self.trainee).aexists())
@@ -0,0 +1,100 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from django.conf import settings
+from django.test import SimpleTestCase
+from ncbw.catalog import SNAPSHOT_FORMAT, CatalogError, ReloadingCatalog, load_catalog
+
+
+def catalog_data(course_title='Intro'):
+    return {
+        'track_order': ['chair'],
+        'quiz_bank':   [{'prompt': 'Ready?', 'choices': ['Yes', 'No'], 'answer': 0}],
+        'tracks': {'chair': {'name': 'Chair', 'attributes': [{
+            'title': 'Basics',
+            'courses': [{'title': course_title, 'duration': '20 mins'}],
+            'quiz':    {'title': 'Basics quiz', 'duration': '10 mins'},
+        }]}},
+    }
+
+
+class CatalogLoadingTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir       = Path(tmp.name)
+        self.path      = self.dir / 'catalog.json'
+        self.snapshots = self.dir / 'snapshots'
+        self.write(catalog_data())
+
+    def write(self, data):
+        self.path.write_text(json.dumps(data))
+        # make sure the change is visible even on coarse mtime filesystems
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+
+    def test_shipped_catalog_compiles(self):
+        catalog = load_catalog(settings.NCBW_CATALOG_PATH)
+        self.assertIn('president', catalog)
+        self.assertEqual(len(catalog.version), 16)
+
+    def test_snapshot_is_keyed_by_content(self):
+        first = load_catalog(self.path, self.snapshots)
+        self.assertEqual([p.name for p in self.snapshots.iterdir()], [f'catalog-{SNAPSHOT_FORMAT}-{first.version}.pickle'])
+        again = load_catalog(self.path, self.snapshots)
+        self.assertEqual(again.version, first.version)
+        self.assertEqual(again.course('chair', 0, 0), first.course('chair', 0, 0))
+
+        self.write(catalog_data('Intro, revised'))
+        changed = load_catalog(self.path, self.snapshots)
+        self.assertNotEqual(changed.version, first.version)
+        self.assertEqual(changed.course('chair', 0, 0).title, 'Intro, revised')
+
+    def test_reload_on_change_keeps_last_good_catalog(self):
+        catalog = ReloadingCatalog(self.path, self.snapshots)
+        version = catalog.version
+
+        self.write({'track_order': ['chair'], 'tracks': {}})
+        with self.assertLogs('ncbw.catalog', 'ERROR'):
+            catalog.reload()
+        self.assertEqual(catalog.version, version)
+
+        self.write(catalog_data('Intro, revised'))
+        catalog.reload()
+        self.assertNotEqual(catalog.version, version)
+        self.assertEqual(catalog.course('chair', 0, 0).title, 'Intro, revised')
+        self.assertEqual([t.id for t in catalog], ['chair'])
+
+    def test_listeners_hear_about_new_versions(self):
+        catalog = ReloadingCatalog(self.path, self.snapshots)
+        heard   = []
+        catalog.on_change(lambda old, new: heard.append((old.version, new.version)))
+        catalog.reload()
+        self.assertEqual(heard, [])
+
+        first = catalog.version
+        self.write(catalog_data('Intro, revised'))
+        catalog.reload()
+        self.assertEqual(heard, [(first, catalog.version)])
+
+    def test_invalid_catalog(self):
+        self.write({'track_order': ['chair', 'chair'], 'tracks': catalog_data()['tracks']})
+        with self.assertRaises(CatalogError):
+            load_catalog(self.path)
+
+    def test_answer_keys_are_compiled(self):
+        data = catalog_data()
+        data['tracks']['chair']['attributes'][0]['quiz']['questions'] = [
+            {'prompt': 'One?', 'choices': ['a', 'b', 'c'], 'answer': 2},
+            {'prompt': 'Two?', 'choices': ['a', 'b'], 'answer': 1},
+        ]
+        self.write(data)
+        quiz = load_catalog(self.path).module('chair', 0).quiz
+        self.assertEqual((quiz.answer_key, quiz.sample), (bytes([2, 1]), 2))
+        self.assertEqual(quiz.questions[0].choices, ('a', 'b', 'c'))
+
+        data['tracks']['chair']['attributes'][0]['quiz']['questions'][1]['answer'] = 2
+        self.write(data)
+        with self.assertRaisesMessage(CatalogError, 'answer must be the index'):
+            load_catalog(self.path)
@@ -0,0 +1,96 @@
+import json
+from unittest import mock
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
+from django.test import TestCase
+from django.urls import reverse
+from ncbw.catalog import CATALOG, changed_tracks, compile_catalog
+from ncbw.models import Progress
+from ncbw.progress import get_summary, overall_percent, recount_summaries
+from ncbw.reports import trainee_report_queryset
+from .factories import PASSWORD, answer_quiz, make_progress, make_user
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.trainee = make_user()
+        make_progress(self.trainee, courses=2)
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        self.module_url = reverse('module_detail', args=['president', 0])
+
+    def revisit(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_repeat_visit_is_not_modified(self):
+        for url in (reverse('dashboard'), self.module_url):
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertIn('no-cache', first['Cache-Control'])
+
+            # user and summary (the session comes from its cache); no progress rows, no render
+            with self.assertNumQueries(2):
+                again = self.revisit(url, first['ETag'])
+            self.assertEqual(again.status_code, 304)
+            self.assertEqual(again['ETag'], first['ETag'])
+
+    def test_progress_write_changes_the_etag(self):
+        dashboard = self.client.get(reverse('dashboard'))['ETag']
+        module    = self.client.get(self.module_url)['ETag']
+        self.client.post(reverse('submit_quiz'), json.dumps(answer_quiz(self.trainee, 'president', 0)),
+                         content_type='application/json')
+
+        response = self.revisit(self.module_url, module)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Quiz passed')
+        self.assertEqual(self.revisit(reverse('dashboard'), dashboard).status_code, 200)
+
+    def test_etags_are_per_user(self):
+        etag  = self.client.get(reverse('dashboard'))['ETag']
+        other = self.client_class()
+        other.post(reverse('login'), {'email': make_user().email, 'password': PASSWORD})
+        self.assertEqual(other.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_catalog_fragments_are_shared_across_the_track(self):
+        cache.clear()
+        self.client.get(self.module_url)
+        key = make_template_fragment_key('module-header', [CATALOG.version, 'president', 0])
+        self.assertIn('Module 1', cache.get(key))
+
+        other = self.client_class()
+        other.post(reverse('login'), {'email': make_user().email, 'password': PASSWORD})
+        cache.set(key, '<p>from the fragment cache</p>')
+        self.assertContains(other.get(self.module_url), 'from the fragment cache')
+
+
+class CatalogChangeTests(TestCase):
+    # a reload that changes a track's courses moves every trainee's
+    # percentage without any of them writing
+    def setUp(self):
+        self.trainee = make_user()
+        make_progress(self.trainee, courses=4)      # the first four courses of module 0
+        data = json.loads(settings.NCBW_CATALOG_PATH.read_text())
+        for module in data['tracks']['president']['attributes']:
+            module['courses'] = module['courses'][:1]
+        self.smaller = compile_catalog(data['tracks'], data['track_order'], 'smaller', data['quiz_bank'])
+
+    def test_pages_and_report_follow_the_catalog(self):
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        before = self.client.get(reverse('dashboard'))
+        self.assertEqual(changed_tracks(CATALOG.current, self.smaller), ['president'])
+        with mock.patch.object(CATALOG, '_current', self.smaller):
+            # what the reload listener runs; only module 0's first course is left
+            self.assertEqual(recount_summaries(['president']), 1)
+            expected = overall_percent('president', 1)
+            after    = self.client.get(reverse('dashboard'), HTTP_IF_NONE_MATCH=before['ETag'])
+            self.assertEqual(after.status_code, 200)
+            self.assertEqual(after.context['overall'], expected)
+            row = trainee_report_queryset().get(id=self.trainee.id)
+            self.assertEqual(row.overall, expected)
+        self.assertNotEqual(expected, before.context['overall'])
+
+    def test_removed_courses_stop_counting(self):
+        Progress.objects.filter(user=self.trainee, course_index=0).delete()
+        with mock.patch.object(CATALOG, '_current', self.smaller):
+            recount_summaries(['president'])
+            self.assertEqual(get_summary(self.trainee, 'president').overall, 0)
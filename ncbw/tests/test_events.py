@@ -0,0 +1,68 @@
+import json
+from datetime import timedelta
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from ncbw.models import ModuleScoreBucket, Progress, ProgressEvent, ProgressSummary
+from ncbw.progress import apply_progress, compact_events, record_progress
+from .factories import PASSWORD, make_user
+
+
+def snapshot():
+    return (
+        sorted(Progress.objects.values_list(
+            'user_id', 'track_id', 'module_index', 'course_index',
+            'completed', 'completed_at', 'quiz_score', 'quiz_passed', 'quiz_attempts',
+        ), key=str),
+        sorted(ProgressSummary.objects.values_list(
+            'user_id', 'track_id', 'completed_courses', 'passed_quizzes', 'overall', 'last_activity',
+        ), key=str),
+    )
+
+
+class ProgressEventTests(TestCase):
+    def setUp(self):
+        self.ada, self.bob = make_user(), make_user()
+
+    def test_clicks_are_logged(self):
+        apply_progress(self.ada.id, 'president', completions=[(0, 0), (0, 0)], quiz_scores=[(0, 40), (0, 90)])
+        self.assertEqual(ProgressEvent.objects.filter(user=self.ada, compacted=True).count(), 4)
+        self.assertEqual(sorted(ProgressEvent.objects.exclude(score=None).values_list('score', flat=True)), [40, 90])
+
+    @override_settings(NCBW_DEFER_PROGRESS=True)
+    def test_deferred_clicks_are_compacted_once(self):
+        self.assertIsNone(record_progress(self.ada.id, 'president', completions=[(0, 1)]))
+        record_progress(self.ada.id, 'president', quiz_scores=[(0, 85)])
+        record_progress(self.bob.id, 'president', completions=[(0, 1), (0, 2)])
+        self.assertFalse(Progress.objects.exists())
+
+        self.assertEqual(compact_events(chunk_size=3), 4)
+        self.assertEqual(compact_events(), 0)
+        self.assertEqual(ProgressEvent.objects.count(), 4)
+        self.assertEqual(ProgressSummary.objects.get(user=self.bob).completed_courses, 2)
+        self.assertTrue(Progress.objects.get(user=self.ada, course_index=None).quiz_passed)
+
+    @override_settings(NCBW_DEFER_PROGRESS=True)
+    def test_deferred_trainee_sees_own_clicks(self):
+        self.client.post(reverse('login'), {'email': self.ada.email, 'password': PASSWORD})
+        response = self.client.post(reverse('mark_complete'), json.dumps({
+            'track_id': 'president', 'module_index': 0, 'course_index': 3,
+        }), content_type='application/json')
+        self.assertTrue(json.loads(response.content)['queued'])
+        response = self.client.get(reverse('module_detail', args=['president', 0]))
+        self.assertEqual(response.context['progress']['courses'], {3: {'completed': True}})
+
+    def test_rebuild_replays_the_log(self):
+        earlier = timezone.now() - timedelta(days=2)
+        apply_progress(self.ada.id, 'president', completions=[(0, 0), (0, 1)], now=earlier)
+        apply_progress(self.ada.id, 'president', completions=[(0, 1), (1, 0)], quiz_scores=[(0, 55)])
+        apply_progress(self.bob.id, 'president', quiz_scores=[(0, 95), (0, 15)])
+        apply_progress(self.ada.id, 'president', quiz_scores=[(0, 75)])
+        before = snapshot()
+
+        call_command('compact_progress', '--rebuild', '--chunk-size', '3', stdout=open('/dev/null', 'w'))
+        self.assertEqual(snapshot(), before)
+        self.assertEqual(Progress.objects.get(user=self.ada, module_index=0, course_index=1).completed_at, earlier)
+        buckets = dict(ModuleScoreBucket.objects.values_list('bucket', 'attempts'))
+        self.assertEqual(buckets, {1: 1, 5: 1, 7: 1, 9: 1})
@@ -0,0 +1,49 @@
+import csv
+import io
+import json
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from .factories import PASSWORD, make_admin, make_progress, make_user
+
+
+class ProgressExportTests(TestCase):
+    def setUp(self):
+        self.trainee = make_user(email='ada@example.org')
+        make_progress(self.trainee, courses=7, quiz_scores=(90, 40))
+        admin = make_admin()
+        self.client.post(reverse('login'), {'email': admin.email, 'password': PASSWORD})
+
+    def export(self, fmt):
+        response = self.client.get(reverse('admin_export'), {'format': fmt})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode()
+
+    def test_csv_has_one_row_per_module_touched(self):
+        rows = list(csv.DictReader(io.StringIO(self.export('csv'))))
+        self.assertEqual([r['module_index'] for r in rows], ['0', '1'])
+        self.assertEqual(rows[0]['courses_completed'], '5')
+        self.assertEqual(rows[0]['quiz_passed'], 'True')
+        self.assertEqual(rows[1]['courses_completed'], '2')
+        self.assertEqual(rows[1]['quiz_score'], '40.0')
+        self.assertEqual(rows[1]['track_overall'], '28')
+
+    def test_jsonl(self):
+        rows = [json.loads(line) for line in self.export('jsonl').splitlines()]
+        self.assertEqual(rows[0]['email'], 'ada@example.org')
+        self.assertEqual(rows[0]['courses_total'], 5)
+        self.assertIs(rows[1]['quiz_passed'], False)
+
+    def test_unknown_format(self):
+        self.assertEqual(self.client.get(reverse('admin_export'), {'format': 'xlsx'}).status_code, 400)
+
+    def test_trainees_cannot_export(self):
+        self.client.post(reverse('logout'))
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        self.assertRedirects(self.client.get(reverse('admin_export')), reverse('dashboard'), fetch_redirect_response=False)
+
+    def test_management_command(self):
+        out = io.StringIO()
+        call_command('export_progress', format='jsonl', stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
@@ -0,0 +1,80 @@
+from unittest import skipUnless
+from django.db import IntegrityError, connection
+from django.test import TestCase
+from ncbw.models import Progress, ProgressSummary, User
+from ncbw.progress import get_summary
+from ncbw.reports import trainee_report_queryset, user_directory_queryset
+from .factories import make_cohort, make_user
+
+
+class EmailUniquenessTests(TestCase):
+    def test_email_is_unique_regardless_of_case(self):
+        make_user(email='ada@example.org')
+        with self.assertRaises(IntegrityError):
+            User.objects.create(email='Ada@Example.org', first_name='A', last_name='L')
+
+
+@skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are PostgreSQL-specific')
+class HotPathIndexTests(TestCase):
+    # With sequential scans disabled the planner only falls back to one when
+    # no index can answer the query, so a Seq Scan in the plan means the
+    # query has lost its index.
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.trainee = make_cohort(40, courses=12, quiz_scores=(90, 40, 75))[0]
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('ANALYZE ncbw_progress')
+            cursor.execute('ANALYZE ncbw_user')
+
+    def assertUsesIndex(self, queryset, table, index=None):
+        plan = queryset.explain()
+        self.assertNotIn(f'Seq Scan on {table}', plan)
+        if index:
+            self.assertIn(index, plan)
+
+    def test_dashboard_summary_lookup(self):
+        self.assertUsesIndex(
+            ProgressSummary.objects.filter(user=self.trainee, track_id='president'),
+            'ncbw_progress_summary',
+        )
+        self.assertEqual(get_summary(self.trainee, 'president').completed_courses, 12)
+
+    def test_module_progress_lookup(self):
+        self.assertUsesIndex(
+            Progress.objects.filter(user=self.trainee, track_id='president', module_index=1),
+            'ncbw_progress',
+        )
+
+    def test_track_progress_lookup(self):
+        self.assertUsesIndex(Progress.objects.filter(user=self.trainee, track_id='president'), 'ncbw_progress')
+
+    def test_completed_course_count(self):
+        # ncbw_progress_done_courses, the unique_together index and the
+        # foreign key's user_id index can all answer this; which one wins
+        # is down to cost estimates that vary between PostgreSQL versions
+        self.assertUsesIndex(
+            Progress.objects.filter(user=self.trainee, track_id='president',
+                                    course_index__isnull=False, completed=True),
+            'ncbw_progress',
+        )
+
+    def test_quiz_rows_across_trainees(self):
+        self.assertUsesIndex(
+            Progress.objects.filter(track_id='president', module_index=2, course_index__isnull=True),
+            'ncbw_progress', index='ncbw_progress_quiz_rows',
+        )
+
+    def test_admin_report_joins_summaries_by_index(self):
+        self.assertUsesIndex(trainee_report_queryset().order_by('first_name', 'last_name', 'id')[:50],
+                             'ncbw_progress_summary')
+
+    def test_login_lookup(self):
+        self.assertUsesIndex(User.objects.filter(email=self.trainee.email), 'ncbw_user')
+
+    def test_user_search_by_prefix(self):
+        self.assertUsesIndex(user_directory_queryset('USER1'), 'ncbw_user', index='ncbw_user_email_prefix')
+        self.assertUsesIndex(user_directory_queryset('first3 last'), 'ncbw_user', index='ncbw_user_first_prefix')
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import threading
+from asgiref.sync import sync_to_async
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from ncbw.live import HUB, Hub, event_stream, sync_event_stream
+from .factories import PASSWORD, answer_quiz, make_admin, make_user
+
+
+def payload(frame):
+    return json.loads(frame.rsplit('data: ', 1)[1])
+
+
+class HubTests(SimpleTestCase):
+    async def test_one_frame_fans_out_to_every_subscriber(self):
+        hub  = Hub()
+        subs = [hub.subscribe() for _ in range(3)]
+        # publishers run on other threads (sync_to_async, write-behind)
+        thread = threading.Thread(target=hub.publish, args=('progress', {'n': 1}))
+        thread.start()
+        thread.join()
+        frames = [await asyncio.wait_for(s.get(), 1) for s in subs]
+        self.assertEqual(len(set(map(id, frames))), 1)
+        self.assertEqual(payload(frames[0]), {'n': 1})
+        self.assertEqual(hub.stats(), {'published': 1, 'delivered': 3, 'dropped': 0, 'subscribers': 3})
+
+    async def test_slow_subscriber_is_dropped_with_a_reset(self):
+        hub  = Hub()
+        slow = hub.subscribe(maxsize=2)
+        for n in range(3):
+            hub.publish('progress', {'n': n})
+        await asyncio.sleep(0)
+        frames = [f async for f in event_stream(slow)]
+        self.assertEqual([f.split('\n')[0] for f in frames[1:]], [f'id: {hub.epoch}-2', 'event: reset'])
+        self.assertEqual(hub.stats()['subscribers'], 0)
+
+    def test_threaded_subscriber_is_dropped_with_a_reset(self):
+        hub  = Hub()
+        slow = hub.subscribe(maxsize=2, threaded=True)
+        for n in range(3):
+            hub.publish('progress', {'n': n})
+        frames = list(sync_event_stream(slow))
+        self.assertEqual([f.split('\n')[0] for f in frames[1:]], [f'id: {hub.epoch}-2', 'event: reset'])
+        self.assertEqual(hub.stats()['subscribers'], 0)
+
+    async def test_reconnect_replays_missed_events(self):
+        hub = Hub(backlog=2)
+        for n in range(4):
+            hub.publish('progress', {'n': n})
+        caught_up = hub.subscribe(f'{hub.epoch}-2')
+        self.assertEqual([payload(caught_up.queue.get_nowait())['n'] for _ in range(2)], [2, 3])
+        too_late = hub.subscribe(f'{hub.epoch}-1')
+        self.assertIn('event: reset', too_late.queue.get_nowait())
+        self.assertTrue(hub.subscribe('old-epoch-3').queue.empty())
+
+
+class LiveFeedViewTests(TestCase):
+    def setUp(self):
+        self.trainee = make_user()
+
+    async def login(self, user):
+        await self.async_client.post(reverse('login'), {'email': user.email, 'password': PASSWORD})
+
+    async def test_admin_only(self):
+        await self.login(self.trainee)
+        response = await self.async_client.get(reverse('admin_live'))
+        self.assertRedirects(response, reverse('dashboard'), fetch_redirect_response=False)
+
+    async def test_writes_are_published(self):
+        watcher = HUB.subscribe()
+        self.addCleanup(watcher.close)
+        await self.login(self.trainee)
+        await self.async_client.post(reverse('mark_complete'), json.dumps(
+            {'track_id': 'president', 'module_index': 0, 'course_index': 1}), content_type='application/json')
+        await self.async_client.post(reverse('submit_quiz'), json.dumps(
+            await sync_to_async(answer_quiz)(self.trainee, 'president', 0)), content_type='application/json')
+
+        course, quiz = [payload(await asyncio.wait_for(watcher.get(), 1)) for _ in range(2)]
+        self.assertEqual(course['user'], f'{self.trainee.first_name} {self.trainee.last_name}')
+        self.assertEqual(course['completions'], [[0, 1]])
+        self.assertEqual(quiz['quizzes'], [[0, 100, True]])
+
+    async def test_admin_stream(self):
+        await self.login(await sync_to_async(make_admin)())
+        response = await self.async_client.get(reverse('admin_live'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+
+        HUB.publish('progress', {'user': 'Ada'})
+        frame = (await asyncio.wait_for(anext(stream), 1)).decode()
+        self.assertIn('event: progress', frame)
+        self.assertEqual(payload(frame), {'user': 'Ada'})
+
+        # a client disconnect cancels the request task mid-wait
+        waiting = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        self.assertEqual(HUB.stats()['subscribers'], 0)
+
+
+class LiveFeedWsgiTests(TransactionTestCase):
+    # Closing a streamed response fires request_finished, which closes the
+    # database connection the way the server would, so this can't run
+    # inside a TestCase's transaction.
+
+    @override_settings(NCBW_LIVE_HEARTBEAT=0.05)
+    def test_admin_stream_under_wsgi(self):
+        # the sync client goes through the WSGI-style handler: the body has
+        # to be a plain generator read on this thread, with no event loop
+        self.client.post(reverse('login'), {'email': make_admin().email, 'password': PASSWORD})
+        response = self.client.get(reverse('admin_live'))
+        stream   = iter(response.streaming_content)
+        self.assertEqual(next(stream), b'retry: 3000\n\n')
+        self.assertEqual(next(stream), b': keep-alive\n\n')
+
+        thread = threading.Thread(target=HUB.publish, args=('progress', {'user': 'Ada'}))
+        thread.start()
+        thread.join()
+        self.assertEqual(payload(next(stream).decode()), {'user': 'Ada'})
+
+        response.close()    # what the server does once the client has gone
+        self.assertEqual(HUB.stats()['subscribers'], 0)
@@ -0,0 +1,115 @@
+import hashlib
+from config import settings as project_settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from ncbw.models import User
+from ncbw.passwords import is_legacy_hash
+from ncbw.throttle import TokenBuckets, reset_login_throttles
+from .factories import PASSWORD, make_user
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_refills_evenly_and_caps_at_capacity(self):
+        clock   = Clock()
+        buckets = TokenBuckets(3, 30, clock=clock)
+        for _ in range(3):
+            self.assertEqual(buckets.wait('a'), 0)
+            buckets.take('a')
+        self.assertEqual(buckets.wait('a'), 10)
+        self.assertEqual(buckets.wait('b'), 0)
+
+        clock.now = 10
+        self.assertEqual(buckets.wait('a'), 0)
+        clock.now = 1000
+        for _ in range(3):
+            buckets.take('a')
+        self.assertEqual(buckets.wait('a'), 10)
+
+    def test_least_recently_used_keys_are_dropped(self):
+        buckets = TokenBuckets(1, 60, max_keys=2, clock=Clock())
+        for key in 'abc':
+            buckets.take(key)
+        self.assertEqual([buckets.wait(key) for key in 'abc'], [0, 60, 60])
+
+
+@override_settings(NCBW_PASSWORD_ITERATIONS=1000)
+class PasswordLoginTests(TestCase):
+    def login(self, email, password=PASSWORD):
+        return self.client_class().post(reverse('login'), {'email': email, 'password': password})
+
+    def test_legacy_sha256_hash_is_upgraded_on_login(self):
+        user = make_user(password='ignored')
+        User.objects.filter(id=user.id).update(password=hashlib.sha256(PASSWORD.encode()).hexdigest())
+
+        self.assertEqual(self.login(user.email, 'wrong').status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(is_legacy_hash(user.password))
+
+        self.assertRedirects(self.login(user.email), reverse('dashboard'), fetch_redirect_response=False)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertRedirects(self.login(user.email), reverse('dashboard'), fetch_redirect_response=False)
+
+    def test_legacy_hash_is_upgraded_at_the_configured_cost(self):
+        # the test runner lowers the cost; this one login pays the real one
+        iterations = project_settings.NCBW_PASSWORD_ITERATIONS
+        with override_settings(NCBW_PASSWORD_ITERATIONS=iterations):
+            user = make_user(password='ignored')
+            User.objects.filter(id=user.id).update(password=hashlib.sha256(PASSWORD.encode()).hexdigest())
+            self.assertRedirects(self.login(user.email), reverse('dashboard'), fetch_redirect_response=False)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith(f'pbkdf2_sha256${iterations}$'))
+
+    def test_changing_the_cost_rehashes_at_next_login(self):
+        user = make_user()
+        with override_settings(NCBW_PASSWORD_ITERATIONS=2000):
+            self.login(user.email)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$2000$'))
+
+    def test_salted(self):
+        a, b = make_user(password='same'), make_user(password='same')
+        self.client.post(reverse('signup'), {'email': 'new@example.org', 'password': 'same',
+                                             'first_name': 'New', 'last_name': 'User'})
+        hashes = [u.password for u in User.objects.filter(email__in=[a.email, b.email, 'new@example.org'])]
+        self.assertEqual(len(hashes), 3)
+        self.assertEqual(len({h.split('$')[2] for h in hashes}), 2)   # factories share one hash
+
+
+@override_settings(NCBW_LOGIN_THROTTLE_IP=(4, 60), NCBW_LOGIN_THROTTLE_ACCOUNT=(2, 60), NCBW_PASSWORD_ITERATIONS=1000)
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        reset_login_throttles()
+        self.addCleanup(reset_login_throttles)
+        self.user = make_user()
+
+    def login(self, email, password='wrong', ip='10.0.0.1'):
+        return self.client_class().post(reverse('login'), {'email': email, 'password': password}, REMOTE_ADDR=ip)
+
+    def test_account_is_throttled_before_the_database(self):
+        for _ in range(2):
+            self.assertEqual(self.login(self.user.email).status_code, 200)
+        with self.assertNumQueries(0):
+            response = self.login(self.user.email, PASSWORD)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+        # other accounts from another address are unaffected
+        self.assertEqual(self.login(make_user().email, PASSWORD, ip='10.0.0.2').status_code, 302)
+
+    def test_address_is_throttled_across_accounts(self):
+        for n in range(4):
+            self.login(f'nobody{n}@example.org')
+        self.assertEqual(self.login(self.user.email, PASSWORD).status_code, 429)
+        self.assertEqual(self.login(self.user.email, PASSWORD, ip='10.0.0.2').status_code, 302)
+
+    def test_successful_logins_are_free(self):
+        for _ in range(5):
+            self.assertEqual(self.login(self.user.email, PASSWORD).status_code, 302)
@@ -0,0 +1,74 @@
+import threading
+from django.test import SimpleTestCase
+from ncbw.pool import ConnectionPool, PoolTimeout
+
+
+class Conn:
+    def __init__(self):
+        self.closed  = False
+        self.healthy = True
+        self.clean   = True
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**config):
+    opened = []
+
+    def connect():
+        opened.append(Conn())
+        return opened[-1]
+    pool = ConnectionPool(connect, check=lambda c: c.healthy, reset=lambda c: c.clean,
+                          config={k.upper(): v for k, v in config.items()})
+    return pool, opened
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_reuses_returned_connections(self):
+        pool, opened = make_pool()
+        for _ in range(5):
+            pool.putconn(pool.getconn())
+        self.assertEqual(len(opened), 1)
+        stats = pool.stats()
+        self.assertEqual((stats['checkouts'], stats['connects'], stats['idle'], stats['in_use']), (5, 1, 1, 0))
+
+    def test_waits_for_a_free_connection_then_times_out(self):
+        pool, _ = make_pool(max_size=1, timeout=0.05)
+        conn = pool.getconn()
+        with self.assertRaises(PoolTimeout):
+            pool.getconn()
+
+        threading.Timer(0.01, pool.putconn, [conn]).start()
+        self.assertIs(pool.getconn(), conn)
+        stats = pool.stats()
+        self.assertEqual((stats['waits'], stats['timeouts']), (2, 1))
+
+    def test_unhealthy_or_dirty_connections_are_replaced(self):
+        pool, opened = make_pool(check_after=0)
+        conn = pool.getconn()
+        pool.putconn(conn)
+        conn.healthy = False
+        self.assertIsNot(pool.getconn(), conn)
+        self.assertTrue(conn.closed)
+
+        dirty = opened[-1]
+        dirty.clean = False
+        pool.putconn(dirty)
+        self.assertTrue(dirty.closed)
+        stats = pool.stats()
+        self.assertEqual((stats['failed_checks'], stats['discarded'], stats['size']), (1, 2, 0))
+
+    def test_failed_connect_frees_its_slot(self):
+        pool = ConnectionPool(lambda: 1 / 0, check=None, reset=None, config={'MAX_SIZE': 1, 'TIMEOUT': 0})
+        for _ in range(2):
+            with self.assertRaises(ZeroDivisionError):
+                pool.getconn()
+
+    def test_idle_connections_above_min_size_are_closed(self):
+        pool, _ = make_pool(min_size=1, max_idle=0)
+        conns = [pool.getconn() for _ in range(3)]
+        for conn in conns:
+            pool.putconn(conn)
+        self.assertEqual(pool.stats()['idle'], 1)
+        self.assertEqual(sum(c.closed for c in conns), 2)
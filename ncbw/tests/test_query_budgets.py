@@ -0,0 +1,86 @@
+import json
+from django.test import Client, TestCase
+from django.urls import reverse
+from .factories import PASSWORD, answer_quiz, make_admin, make_cohort, make_progress, make_user
+
+
+class QueryBudgetTestCase(TestCase):
+    # Every budget is checked against a small and a large chapter; a view
+    # that issues per-trainee or per-row queries fails the second check.
+    # Sessions are read from the session cache, so budgets only count the
+    # view's own queries (the JSON APIs' and admin pages' include checking
+    # the account is still active); writes include the SAVEPOINT and RELEASE that
+    # atomic() issues inside the test transaction. Requests get the run
+    # number so writes can record something new each time (the most
+    # expensive path, since it also moves the rollups).
+
+    cohort_sizes = (1, 25)
+
+    def setUp(self):
+        self.cohort = []
+
+    def login(self, user):
+        self.client.post(reverse('login'), {'email': user.email, 'password': PASSWORD})
+
+    def assertBudget(self, budget, request):
+        for run, size in enumerate(self.cohort_sizes):
+            with self.subTest(cohort=size):
+                self.cohort += make_cohort(size - len(self.cohort))
+                with self.assertNumQueries(budget):
+                    response = request(run)
+                self.assertLess(response.status_code, 400)
+
+
+class TraineeViewBudgetTests(QueryBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.trainee = make_user()
+        make_progress(self.trainee, courses=7, quiz_scores=(90, 40))
+        self.login(self.trainee)
+
+    def post_json(self, name, body):
+        return self.client.post(reverse(name), json.dumps(body), content_type='application/json')
+
+    def test_login(self):
+        self.assertBudget(4, lambda run: Client().post(
+            reverse('login'), {'email': self.trainee.email, 'password': PASSWORD}
+        ))
+
+    def test_dashboard(self):
+        self.assertBudget(2, lambda run: self.client.get(reverse('dashboard')))
+
+    def test_module_detail(self):
+        self.assertBudget(3, lambda run: self.client.get(reverse('module_detail', args=['president', 0])))
+
+    def test_mark_complete(self):
+        self.assertBudget(8, lambda run: self.post_json('mark_complete', {
+            'track_id': 'president', 'module_index': 2, 'course_index': run,
+        }))
+
+    def test_submit_quiz(self):
+        self.assertBudget(8, lambda run: self.post_json('submit_quiz', answer_quiz(self.trainee, 'president', 2 + run)))
+
+    def test_progress_batch(self):
+        self.assertBudget(11, lambda run: self.post_json('progress_batch', {
+            'track_id': 'president',
+            'completions': [{'module_index': 3 + run, 'course_index': i} for i in range(5)],
+            'quizzes': [answer_quiz(self.trainee, 'president', 3 + run), answer_quiz(self.trainee, 'president', 2, right=0)],
+        }))
+
+
+class AdminViewBudgetTests(QueryBudgetTestCase):
+    def setUp(self):
+        super().setUp()
+        self.login(make_admin())
+
+    def test_admin_dashboard(self):
+        self.assertBudget(3, lambda run: self.client.get(reverse('admin_dashboard')))
+
+    def test_admin_dashboard_sorted_by_progress(self):
+        self.assertBudget(3, lambda run: self.client.get(reverse('admin_dashboard'), {'sort': '-progress', 'per_page': 10}))
+
+    def test_admin_analytics(self):
+        self.assertBudget(4, lambda run: self.client.get(reverse('admin_analytics'), {'track': 'president'}))
+
+    def test_admin_users_search(self):
+        self.assertBudget(2, lambda run: self.client.get(reverse('admin_users'), {'q': 'first1', 'role': 'trainee'}))
@@ -0,0 +1,91 @@
+import json
+import random
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from ncbw.catalog import CATALOG
+from ncbw.models import Progress
+from ncbw.quiz import QuizError, grade, grade_many, open_attempt, start_attempt
+from .factories import PASSWORD, answer_quiz, make_user
+
+
+class QuizEngineTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.trainee = make_user()
+        self.quiz    = CATALOG.module('president', 0).quiz
+
+    def test_attempt_samples_without_revealing_answers(self):
+        token, questions = start_attempt(self.trainee.id, 'president', 0, random.Random(3))
+        self.assertEqual(len(questions), self.quiz.sample)
+        self.assertEqual(set(questions[0]), {'prompt', 'choices'})
+        picked = open_attempt(token, self.trainee.id).picked
+        self.assertEqual([self.quiz.questions[q].prompt for q in picked], [q['prompt'] for q in questions])
+        self.assertEqual(len(set(picked)), len(picked))
+
+    def test_grading_against_the_key(self):
+        token, _ = start_attempt(self.trainee.id, 'president', 0)
+        attempt  = open_attempt(token, self.trainee.id)
+        right    = [self.quiz.answer_key[q] for q in attempt.picked]
+        self.assertEqual(grade(attempt, right), 100)
+        self.assertEqual(grade(attempt, right[:1] + [None] * (len(right) - 1)), round(100 / len(right)))
+        with self.assertRaises(QuizError):
+            grade(attempt, right[:1])
+
+    def test_tokens_are_per_user_single_use_and_expire(self):
+        token, _ = start_attempt(self.trainee.id, 'president', 0)
+        with self.assertRaises(QuizError):
+            open_attempt(token, make_user().id)
+        with self.assertRaises(QuizError):
+            open_attempt(token[:-2] + 'xx', self.trainee.id)
+
+        answers = [None] * self.quiz.sample
+        grade_many(self.trainee.id, [(token, answers)])
+        with self.assertRaisesMessage(QuizError, 'already been submitted'):
+            grade_many(self.trainee.id, [(token, answers)])
+
+        with override_settings(NCBW_QUIZ_ATTEMPT_TTL=-1), self.assertRaisesMessage(QuizError, 'expired'):
+            open_attempt(start_attempt(self.trainee.id, 'president', 0)[0], self.trainee.id)
+
+    def test_rejected_batch_uses_up_none_of_its_tokens(self):
+        answers   = [None] * self.quiz.sample
+        used, _   = start_attempt(self.trainee.id, 'president', 0)
+        fresh, _  = start_attempt(self.trainee.id, 'president', 0)
+        grade_many(self.trainee.id, [(used, answers)])
+
+        with self.assertRaisesMessage(QuizError, 'already been submitted'):
+            grade_many(self.trainee.id, [(fresh, answers), (used, answers)])
+        with self.assertRaisesMessage(QuizError, 'submitted twice'):
+            grade_many(self.trainee.id, [(fresh, answers), (fresh, answers)])
+        self.assertEqual(len(grade_many(self.trainee.id, [(fresh, answers)])), 1)
+
+
+class QuizApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.trainee = make_user()
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+
+    def submit(self, body):
+        return self.client.post(reverse('submit_quiz'), json.dumps(body), content_type='application/json')
+
+    def test_start_then_submit(self):
+        response = self.client.get(reverse('start_quiz'), {'track_id': 'president', 'module_index': 1})
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertEqual(len(response.json()['questions']), CATALOG.module('president', 1).quiz.sample)
+
+        response = self.submit(answer_quiz(self.trainee, 'president', 1, right=0))
+        self.assertEqual(response.json(), {'success': True, 'passed': False, 'score': 0})
+        response = self.submit(answer_quiz(self.trainee, 'president', 1))
+        self.assertEqual(response.json(), {'success': True, 'passed': True, 'score': 100})
+        row = Progress.objects.get(user=self.trainee, module_index=1, course_index=None)
+        self.assertEqual((row.quiz_attempts, row.quiz_passed), (2, True))
+
+    def test_posted_scores_are_ignored(self):
+        response = self.submit({'track_id': 'president', 'module_index': 1, 'score': 100})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Progress.objects.filter(user=self.trainee, course_index=None).exists())
+
+    def test_unknown_module(self):
+        response = self.client.get(reverse('start_quiz'), {'track_id': 'president', 'module_index': 99})
+        self.assertEqual(response.status_code, 400)
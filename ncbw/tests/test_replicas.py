@@ -0,0 +1,79 @@
+import json
+from unittest import mock, skipUnless
+from django.conf import settings
+from django.db import OperationalError, connections
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from ncbw import routers
+from ncbw.exports import stream_export
+from ncbw.routers import ReplicaRouter
+from .factories import PASSWORD, make_admin, make_progress, make_user
+
+
+@skipUnless('replica' in settings.DATABASES, 'needs a replica alias (mirrored onto default in tests)')
+@override_settings(NCBW_REPLICA_DATABASE='replica', NCBW_REPLICA_PIN_SECONDS=60)
+class ReplicaRoutingTests(TestCase):
+    def setUp(self):
+        self.trainee = make_user()
+        make_progress(self.trainee, courses=2)
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        self.addCleanup(setattr, routers, '_down_until', 0.0)
+        # a real replica is a separate server; the test mirror has to share
+        # the default connection to see this test's uncommitted rows
+        self.replica = connections['replica']
+        connections['replica'] = connections['default']
+        self.addCleanup(connections.__setitem__, 'replica', self.replica)
+
+    def routed_reads(self, name='dashboard'):
+        # (model, alias) for every ncbw read the router placed
+        reads, db_for_read = [], ReplicaRouter.db_for_read
+        def record(router, model, **hints):
+            alias = db_for_read(router, model, **hints)
+            if model._meta.app_label == 'ncbw':
+                reads.append((model._meta.model_name, alias or 'default'))
+            return alias
+        with mock.patch.object(ReplicaRouter, 'db_for_read', record):
+            response = self.client.get(reverse(name))
+            if response.streaming:
+                b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        return reads
+
+    def test_dashboard_reads_from_replica(self):
+        reads = self.routed_reads()
+        self.assertIn(('progresssummary', 'replica'), reads)
+        # the session's own user row always comes from the primary
+        self.assertNotIn(('user', 'replica'), reads)
+
+    def test_reads_pinned_to_primary_after_a_write(self):
+        self.client.post(reverse('mark_complete'), json.dumps({'track_id': 'president', 'module_index': 0, 'course_index': 3}),
+                         content_type='application/json')
+        self.assertNotIn('replica', {alias for _, alias in self.routed_reads()})
+
+    def test_pin_is_per_session(self):
+        other = self.client_class()
+        other.post(reverse('login'), {'email': make_user().email, 'password': PASSWORD})
+        other.post(reverse('select_track'), {'track_id': 'president'})
+        self.assertIn(('progresssummary', 'replica'), self.routed_reads())
+
+    def test_falls_back_to_primary_when_replica_is_down(self):
+        connections['replica'] = self.replica
+        with mock.patch.object(self.replica, 'ensure_connection', side_effect=OperationalError('down')), \
+             self.assertLogs('ncbw.routers', 'WARNING'):
+            reads = self.routed_reads()
+        self.assertNotIn('replica', {alias for _, alias in reads})
+        self.assertTrue(routers.replica_status()['down'])
+
+        # no reconnect attempts until the retry window has passed
+        with mock.patch.object(self.replica, 'ensure_connection') as ensure:
+            self.routed_reads()
+        ensure.assert_not_called()
+
+    def test_admin_export_streams_from_replica(self):
+        self.client.post(reverse('logout'))
+        admin = make_admin()
+        self.client.post(reverse('login'), {'email': admin.email, 'password': PASSWORD})
+        # the body streams after the view returns, so the alias is passed explicitly
+        with mock.patch('ncbw.views.stream_export', wraps=stream_export) as export:
+            self.routed_reads('admin_export')
+        self.assertEqual(export.call_args.kwargs['using'], 'replica')
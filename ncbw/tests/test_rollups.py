@@ -0,0 +1,80 @@
+import json
+from unittest import mock
+from django.conf import settings
+from django.test import Client, TestCase
+from django.urls import reverse
+from ncbw.catalog import CATALOG, compile_catalog
+from ncbw.models import ModuleRollup, ModuleScoreBucket, TrackRollup
+from ncbw.progress import apply_progress
+from ncbw.rollups import rebuild_rollups, track_funnel
+from .factories import PASSWORD, make_admin, make_user
+
+
+def snapshot():
+    return (
+        sorted(TrackRollup.objects.values_list('track_id', 'enrolled')),
+        sorted(ModuleRollup.objects.values_list(
+            'track_id', 'module_index', 'learners', 'finishers',
+            'course_completions', 'quiz_takers', 'quiz_passers', 'quiz_attempts',
+        )),
+    )
+
+
+class CohortRollupTests(TestCase):
+    def setUp(self):
+        self.ada, self.bob = make_user(selected_track=None), make_user(selected_track=None)
+        self.clients = {}
+        for user in (self.ada, self.bob):
+            client = self.clients[user.id] = Client()
+            client.post(reverse('login'), {'email': user.email, 'password': PASSWORD})
+            client.post(reverse('select_track'), {'track_id': 'president'})
+
+    def test_incremental_matches_rebuild(self):
+        apply_progress(self.ada.id, 'president',
+                       completions=[(0, i) for i in range(5)] + [(1, 0)],
+                       quiz_scores=[(0, 40), (0, 90)])
+        apply_progress(self.ada.id, 'president', completions=[(0, 2)])   # already done, no change
+        apply_progress(self.bob.id, 'president', completions=[(0, 3)])
+        apply_progress(self.bob.id, 'president', quiz_scores=[(0, 50)])
+        apply_progress(self.bob.id, 'president', quiz_scores=[(0, 80)])
+        incremental = snapshot()
+
+        rebuild_rollups()
+        self.assertEqual(snapshot(), incremental)
+
+        funnel = track_funnel('president')
+        self.assertEqual(funnel['enrolled'], 2)
+        first = funnel['modules'][0]
+        self.assertEqual((first['rollup'].learners, first['rollup'].finishers), (2, 1))
+        self.assertEqual(first['pass_rate'], 100)
+        self.assertEqual(first['avg_attempts'], 2.0)
+
+    def test_histogram_counts_every_attempt(self):
+        apply_progress(self.ada.id, 'president', quiz_scores=[(0, 40)])
+        apply_progress(self.ada.id, 'president', quiz_scores=[(0, 95)])
+        apply_progress(self.bob.id, 'president', quiz_scores=[(0, 45)])
+        buckets = dict(ModuleScoreBucket.objects.filter(module_index=0).values_list('bucket', 'attempts'))
+        self.assertEqual(buckets, {4: 2, 9: 1})
+
+    def test_track_can_only_be_chosen_once(self):
+        self.clients[self.ada.id].post(reverse('select_track'), {'track_id': 'president'})
+        self.assertEqual(TrackRollup.objects.get(track_id='president').enrolled, 2)
+
+    def test_track_removed_by_a_reload_can_be_chosen_again(self):
+        data = json.loads(settings.NCBW_CATALOG_PATH.read_text())
+        del data['tracks']['president']
+        data['track_order'].remove('president')
+        without = compile_catalog(data['tracks'], data['track_order'], 'without', data['quiz_bank'])
+        client  = self.clients[self.ada.id]
+        with mock.patch.object(CATALOG, '_current', without):
+            self.assertTemplateUsed(client.get(reverse('dashboard')), 'ncbw/select_track.html')
+            client.post(reverse('select_track'), {'track_id': 'treasurer'})
+            self.assertTemplateNotUsed(client.get(reverse('dashboard')), 'ncbw/select_track.html')
+        self.assertEqual(sorted(TrackRollup.objects.values_list('track_id', 'enrolled')),
+                         [('president', 1), ('treasurer', 1)])
+
+    def test_analytics_page(self):
+        admin = make_admin()
+        self.client.post(reverse('login'), {'email': admin.email, 'password': PASSWORD})
+        response = self.client.get(reverse('admin_analytics'), {'track': 'president'})
+        self.assertContains(response, '2 trainees enrolled')
@@ -0,0 +1,66 @@
+from datetime import timedelta
+from pathlib import Path
+from django.conf import settings
+from django.core.cache import caches
+from django.contrib.sessions.models import Session
+from django.test import TestCase
+from django.utils import timezone
+from ncbw.sessions import SessionStore, expire_sessions
+
+
+class SessionStoreTests(TestCase):
+    def setUp(self):
+        caches['sessions'].clear()
+
+    def new_session(self, **data):
+        store = SessionStore()
+        store.update(data)
+        store.save()
+        return store.session_key
+
+    def test_reads_come_from_the_cache_and_fall_back_to_the_database(self):
+        key = self.new_session(user_id='42')
+        with self.assertNumQueries(0):
+            self.assertEqual(SessionStore(key)['user_id'], '42')
+
+        caches['sessions'].clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(SessionStore(key)['user_id'], '42')
+
+    def test_unchanged_session_is_not_saved_again(self):
+        key   = self.new_session(user_id='42', user_role='trainee')
+        store = SessionStore(key)
+        store['user_role'] = 'trainee'
+        self.assertTrue(store.modified)
+        with self.assertNumQueries(0):
+            store.save()
+
+        store['user_role'] = 'admin'
+        store.save()
+        self.assertEqual(Session.objects.get(pk=key).get_decoded()['user_role'], 'admin')
+
+    def test_new_session_is_a_single_insert(self):
+        with self.assertNumQueries(3):    # INSERT inside SAVEPOINT / RELEASE
+            self.new_session(user_id='42')
+
+    def test_expire_sessions_removes_only_expired_rows(self):
+        live = self.new_session(user_id='1')
+        past = timezone.now() - timedelta(days=1)
+        Session.objects.bulk_create([
+            Session(session_key=f'expired{i}', session_data='', expire_date=past) for i in range(5)
+        ])
+        self.assertEqual(expire_sessions(chunk_size=2), 5)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), [live])
+
+    def test_expire_sessions_clears_the_cache_too(self):
+        cache = caches['sessions']
+        self.assertNotEqual(Path(cache._dir), settings.BASE_DIR / '.cache' / 'sessions')
+        live, old = self.new_session(user_id='1'), self.new_session(user_id='2')
+        Session.objects.filter(pk=old).update(expire_date=timezone.now() - timedelta(days=1))
+        cache.set('stale', 1, timeout=-1)     # a file past its expiry nobody read again
+
+        self.assertEqual(expire_sessions(), 1)
+        self.assertEqual(len(cache._list_cache_files()), 1)
+        self.assertEqual(SessionStore(live)['user_id'], '1')
+        with self.assertNumQueries(1):
+            self.assertEqual(SessionStore(old).load(), {})
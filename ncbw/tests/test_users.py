@@ -0,0 +1,60 @@
+from django.test import TestCase
+from django.urls import reverse
+from ncbw.reports import trainee_report, user_directory
+from .factories import PASSWORD, make_admin, make_user
+
+
+class UserDirectoryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.ada   = make_user(email='ada@example.org', first_name='Ada', last_name='Lovelace')
+        cls.alan  = make_user(email='alan@example.org', first_name='Alan', last_name='Turing', selected_track=None)
+        cls.grace = make_user(email='grace@example.org', first_name='Grace', last_name='Hopper',
+                              selected_track='treasurer')
+        cls.admin = make_admin(email='boss@example.org', first_name='Adele', last_name='Goldberg')
+
+    def emails(self, **kwargs):
+        return [u.email for u in user_directory(**kwargs)['rows']]
+
+    def test_prefix_search_on_email_and_names(self):
+        self.assertEqual(self.emails(query='A'), ['ada@example.org', 'alan@example.org', 'boss@example.org'])
+        self.assertEqual(self.emails(query='hopp'), ['grace@example.org'])
+        self.assertEqual(self.emails(query='ada LOVE'), ['ada@example.org'])
+        self.assertEqual(self.emails(query='lace'), [])
+
+    def test_filters(self):
+        self.assertEqual(self.emails(query='a', role='admin'), ['boss@example.org'])
+        self.assertEqual(self.emails(track='none'), ['alan@example.org'])
+        self.assertEqual(self.emails(track='treasurer'), ['grace@example.org'])
+        self.assertEqual(len(self.emails(track='bogus')), 4)
+
+    def test_keyset_pages(self):
+        first = user_directory(per_page=3)
+        self.assertEqual(len(first['rows']), 3)
+        rest = user_directory(per_page=3, after=first['next_cursor'])
+        self.assertEqual([u.email for u in rest['rows']], ['grace@example.org'])
+        self.assertIsNone(rest['next_cursor'])
+
+    def test_cursor_from_another_sort_starts_over(self):
+        cursor = trainee_report(sort='track', per_page=1)['next_cursor']
+        report = trainee_report(sort='progress', per_page=1, after=cursor)
+        self.assertTrue(report['is_first'])
+        self.assertEqual(len(report['rows']), 1)
+
+    def test_page_and_delete_back_to_search(self):
+        self.client.post(reverse('login'), {'email': self.admin.email, 'password': PASSWORD})
+        url = reverse('admin_users') + '?q=al'
+        self.assertContains(self.client.get(url), 'alan@example.org')
+        response = self.client.post(reverse('admin_delete_user', args=[self.alan.id]), {'next': url})
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        response = self.client.post(reverse('admin_delete_user', args=[self.ada.id]), {'next': 'https://evil.example/'})
+        self.assertRedirects(response, reverse('admin_dashboard'), fetch_redirect_response=False)
+
+    def test_names_are_escaped_for_the_delete_prompt(self):
+        # the browser undoes HTML escaping before the onsubmit script runs
+        make_user(first_name="');alert(1);('", last_name='Mallory')
+        self.client.post(reverse('login'), {'email': self.admin.email, 'password': PASSWORD})
+        for url in (reverse('admin_users') + '?q=mallory', reverse('admin_dashboard')):
+            response = self.client.get(url)
+            self.assertContains(response, "confirm('Delete \\u0027)\\u003Balert(1)\\u003B(\\u0027?')")
+            self.assertNotContains(response, "confirm('Delete &#x27;")
@@ -0,0 +1,46 @@
+import json
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from ncbw.models import Progress, ProgressSummary
+from ncbw.writebehind import WRITE_BEHIND
+from .factories import PASSWORD, make_user
+
+
+@override_settings(NCBW_WRITE_BEHIND=True, NCBW_WRITE_BEHIND_INTERVAL=0, NCBW_WRITE_BEHIND_BATCH=50)
+class WriteBehindTests(TestCase):
+    def setUp(self):
+        self.trainee = make_user()
+        self.client.post(reverse('login'), {'email': self.trainee.email, 'password': PASSWORD})
+        self.addCleanup(WRITE_BEHIND.flush)
+
+    def click(self, course_index, user_id=None):
+        response = self.client.post(reverse('mark_complete'), json.dumps({
+            'track_id': 'president', 'module_index': 0, 'course_index': course_index,
+        }), content_type='application/json')
+        self.assertEqual(json.loads(response.content), {'success': True, 'queued': True})
+
+    def test_click_is_queued_until_the_trainee_reads(self):
+        self.click(0)
+        self.click(1)
+        self.assertFalse(Progress.objects.exists())
+
+        response = self.client.get(reverse('module_detail', args=['president', 0]))
+        self.assertEqual(set(response.context['progress']['courses']), {0, 1})
+        self.assertEqual(response.context['overall'], ProgressSummary.objects.get().overall)
+        self.assertEqual(WRITE_BEHIND.stats()['pending'], 0)
+
+    def test_flush_writes_every_trainee(self):
+        others = [make_user() for _ in range(3)]
+        for user in others:
+            WRITE_BEHIND.add(user.id, 'president', completions=[(0, 0), (0, 1)], quiz_scores=[(0, 40), (0, 90)])
+        WRITE_BEHIND.flush()
+        for summary in ProgressSummary.objects.filter(user__in=others):
+            self.assertEqual((summary.completed_courses, summary.passed_quizzes), (2, 1))
+        self.assertEqual(Progress.objects.get(user=others[0], course_index=None).quiz_attempts, 2)
+
+    @override_settings(NCBW_WRITE_BEHIND_BATCH=2)
+    def test_full_batch_flushes(self):
+        self.click(0)
+        self.assertFalse(Progress.objects.exists())
+        self.click(1)
+        self.assertEqual(Progress.objects.filter(user=self.trainee).count(), 2)
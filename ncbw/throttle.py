@@ -0,0 +1,89 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+
+
+# ── token buckets ────────────────────────────────────────
+# capacity tokens per key, refilled evenly over per_seconds. Held in this
+# process only (a dict under a lock, least recently used keys dropped past
+# max_keys): checking a bucket costs no network or database round trip,
+# which is the point when a credential-stuffing burst arrives. With several
+# worker processes each enforces its own limit.
+
+class TokenBuckets:
+    def __init__(self, capacity, per_seconds, max_keys=100_000, clock=time.monotonic):
+        self.capacity = capacity
+        self.rate     = capacity / per_seconds
+        self.max_keys = max_keys
+        self.clock    = clock
+        self._lock    = threading.Lock()
+        self._buckets = OrderedDict()     # key -> (tokens, updated_at)
+
+    def _level(self, key, now):
+        tokens, updated = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, tokens + (now - updated) * self.rate)
+
+    def wait(self, key):
+        # seconds until key has a token to spend; 0 if it has one now
+        with self._lock:
+            tokens = self._level(key, self.clock())
+        return 0 if tokens >= 1 else math.ceil((1 - tokens) / self.rate)
+
+    def take(self, key):
+        with self._lock:
+            now    = self.clock()
+            tokens = self._level(key, now) - 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+# ── login throttles ──────────────────────────────────────
+# Failed logins drain a bucket per client IP and one per email address;
+# while either is empty the login form answers 429 before the user lookup
+# or the password hash. Successful logins cost nothing, so a whole chapter
+# signing in from one office network isn't held up.
+
+_buckets      = {}
+_buckets_lock = threading.Lock()
+
+def _throttle(scope, limit):
+    # limit: (capacity, per_seconds) from settings, or None for no throttle
+    if not limit:
+        return None
+    key = (scope, *limit)
+    with _buckets_lock:
+        if key not in _buckets:
+            _buckets[key] = TokenBuckets(*limit)
+        return _buckets[key]
+
+def _login_throttles(ip, email):
+    return [
+        (_throttle('ip', getattr(settings, 'NCBW_LOGIN_THROTTLE_IP', None)), ip),
+        (_throttle('account', getattr(settings, 'NCBW_LOGIN_THROTTLE_ACCOUNT', None)), email),
+    ]
+
+def client_ip(request):
+    header = getattr(settings, 'NCBW_CLIENT_IP_HEADER', None)
+    value  = request.META.get(header) if header else None
+    return (value or request.META.get('REMOTE_ADDR') or '').split(',')[0].strip()
+
+def login_wait(ip, email):
+    return max((buckets.wait(key) for buckets, key in _login_throttles(ip, email) if buckets), default=0)
+
+def login_failed(ip, email):
+    for buckets, key in _login_throttles(ip, email):
+        if buckets:
+            buckets.take(key)
+
+def reset_login_throttles():
+    with _buckets_lock:
+        for buckets in _buckets.values():
+            buckets.clear()
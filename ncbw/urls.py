@@ -9,7 +9,15 @@ urlpatterns = [
     path('select-track/',             views.select_track,       name='select_track'),
     path('module/<str:track_id>/<int:module_index>/', views.module_detail, name='module_detail'),
     path('api/complete/',             views.mark_complete,      name='mark_complete'),
+    path('api/quiz/start/',           views.start_quiz,         name='start_quiz'),
     path('api/quiz/',                 views.submit_quiz,        name='submit_quiz'),
+    path('api/progress/batch/',       views.progress_batch,     name='progress_batch'),
     path('admin-dashboard/',          views.admin_dashboard,    name='admin_dashboard'),
+    path('admin-dashboard/users/',    views.admin_users,        name='admin_users'),
+    path('admin-dashboard/analytics/', views.admin_analytics,   name='admin_analytics'),
+    path('admin-dashboard/export/',   views.admin_export,       name='admin_export'),
+    path('admin-dashboard/live/',     views.admin_live,         name='admin_live'),
+    path('admin-dashboard/metrics/',  views.admin_metrics,      name='admin_metrics'),
     path('admin/delete/<uuid:user_id>/', views.admin_delete_user, name='admin_delete_user'),
+    path('admin/users/bulk/',         views.admin_bulk_users,   name='admin_bulk_users'),
 ]
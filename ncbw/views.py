@@ -1,58 +1,98 @@
 import hashlib
 import json
+import uuid
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib import messages
+from django.core.handlers.asgi import ASGIRequest
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_POST, require_GET
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.cache import never_cache
+from django.db import transaction
 from django.utils import timezone
-from .models import User, Progress
-from .training_data import TRAINING_DATA, TRACK_ORDER
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import url_has_allowed_host_and_scheme
+from .models import User
+from .passwords import burn_hash, hash_password, verify_password
+from .throttle import client_ip, login_failed, login_wait
+from .accounts import deactivate_users, purge_users
+from .catalog import CATALOG
+from .middleware import invalidate_user, load_user
+from .instrumentation import METRICS
+from .live import HUB, event_stream, publish_progress, sync_event_stream
+from .exports import EXPORT_FORMATS, stream_export
+from .pool import pool_stats
+from .quiz import QuizError, grade_many, start_attempt
+from .routers import current_read_alias, read_replica, replica_status
+from .rollups import record_enrollment, track_funnel
+from .reports import MAX_PER_PAGE, NO_TRACK, trainee_report, user_counts, user_directory
+from .writebehind import WRITE_BEHIND, flush_pending, submit_progress
+from .progress import PASS_MARK, aget_track_progress, apply_progress, get_summary, get_module_progress
 
 
 # ── helpers ──────────────────────────────────────────────
 
-def hash_pw(password):
-    return hashlib.sha256(password.encode()).hexdigest()
+async def session_get(request, key):
+    # Django 5.0 has no async session API and the first read loads the
+    # session row from the database
+    return await sync_to_async(request.session.get)(key)
+
+async def session_user(request):
+    # the signed-in account, or None once it has been deleted or deactivated:
+    # a session outlives both, and writes made through it would otherwise
+    # land for a disabled trainee or fail on the foreign key
+    return await sync_to_async(load_user)(await session_get(request, 'user_id'))
+
+def json_body(request):
+    # the posted JSON object, or None for invalid JSON or anything else
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
 
 def login_required(view):
-    def wrapper(request, *args, **kwargs):
-        if not request.session.get('user_id'):
-            return redirect('login')
-        return view(request, *args, **kwargs)
+    if iscoroutinefunction(view):
+        async def wrapper(request, *args, **kwargs):
+            if not await session_get(request, 'user_id'):
+                return redirect('login')
+            if not await session_user(request):
+                return await sync_to_async(signed_out)(request)
+            return await view(request, *args, **kwargs)
+    else:
+        def wrapper(request, *args, **kwargs):
+            if not request.session.get('user_id'):
+                return redirect('login')
+            if not request.ncbw_user:     # lazy, so never `is None`
+                return signed_out(request)
+            return view(request, *args, **kwargs)
     wrapper.__name__ = view.__name__
     return wrapper
 
 def admin_required(view):
-    def wrapper(request, *args, **kwargs):
-        if not request.session.get('user_id'):
-            return redirect('login')
-        if request.session.get('user_role') != 'admin':
-            return redirect('dashboard')
-        return view(request, *args, **kwargs)
+    if iscoroutinefunction(view):
+        async def wrapper(request, *args, **kwargs):
+            if not await session_get(request, 'user_id'):
+                return redirect('login')
+            if await session_get(request, 'user_role') != 'admin':
+                return redirect('dashboard')
+            if not await session_user(request):
+                return await sync_to_async(signed_out)(request)
+            return await view(request, *args, **kwargs)
+    else:
+        def wrapper(request, *args, **kwargs):
+            if not request.session.get('user_id'):
+                return redirect('login')
+            if request.session.get('user_role') != 'admin':
+                return redirect('dashboard')
+            if not request.ncbw_user:
+                return signed_out(request)
+            return view(request, *args, **kwargs)
     wrapper.__name__ = view.__name__
     return wrapper
 
-def get_progress_data(user, track_id):
-    rows = Progress.objects.filter(user=user, track_id=track_id)
-    modules = {}
-    total = completed = 0
-    for row in rows:
-        m, c = row.module_index, row.course_index
-        if m not in modules:
-            modules[m] = {'courses': {}, 'quiz_passed': False, 'quiz_score': None, 'quiz_attempts': 0}
-        if c is not None:
-            total += 1
-            if row.completed:
-                completed += 1
-            modules[m]['courses'][c] = {'completed': row.completed}
-        else:
-            modules[m]['quiz_passed'] = row.quiz_passed
-            modules[m]['quiz_score'] = row.quiz_score
-            modules[m]['quiz_attempts'] = row.quiz_attempts
-    overall = int(completed / total * 100) if total else 0
-    return modules, overall
-
-
 # ── auth pages ───────────────────────────────────────────
 
 def login_page(request):
@@ -62,15 +102,28 @@ def login_page(request):
     if request.method == 'POST':
         email    = request.POST.get('email', '').strip().lower()
         password = request.POST.get('password', '')
-        try:
-            user = User.objects.get(email=email, password=hash_pw(password))
-            request.session['user_id']    = str(user.id)
-            request.session['user_role']  = user.role
-            request.session['user_email'] = user.email
-            request.session['user_name']  = f"{user.first_name} {user.last_name}"
-            return redirect('dashboard')
-        except User.DoesNotExist:
+        ip       = client_ip(request)
+        # throttled attempts are turned away before the lookup or the hash
+        wait = login_wait(ip, email)
+        if wait:
+            response = render(request, 'ncbw/login.html',
+                              {'error': f'Too many failed attempts. Try again in {wait} seconds.'}, status=429)
+            response['Retry-After'] = str(wait)
+            return response
+
+        user = User.objects.filter(email=email).first()
+        if user is None:
+            burn_hash(password)
+        if user is None or not verify_password(user, password):
+            login_failed(ip, email)
             return render(request, 'ncbw/login.html', {'error': 'Invalid email or password'})
+        if not user.is_active:
+            return render(request, 'ncbw/login.html', {'error': 'This account has been deactivated'})
+        request.session['user_id']    = str(user.id)
+        request.session['user_role']  = user.role
+        request.session['user_email'] = user.email
+        request.session['user_name']  = f"{user.first_name} {user.last_name}"
+        return redirect('dashboard')
 
     return render(request, 'ncbw/login.html')
 
@@ -86,7 +139,7 @@ def signup_page(request):
             return render(request, 'ncbw/signup.html', {'error': 'Email already in use'})
 
         User.objects.create(
-            email=email, password=hash_pw(password),
+            email=email, password=hash_password(password),
             first_name=first_name, last_name=last_name, role='trainee'
         )
         return redirect('login')
@@ -99,11 +152,42 @@ def logout_view(request):
     return redirect('login')
 
 
+def signed_out(request):
+    # the account was deleted or deactivated since this session logged in
+    request.session.flush()
+    return redirect('login')
+
+
+# ── conditional GET ──────────────────────────────────────
+# The trainee pages only change when the catalog, the trainee or their
+# progress on the track does, and every progress write bumps the track's
+# ProgressSummary.version. So the ETag costs the summary lookup the page
+# needs anyway, and a repeat visit is a 304 with no progress query or render.
+
+PAGE_VERSION  = 1              # bump when dashboard.html or module.html change
+FRAGMENT_TTL  = 24 * 3600      # catalog-only template fragments, keyed by CATALOG.version
+
+def page_etag(user, summary, *parts):
+    raw = ':'.join(str(p) for p in (
+        PAGE_VERSION, CATALOG.version, user.id, user.first_name, user.last_name,
+        summary.pk, summary.version, *parts,
+    ))
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+def conditional(request, etag, render_page):
+    response = get_conditional_response(request, etag=etag) or render_page()
+    response['ETag'] = etag
+    # browsers keep the page but ask again every time
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 # ── main pages ───────────────────────────────────────────
 
 @login_required
+@read_replica
 def dashboard(request):
-    user = User.objects.get(id=request.session['user_id'])
+    user = request.ncbw_user
 
     if user.role == 'admin':
         return redirect('admin_dashboard')
@@ -111,126 +195,313 @@ def dashboard(request):
     # Trainee: show track selection or their track
     if not user.selected_track:
         return render(request, 'ncbw/select_track.html', {
-            'tracks': [(k, v['name']) for k, v in TRAINING_DATA.items()]
+            'tracks': CATALOG.choices()
         })
 
     track_id   = user.selected_track
-    track_data = TRAINING_DATA.get(track_id, {})
-    modules, overall = get_progress_data(user, track_id)
-
-    return render(request, 'ncbw/dashboard.html', {
-        'user':       user,
-        'track_id':   track_id,
-        'track':      track_data,
-        'modules':    modules,
-        'overall':    overall,
-        'attributes': track_data.get('attributes', []),
-    })
+    track      = CATALOG.track(track_id)
+    if not track:
+        return render(request, 'ncbw/select_track.html', {'tracks': CATALOG.choices()})
+    flush_pending(user.id)
+    summary    = get_summary(user, track_id)
+
+    etag       = page_etag(user, summary, 'dashboard', track_id)
+
+    return conditional(request, etag, lambda: render(request, 'ncbw/dashboard.html', {
+        'user':            user,
+        'track_id':        track_id,
+        'track':           track,
+        'overall':         summary.overall,
+        'attributes':      track.modules,
+        'catalog_version': CATALOG.version,
+        'fragment_ttl':    FRAGMENT_TTL,
+    }))
 
 
 @login_required
 @require_POST
 def select_track(request):
     track_id = request.POST.get('track_id')
-    if track_id not in TRAINING_DATA:
+    if track_id not in CATALOG:
         return redirect('dashboard')
-    user = User.objects.get(id=request.session['user_id'])
-    user.selected_track = track_id
-    user.save()
+    user_id  = request.session['user_id']
+    previous = request.ncbw_user.selected_track
+    # a track is chosen once (select_track.html says so), unless a catalog
+    # reload has since removed it; the enrolment moves with the trainee.
+    # Updating only while the old value is still in place keeps two
+    # concurrent posts from both counting.
+    if previous in CATALOG:
+        return redirect('dashboard')
+    with transaction.atomic():
+        if User.objects.filter(id=user_id, selected_track=previous).update(selected_track=track_id):
+            record_enrollment(track_id)
+            if previous:
+                record_enrollment(previous, -1)
+    invalidate_user(user_id)
     return redirect('dashboard')
 
 
 @login_required
+@read_replica
 def module_detail(request, track_id, module_index):
-    user     = User.objects.get(id=request.session['user_id'])
-    track    = TRAINING_DATA.get(track_id)
-    if not track or module_index >= len(track['attributes']):
+    user     = request.ncbw_user
+    module   = CATALOG.module(track_id, module_index)
+    if not module:
         return redirect('dashboard')
 
-    module   = track['attributes'][module_index]
-    modules, overall = get_progress_data(user, track_id)
-    mod_prog = modules.get(module_index, {'courses': {}, 'quiz_passed': False, 'quiz_score': None, 'quiz_attempts': 0})
-
-    return render(request, 'ncbw/module.html', {
-        'user':         user,
-        'track_id':     track_id,
-        'track_name':   track['name'],
-        'module_index': module_index,
-        'module':       module,
-        'progress':     mod_prog,
-        'overall':      overall,
-    })
+    flush_pending(user.id)
+    summary  = get_summary(user, track_id)
+
+    etag     = page_etag(user, summary, 'module', track_id, module_index)
+
+    return conditional(request, etag, lambda: render(request, 'ncbw/module.html', {
+        'user':            user,
+        'track_id':        track_id,
+        'track_name':      CATALOG.track(track_id).name,
+        'module_index':    module_index,
+        'module':          module,
+        'progress':        get_module_progress(user, track_id, module_index),
+        'overall':         summary.overall,
+        'catalog_version': CATALOG.version,
+        'fragment_ttl':    FRAGMENT_TTL,
+    }))
 
 
+# ── JSON API ─────────────────────────────────────────────
+# Async so a burst of clicks under ASGI waits on the database without
+# holding a worker thread per request. Each write is one sync_to_async hop:
+# apply_progress is raw SQL inside atomic(), which has no async form. With
+# NCBW_WRITE_BEHIND or NCBW_DEFER_PROGRESS on, single clicks are queued or
+# only logged instead and the response carries "queued" rather than the new
+# overall.
+
 @login_required
 @require_POST
-def mark_complete(request):
-    data         = json.loads(request.body)
-    track_id     = data.get('track_id')
-    module_index = int(data.get('module_index'))
-    course_index = int(data.get('course_index'))
-    user         = User.objects.get(id=request.session['user_id'])
-
-    row, _ = Progress.objects.get_or_create(
-        user=user, track_id=track_id,
-        module_index=module_index, course_index=course_index
-    )
-    row.completed    = True
-    row.completed_at = timezone.now()
-    row.save()
-
-    _, overall = get_progress_data(user, track_id)
+async def mark_complete(request):
+    data = json_body(request)
+    try:
+        track_id     = data['track_id']
+        module_index = int(data['module_index'])
+        course_index = int(data['course_index'])
+    except (ValueError, TypeError, KeyError):
+        return JsonResponse({'success': False, 'error': 'Malformed request'}, status=400)
+    if not CATALOG.course(track_id, module_index, course_index):
+        return JsonResponse({'success': False, 'error': 'Unknown course'}, status=400)
+    user_id      = await session_get(request, 'user_id')
+
+    summary = await sync_to_async(submit_progress)(user_id, track_id, completions=[(module_index, course_index)])
+    overall = summary.overall if summary else None
+    publish_progress(user_id, await session_get(request, 'user_name'), track_id,
+                     completions=[(module_index, course_index)], overall=overall)
+    if summary is None:
+        return JsonResponse({'success': True, 'queued': True})
     return JsonResponse({'success': True, 'overall': overall})
 
 
+# A quiz is started with a GET that returns the sampled questions and a
+# signed attempt token; the answers are posted back with that token and
+# graded here, so a score can't be posted directly.
+
+@login_required
+@never_cache
+@require_GET
+async def start_quiz(request):
+    track_id = request.GET.get('track_id')
+    try:
+        module_index = int(request.GET.get('module_index'))
+    except (TypeError, ValueError):
+        module_index = None
+    if module_index is None or not CATALOG.module(track_id, module_index):
+        return JsonResponse({'success': False, 'error': 'Unknown module'}, status=400)
+    user_id = await session_get(request, 'user_id')
+
+    token, questions = start_attempt(user_id, track_id, module_index)
+    return JsonResponse({'success': True, 'token': token, 'questions': questions})
+
+
 @login_required
 @require_POST
-def submit_quiz(request):
-    data         = json.loads(request.body)
-    track_id     = data.get('track_id')
-    module_index = int(data.get('module_index'))
-    score        = float(data.get('score', 0))
-    passed       = score >= 70
-    user         = User.objects.get(id=request.session['user_id'])
-
-    row, _ = Progress.objects.get_or_create(
-        user=user, track_id=track_id,
-        module_index=module_index, course_index=None
-    )
-    row.quiz_score    = max(row.quiz_score or 0, score)
-    row.quiz_passed   = row.quiz_passed or passed
-    row.quiz_attempts += 1
-    row.save()
+async def submit_quiz(request):
+    data = json_body(request)
+    if data is None:
+        return JsonResponse({'success': False, 'error': 'Malformed request'}, status=400)
+    user_id = await session_get(request, 'user_id')
+    try:
+        [(attempt, score)] = grade_many(user_id, [(data.get('token'), data.get('answers'))])
+    except QuizError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    quiz_scores = [(attempt.module_index, score)]
+    summary     = await sync_to_async(submit_progress)(user_id, attempt.track_id, quiz_scores=quiz_scores)
+    publish_progress(user_id, await session_get(request, 'user_name'), attempt.track_id,
+                     quiz_scores=quiz_scores, overall=summary.overall if summary else None)
+    passed = score >= PASS_MARK
 
     return JsonResponse({'success': True, 'passed': passed, 'score': score})
 
 
+MAX_BATCH_ITEMS = 500
+
+@login_required
+@require_POST
+async def progress_batch(request):
+    data = json_body(request)
+    try:
+        track_id     = data.get('track_id')
+        completions  = [(int(c['module_index']), int(c['course_index'])) for c in data.get('completions', [])]
+        submissions  = [(q['token'], q['answers']) for q in data.get('quizzes', [])]
+    except (AttributeError, ValueError, TypeError, KeyError):
+        return JsonResponse({'success': False, 'error': 'Malformed batch'}, status=400)
+
+    if len(completions) + len(submissions) > MAX_BATCH_ITEMS:
+        return JsonResponse({'success': False, 'error': f'At most {MAX_BATCH_ITEMS} items per batch'}, status=400)
+    if any(not CATALOG.course(track_id, mi, ci) for mi, ci in completions):
+        return JsonResponse({'success': False, 'error': 'Unknown course'}, status=400)
+
+    user_id = await session_get(request, 'user_id')
+    try:
+        graded = grade_many(user_id, submissions)
+    except QuizError as e:
+        return JsonResponse({'success': False, 'error': str(e)}, status=400)
+    if any(attempt.track_id != track_id for attempt, _ in graded):
+        return JsonResponse({'success': False, 'error': 'Quiz attempt is for another track'}, status=400)
+    quiz_scores = [(attempt.module_index, score) for attempt, score in graded]
+
+    # already batched, so written straight away, after anything still queued
+    await sync_to_async(flush_pending)(user_id)
+    summary = await sync_to_async(apply_progress)(user_id, track_id, completions, quiz_scores)
+    publish_progress(user_id, await session_get(request, 'user_name'), track_id,
+                     completions, quiz_scores, overall=summary.overall)
+    touched = sorted({mi for mi, _ in completions} | {mi for mi, _ in quiz_scores})
+    modules = await aget_track_progress(user_id, track_id, touched)
+
+    return JsonResponse({'success': True, 'overall': summary.overall, 'modules': modules})
+
+
 # ── admin pages ──────────────────────────────────────────
 
 @admin_required
+@read_replica
 def admin_dashboard(request):
-    users   = User.objects.filter(role='trainee')
-    reports = []
-    for u in users:
-        rows      = Progress.objects.filter(user=u)
-        total     = rows.filter(course_index__isnull=False).count()
-        completed = rows.filter(course_index__isnull=False, completed=True).count()
-        reports.append({
-            'user':     u,
-            'overall':  int(completed / total * 100) if total else 0,
-            'completed': completed,
-            'total':    total,
-        })
-
+    report = trainee_report(
+        sort=request.GET.get('sort'),
+        after=request.GET.get('after'),
+        per_page=request.GET.get('per_page'),
+    )
     return render(request, 'ncbw/admin.html', {
-        'reports':    reports,
-        'all_users':  User.objects.all(),
+        'reports':    report['rows'],
+        'report':     report,
+        'counts':     user_counts(),
         'user_name':  request.session.get('user_name'),
     })
 
 
+@admin_required
+@read_replica
+def admin_users(request):
+    directory = user_directory(
+        query=request.GET.get('q'),
+        role=request.GET.get('role'),
+        track=request.GET.get('track'),
+        after=request.GET.get('after'),
+        per_page=request.GET.get('per_page'),
+    )
+    return render(request, 'ncbw/users.html', {
+        'users':     directory['rows'],
+        'directory': directory,
+        'tracks':    CATALOG.choices(),
+        'no_track':  NO_TRACK,
+        'user_name': request.session.get('user_name'),
+    })
+
+
+@admin_required
+@read_replica
+def admin_analytics(request):
+    track_id = request.GET.get('track')
+    if track_id not in CATALOG:
+        track_id = CATALOG.track_order[0]
+    return render(request, 'ncbw/analytics.html', {
+        'funnel':    track_funnel(track_id),
+        'tracks':    CATALOG.choices(),
+        'track_id':  track_id,
+        'user_name': request.session.get('user_name'),
+    })
+
+
+@admin_required
+@require_GET
+@read_replica
+def admin_export(request):
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        return JsonResponse({'success': False, 'error': 'Unknown export format'}, status=400)
+    response = StreamingHttpResponse(stream_export(fmt, using=current_read_alias()), content_type=EXPORT_FORMATS[fmt])
+    filename = f"ncbw-progress-{timezone.now():%Y%m%d}.{fmt}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+# Server-Sent Events: each progress write above is published once to the
+# in-process hub and fanned out to every admin watching, instead of each of
+# them re-running the report. Under ASGI a stream is a coroutine waiting on
+# its queue; under WSGI it is a plain generator that holds a worker thread
+# for as long as the tab is open.
+
+@admin_required
+@require_GET
+async def admin_live(request):
+    last_event_id = request.headers.get('Last-Event-ID')
+    if isinstance(request, ASGIRequest):
+        stream = event_stream(HUB.subscribe(last_event_id))
+    else:
+        stream = sync_event_stream(HUB.subscribe(last_event_id, threaded=True))
+    response = StreamingHttpResponse(stream, content_type='text/event-stream')
+    response['Cache-Control']     = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'     # nginx: pass events through unbuffered
+    return response
+
+
+@admin_required
+def admin_metrics(request):
+    return JsonResponse({
+        'enabled':      getattr(settings, 'NCBW_INSTRUMENTATION', False),
+        'views':        METRICS.snapshot(),
+        'write_behind': WRITE_BEHIND.stats(),
+        'replica':      replica_status(),
+        'db_pools':     pool_stats(),
+        'live':         HUB.stats(),
+    })
+
+
+def redirect_back(request, fallback):
+    next_url = request.POST.get('next')
+    if next_url and url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect(fallback)
+
+
 @admin_required
 @require_POST
 def admin_delete_user(request, user_id):
-    User.objects.filter(id=user_id).delete()
-    return redirect('admin_dashboard')
+    purge_users(User.objects.filter(id=user_id))
+    return redirect_back(request, 'admin_dashboard')
+
+
+@admin_required
+@require_POST
+def admin_bulk_users(request):
+    action = request.POST.get('action')
+    ids    = []
+    for value in request.POST.getlist('user_ids')[:MAX_PER_PAGE]:
+        try:
+            ids.append(uuid.UUID(value))
+        except ValueError:
+            continue
+    users  = User.objects.filter(id__in=ids, role='trainee')   # admins are never bulk-removed
+    if action == 'delete':
+        removed = purge_users(users)
+        messages.success(request, f"Deleted {removed['ncbw_user']} trainees and {sum(removed.values()) - removed['ncbw_user']} related rows.")
+    elif action == 'deactivate':
+        messages.success(request, f'Deactivated {deactivate_users(users)} trainees.')
+    return redirect_back(request, 'admin_users')
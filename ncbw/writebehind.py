@@ -0,0 +1,175 @@
+import atexit
+import logging
+import threading
+from django.conf import settings
+from django.db import DatabaseError, InterfaceError, OperationalError, close_old_connections, transaction
+from .progress import compact_events, defer_progress, record_progress
+
+
+logger = logging.getLogger(__name__)
+
+
+def write_behind_enabled():
+    return getattr(settings, 'NCBW_WRITE_BEHIND', False)
+
+
+# ── queue ────────────────────────────────────────────────
+# Pending events are grouped per user and track, so a flush turns a burst
+# of clicks into one record_progress per trainee, and a whole flush into one
+# transaction. Users whose events are being written are tracked in
+# _inflight so flush_user can wait for them (read-your-writes).
+
+class WriteBehindQueue:
+    def __init__(self):
+        self._cond     = threading.Condition()
+        self._pending  = {}      # user_id -> {track_id: ([completions], [quiz_scores])}
+        self._inflight = set()
+        self._size     = 0
+        self._started  = False
+        self._thread   = None
+        self._stopping = False
+        self.flushes   = 0
+        self.written   = 0
+
+    def add(self, user_id, track_id, completions=(), quiz_scores=()):
+        batch_size = getattr(settings, 'NCBW_WRITE_BEHIND_BATCH', 500)
+        interval   = getattr(settings, 'NCBW_WRITE_BEHIND_INTERVAL', 0.5)
+        with self._cond:
+            pending = self._pending.setdefault(str(user_id), {}).setdefault(track_id, ([], []))
+            pending[0].extend(completions)
+            pending[1].extend(quiz_scores)
+            self._size += len(completions) + len(quiz_scores)
+            full = self._size >= batch_size
+            if not self._started:
+                self._start(interval, batch_size)
+            elif full:
+                self._cond.notify_all()
+        if full and not interval:
+            self.flush()
+
+    def stats(self):
+        with self._cond:
+            return {'pending': self._size, 'flushes': self.flushes, 'written': self.written}
+
+    # ── flushing ──
+
+    def flush_user(self, user_id):
+        user_id = str(user_id)
+        if user_id not in self._pending and user_id not in self._inflight:
+            return
+        with self._cond:
+            self._cond.wait_for(lambda: user_id not in self._inflight)
+            tracks = self._pending.pop(user_id, None)
+            if not tracks:
+                return
+            self._take({user_id: tracks})
+        self._write({user_id: tracks})
+
+    def flush(self):
+        with self._cond:
+            batch, self._pending = self._pending, {}
+            self._take(batch)
+        if batch:
+            self._write(batch)
+
+    def _take(self, batch):
+        self._size -= sum(len(c) + len(q) for tracks in batch.values() for c, q in tracks.values())
+        self._inflight.update(batch)
+
+    def _write(self, batch):
+        written = {}
+        try:
+            try:
+                # one transaction for the whole flush
+                with transaction.atomic():
+                    for user_id, tracks in batch.items():
+                        for track_id, (completions, quiz_scores) in tracks.items():
+                            record_progress(user_id, track_id, completions, quiz_scores)
+                failed = {}
+            except DatabaseError:
+                # find the bad apples (e.g. a deleted trainee, which only
+                # fails at commit), or requeue everything if the database is down
+                failed = self._write_each(batch)
+            written = {u: t for u, t in batch.items() if u not in failed}
+        finally:
+            with self._cond:
+                self._inflight.difference_update(batch)
+                self.flushes += 1
+                self.written += sum(len(c) + len(q) for tracks in written.values() for c, q in tracks.values())
+                self._cond.notify_all()
+
+    def _write_each(self, batch):
+        failed = {}
+        for user_id, tracks in batch.items():
+            for track_id, (completions, quiz_scores) in tracks.items():
+                try:
+                    record_progress(user_id, track_id, completions, quiz_scores)
+                except (OperationalError, InterfaceError):
+                    logger.exception('Database unavailable; requeueing progress for user %s', user_id)
+                    failed.setdefault(user_id, {})[track_id] = (completions, quiz_scores)
+                except DatabaseError:
+                    logger.exception('Dropping progress for user %s track %s: %r %r',
+                                     user_id, track_id, completions, quiz_scores)
+                    failed.setdefault(user_id, {})
+        with self._cond:
+            for user_id, tracks in failed.items():
+                for track_id, (completions, quiz_scores) in tracks.items():
+                    self._pending.setdefault(user_id, {}).setdefault(track_id, ([], []))
+                    self._pending[user_id][track_id][0][:0] = completions
+                    self._pending[user_id][track_id][1][:0] = quiz_scores
+                    self._size += len(completions) + len(quiz_scores)
+        return failed
+
+    # ── background thread ──
+
+    def _start(self, interval, batch_size):
+        # with no interval there is no thread; flushes happen inline when the
+        # batch fills, on reads and at exit
+        self._started = True
+        atexit.register(self.stop)
+        if interval:
+            self._thread = threading.Thread(
+                target=self._run, args=(interval, batch_size), name='ncbw-write-behind', daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, interval, batch_size):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._stopping or self._size >= batch_size, timeout=interval)
+                stopping = self._stopping
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Write-behind flush failed')
+            if stopping:
+                break
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        else:
+            self.flush()
+
+
+WRITE_BEHIND = WriteBehindQueue()
+
+
+# Returns the updated summary when written straight away, None when queued.
+def submit_progress(user_id, track_id, completions=(), quiz_scores=()):
+    if not write_behind_enabled():
+        return record_progress(user_id, track_id, completions, quiz_scores)
+    WRITE_BEHIND.add(user_id, track_id, completions, quiz_scores)
+    return None
+
+# Call before reading a user's own progress so they see what they just did,
+# as far as this process queued it: the queue isn't shared between processes.
+def flush_pending(user_id):
+    WRITE_BEHIND.flush_user(user_id)
+    if defer_progress():
+        compact_events(user_id=user_id)